@@ -0,0 +1,120 @@
+"""Add tasks.search_vector full-text document with a GIN index
+
+Revision ID: 7c2d9e4f1a08
+Revises: 3b1f0c9a7d21
+Create Date: 2026-10-17 14:05:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c2d9e4f1a08'
+down_revision: Union[str, Sequence[str], None] = '3b1f0c9a7d21'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        # Other backends search with LIKE; keep the column so the model
+        # matches, but nothing writes or reads it, so leave it unindexed
+        op.add_column('tasks', sa.Column('search_vector', sa.Text(), nullable=True))
+        return
+
+    op.add_column('tasks', sa.Column('search_vector', postgresql.TSVECTOR(), nullable=True))
+
+    # Title weighs most, then description, then the task's comments
+    op.execute("""
+        CREATE FUNCTION tasks_search_document(p_task_id integer, p_title text, p_description text)
+        RETURNS tsvector
+        LANGUAGE sql STABLE AS $$
+            SELECT setweight(to_tsvector('english', coalesce(p_title, '')), 'A')
+                || setweight(to_tsvector('english', coalesce(p_description, '')), 'B')
+                || setweight(to_tsvector('english', coalesce(
+                       (SELECT string_agg(content, ' ') FROM comments WHERE task_id = p_task_id), ''
+                   )), 'C')
+        $$
+    """)
+    op.execute("""
+        CREATE FUNCTION tasks_search_vector_update() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            NEW.search_vector := tasks_search_document(NEW.id, NEW.title, NEW.description);
+            RETURN NEW;
+        END
+        $$
+    """)
+    op.execute("""
+        CREATE TRIGGER tasks_search_vector_trigger
+        BEFORE INSERT OR UPDATE OF title, description ON tasks
+        FOR EACH ROW EXECUTE FUNCTION tasks_search_vector_update()
+    """)
+    # Comment writes refresh each affected task once per statement, from the
+    # transition tables, so a chunked DELETE of many comments on one task
+    # rebuilds its document once rather than once per row. Transition tables
+    # rule out column lists and multi-event triggers, hence three triggers
+    # and the changed-content check for updates.
+    op.execute("""
+        CREATE FUNCTION comments_search_vector_update() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                UPDATE tasks SET search_vector = tasks_search_document(id, title, description)
+                WHERE id IN (SELECT task_id FROM new_comments);
+            ELSIF TG_OP = 'DELETE' THEN
+                UPDATE tasks SET search_vector = tasks_search_document(id, title, description)
+                WHERE id IN (SELECT task_id FROM old_comments);
+            ELSE
+                UPDATE tasks SET search_vector = tasks_search_document(id, title, description)
+                WHERE id IN (
+                    SELECT o.task_id FROM old_comments o JOIN new_comments n ON n.id = o.id
+                    WHERE o.content IS DISTINCT FROM n.content OR o.task_id IS DISTINCT FROM n.task_id
+                    UNION
+                    SELECT n.task_id FROM old_comments o JOIN new_comments n ON n.id = o.id
+                    WHERE o.content IS DISTINCT FROM n.content OR o.task_id IS DISTINCT FROM n.task_id
+                );
+            END IF;
+            RETURN NULL;
+        END
+        $$
+    """)
+    op.execute("""
+        CREATE TRIGGER comments_search_vector_insert_trigger
+        AFTER INSERT ON comments REFERENCING NEW TABLE AS new_comments
+        FOR EACH STATEMENT EXECUTE FUNCTION comments_search_vector_update()
+    """)
+    op.execute("""
+        CREATE TRIGGER comments_search_vector_update_trigger
+        AFTER UPDATE ON comments REFERENCING OLD TABLE AS old_comments NEW TABLE AS new_comments
+        FOR EACH STATEMENT EXECUTE FUNCTION comments_search_vector_update()
+    """)
+    op.execute("""
+        CREATE TRIGGER comments_search_vector_delete_trigger
+        AFTER DELETE ON comments REFERENCING OLD TABLE AS old_comments
+        FOR EACH STATEMENT EXECUTE FUNCTION comments_search_vector_update()
+    """)
+
+    op.execute("UPDATE tasks SET search_vector = tasks_search_document(id, title, description)")
+    op.create_index(
+        'ix_tasks_search_vector', 'tasks', ['search_vector'],
+        unique=False, postgresql_using='gin'
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == 'postgresql':
+        op.drop_index('ix_tasks_search_vector', table_name='tasks')
+        for event in ('insert', 'update', 'delete'):
+            op.execute(f"DROP TRIGGER IF EXISTS comments_search_vector_{event}_trigger ON comments")
+        op.execute("DROP TRIGGER IF EXISTS tasks_search_vector_trigger ON tasks")
+        op.execute("DROP FUNCTION IF EXISTS comments_search_vector_update()")
+        op.execute("DROP FUNCTION IF EXISTS tasks_search_vector_update()")
+        op.execute("DROP FUNCTION IF EXISTS tasks_search_document(integer, text, text)")
+    op.drop_column('tasks', 'search_vector')
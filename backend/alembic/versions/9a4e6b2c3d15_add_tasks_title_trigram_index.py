@@ -0,0 +1,39 @@
+"""Add pg_trgm GIN index on tasks.title for typeahead
+
+Revision ID: 9a4e6b2c3d15
+Revises: 7c2d9e4f1a08
+Create Date: 2026-10-17 15:20:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9a4e6b2c3d15'
+down_revision: Union[str, Sequence[str], None] = '7c2d9e4f1a08'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        'ix_tasks_title_trgm', 'tasks', ['title'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'title': 'gin_trgm_ops'}
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    # pg_trgm is left installed; other objects may depend on it
+    op.drop_index('ix_tasks_title_trgm', table_name='tasks')
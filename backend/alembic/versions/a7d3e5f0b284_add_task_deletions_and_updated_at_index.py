@@ -0,0 +1,43 @@
+"""Add task_deletions tombstone log and tasks.updated_at index for delta syncs
+
+Revision ID: a7d3e5f0b284
+Revises: f4c2a8d6b913
+Create Date: 2026-10-17 22:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7d3e5f0b284'
+down_revision: Union[str, Sequence[str], None] = 'f4c2a8d6b913'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'task_deletions',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('task_id', sa.Integer(), nullable=False),
+        sa.Column('assigned_to', sa.Integer(), nullable=True),
+        sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(
+        'ix_task_deletions_assigned_to_deleted_at', 'task_deletions', ['assigned_to', 'deleted_at'], unique=False
+    )
+    op.create_index('ix_task_deletions_deleted_at', 'task_deletions', ['deleted_at'], unique=False)
+    op.create_index('ix_tasks_updated_at', 'tasks', ['updated_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_tasks_updated_at', table_name='tasks')
+    op.drop_index('ix_task_deletions_deleted_at', table_name='task_deletions')
+    op.drop_index('ix_task_deletions_assigned_to_deleted_at', table_name='task_deletions')
+    op.drop_table('task_deletions')
@@ -0,0 +1,82 @@
+"""Add ON DELETE actions to the comments and tasks foreign keys
+
+Comments are deleted with their task or author (CASCADE); tasks outlive
+their users, so created_by (now nullable) and assigned_to are cleared
+(SET NULL).
+
+Revision ID: b3e8c1f5d492
+Revises: a7d3e5f0b284
+Create Date: 2026-10-17 23:40:00.000000
+
+"""
+from typing import Optional, Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3e8c1f5d492'
+down_revision: Union[str, Sequence[str], None] = 'a7d3e5f0b284'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# The constraints were created unnamed; these are PostgreSQL's default
+# names, and on SQLite (batch mode) the reflected constraints get them
+NAMING_CONVENTION = {"fk": "%(table_name)s_%(column_0_name)s_fkey"}
+
+# (table, column, referred table, ON DELETE action)
+FOREIGN_KEYS = [
+    ('comments', 'task_id', 'tasks', 'CASCADE'),
+    ('comments', 'user_id', 'users', 'CASCADE'),
+    ('tasks', 'created_by', 'users', 'SET NULL'),
+    ('tasks', 'assigned_to', 'users', 'SET NULL'),
+]
+
+
+PRIORITY_RANK = "CASE priority WHEN 'HIGH' THEN 3 WHEN 'MEDIUM' THEN 2 WHEN 'LOW' THEN 1 END"
+
+
+def replace_foreign_keys(table: str, with_actions: bool, nullable_creator: Optional[bool] = None) -> None:
+    # SQLite recreates the table and cannot copy a generated column into
+    # the new one: drop priority_rank (and its index) and add it back after
+    copy_generated = table == 'tasks' and op.get_bind().dialect.name == 'sqlite'
+    if copy_generated:
+        op.drop_index('ix_tasks_assigned_to_priority_rank', table_name='tasks')
+    
+    with op.batch_alter_table(table, naming_convention=NAMING_CONVENTION) as batch_op:
+        if copy_generated:
+            batch_op.drop_column('priority_rank')
+        if nullable_creator is not None:
+            batch_op.alter_column('created_by', existing_type=sa.Integer(), nullable=nullable_creator)
+        for fk_table, column, referred, ondelete in FOREIGN_KEYS:
+            if fk_table != table:
+                continue
+            name = f'{table}_{column}_fkey'
+            batch_op.drop_constraint(name, type_='foreignkey')
+            batch_op.create_foreign_key(
+                name, referred, [column], ['id'], ondelete=ondelete if with_actions else None
+            )
+    
+    if copy_generated:
+        op.add_column(
+            'tasks', sa.Column('priority_rank', sa.SmallInteger(), sa.Computed(PRIORITY_RANK), nullable=False)
+        )
+        op.create_index(
+            'ix_tasks_assigned_to_priority_rank', 'tasks', ['assigned_to', 'priority_rank', 'id'], unique=False
+        )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    replace_foreign_keys('comments', with_actions=True)
+    replace_foreign_keys('tasks', with_actions=True, nullable_creator=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Tasks of deleted users have no creator to restore
+    op.execute("DELETE FROM comments WHERE task_id IN (SELECT id FROM tasks WHERE created_by IS NULL)")
+    op.execute("DELETE FROM tasks WHERE created_by IS NULL")
+    replace_foreign_keys('tasks', with_actions=False, nullable_creator=False)
+    replace_foreign_keys('comments', with_actions=False)
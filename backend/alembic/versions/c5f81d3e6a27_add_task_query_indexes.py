@@ -0,0 +1,51 @@
+"""Add composite and partial indexes for task list, count and statistics queries
+
+Revision ID: c5f81d3e6a27
+Revises: 9a4e6b2c3d15
+Create Date: 2026-10-17 16:40:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5f81d3e6a27'
+down_revision: Union[str, Sequence[str], None] = '9a4e6b2c3d15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_tasks_assigned_to_created_at', 'tasks', ['assigned_to', 'created_at', 'id'], unique=False)
+    op.create_index('ix_tasks_created_at', 'tasks', ['created_at', 'id'], unique=False)
+    op.create_index('ix_tasks_created_by', 'tasks', ['created_by'], unique=False)
+    op.create_index(
+        'ix_tasks_pending_assigned_to_created_at', 'tasks', ['assigned_to', 'created_at', 'id'],
+        unique=False,
+        postgresql_where=sa.text('completed IS false'),
+        sqlite_where=sa.text('completed IS 0')
+    )
+    op.create_index(
+        'ix_tasks_pending_assigned_to_due_date', 'tasks', ['assigned_to', 'due_date'],
+        unique=False,
+        postgresql_where=sa.text('completed IS false'),
+        sqlite_where=sa.text('completed IS 0')
+    )
+    # The composite index also serves lookups by task_id alone
+    op.create_index('ix_comments_task_id_created_at', 'comments', ['task_id', 'created_at'], unique=False)
+    op.drop_index(op.f('ix_comments_task_id'), table_name='comments')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(op.f('ix_comments_task_id'), 'comments', ['task_id'], unique=False)
+    op.drop_index('ix_comments_task_id_created_at', table_name='comments')
+    op.drop_index('ix_tasks_pending_assigned_to_due_date', table_name='tasks')
+    op.drop_index('ix_tasks_pending_assigned_to_created_at', table_name='tasks')
+    op.drop_index('ix_tasks_created_by', table_name='tasks')
+    op.drop_index('ix_tasks_created_at', table_name='tasks')
+    op.drop_index('ix_tasks_assigned_to_created_at', table_name='tasks')
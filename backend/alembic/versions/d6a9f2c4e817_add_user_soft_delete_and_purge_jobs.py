@@ -0,0 +1,142 @@
+"""Add users.deleted_at, purge_jobs and comments.user_id index for background user purges
+
+Revision ID: d6a9f2c4e817
+Revises: b3e8c1f5d492
+Create Date: 2026-10-18 01:15:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd6a9f2c4e817'
+down_revision: Union[str, Sequence[str], None] = 'b3e8c1f5d492'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Search documents built by 7c2d9e4f1a08 leave out comments of deleted
+# users from here on. Deleting such comments (the purge) then changes no
+# document, so comment DELETEs skip refreshing their tasks.
+SEARCH_DOCUMENT = """
+    CREATE OR REPLACE FUNCTION tasks_search_document(p_task_id integer, p_title text, p_description text)
+    RETURNS tsvector
+    LANGUAGE sql STABLE AS $$
+        SELECT setweight(to_tsvector('english', coalesce(p_title, '')), 'A')
+            || setweight(to_tsvector('english', coalesce(p_description, '')), 'B')
+            || setweight(to_tsvector('english', coalesce(
+                   (SELECT string_agg(c.content, ' ')
+                    FROM comments c JOIN users u ON u.id = c.user_id
+                    WHERE c.task_id = p_task_id AND u.deleted_at IS NULL), ''
+               )), 'C')
+    $$
+"""
+PREVIOUS_SEARCH_DOCUMENT = """
+    CREATE OR REPLACE FUNCTION tasks_search_document(p_task_id integer, p_title text, p_description text)
+    RETURNS tsvector
+    LANGUAGE sql STABLE AS $$
+        SELECT setweight(to_tsvector('english', coalesce(p_title, '')), 'A')
+            || setweight(to_tsvector('english', coalesce(p_description, '')), 'B')
+            || setweight(to_tsvector('english', coalesce(
+                   (SELECT string_agg(content, ' ') FROM comments WHERE task_id = p_task_id), ''
+               )), 'C')
+    $$
+"""
+COMMENTS_SEARCH_VECTOR_UPDATE = """
+    CREATE OR REPLACE FUNCTION comments_search_vector_update() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        IF TG_OP = 'INSERT' THEN
+            UPDATE tasks SET search_vector = tasks_search_document(id, title, description)
+            WHERE id IN (SELECT task_id FROM new_comments);
+        ELSIF TG_OP = 'DELETE' THEN
+            UPDATE tasks SET search_vector = tasks_search_document(id, title, description)
+            WHERE id IN ({deleted_task_ids});
+        ELSE
+            UPDATE tasks SET search_vector = tasks_search_document(id, title, description)
+            WHERE id IN (
+                SELECT o.task_id FROM old_comments o JOIN new_comments n ON n.id = o.id
+                WHERE o.content IS DISTINCT FROM n.content OR o.task_id IS DISTINCT FROM n.task_id
+                UNION
+                SELECT n.task_id FROM old_comments o JOIN new_comments n ON n.id = o.id
+                WHERE o.content IS DISTINCT FROM n.content OR o.task_id IS DISTINCT FROM n.task_id
+            );
+        END IF;
+        RETURN NULL;
+    END
+    $$
+"""
+DELETED_LIVE_COMMENT_TASK_IDS = (
+    "SELECT o.task_id FROM old_comments o WHERE NOT EXISTS "
+    "(SELECT 1 FROM users u WHERE u.id = o.user_id AND u.deleted_at IS NOT NULL)"
+)
+DELETED_COMMENT_TASK_IDS = "SELECT task_id FROM old_comments"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('users', sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True))
+    op.create_index('ix_comments_user_id', 'comments', ['user_id'], unique=False)
+    op.create_table(
+        'purge_jobs',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('requested_by', sa.Integer(), nullable=True),
+        sa.Column(
+            'status',
+            sa.Enum('PENDING', 'RUNNING', 'DONE', 'FAILED', name='purgejobstatus'),
+            nullable=False
+        ),
+        sa.Column('comments_deleted', sa.Integer(), nullable=False),
+        sa.Column('tasks_released', sa.Integer(), nullable=False),
+        sa.Column('attempts', sa.Integer(), nullable=False),
+        sa.Column('retry_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_purge_jobs_status', 'purge_jobs', ['status'], unique=False)
+
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute(SEARCH_DOCUMENT)
+        op.execute(COMMENTS_SEARCH_VECTOR_UPDATE.format(deleted_task_ids=DELETED_LIVE_COMMENT_TASK_IDS))
+        # Deleting a user drops their comments from the tasks' documents at
+        # once, as reads hide them, rather than when the purge runs
+        op.execute("""
+            CREATE FUNCTION users_search_vector_update() RETURNS trigger
+            LANGUAGE plpgsql AS $$
+            BEGIN
+                UPDATE tasks SET search_vector = tasks_search_document(id, title, description)
+                WHERE id IN (SELECT task_id FROM comments WHERE user_id = NEW.id);
+                RETURN NULL;
+            END
+            $$
+        """)
+        op.execute("""
+            CREATE TRIGGER users_search_vector_trigger
+            AFTER UPDATE OF deleted_at ON users
+            FOR EACH ROW WHEN (OLD.deleted_at IS DISTINCT FROM NEW.deleted_at)
+            EXECUTE FUNCTION users_search_vector_update()
+        """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute("DROP TRIGGER IF EXISTS users_search_vector_trigger ON users")
+        op.execute("DROP FUNCTION IF EXISTS users_search_vector_update()")
+        op.execute(COMMENTS_SEARCH_VECTOR_UPDATE.format(deleted_task_ids=DELETED_COMMENT_TASK_IDS))
+        op.execute(PREVIOUS_SEARCH_DOCUMENT)
+    op.drop_index('ix_purge_jobs_status', table_name='purge_jobs')
+    op.drop_table('purge_jobs')
+    sa.Enum(name='purgejobstatus').drop(op.get_bind(), checkfirst=True)
+    op.drop_index('ix_comments_user_id', table_name='comments')
+    # Users still waiting for their purge are removed with their comments
+    op.execute("DELETE FROM users WHERE deleted_at IS NOT NULL")
+    with op.batch_alter_table('users') as batch_op:
+        batch_op.drop_column('deleted_at')
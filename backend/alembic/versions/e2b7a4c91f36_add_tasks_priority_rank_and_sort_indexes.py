@@ -0,0 +1,45 @@
+"""Add tasks.priority_rank and an index per sortable task field
+
+Revision ID: e2b7a4c91f36
+Revises: c5f81d3e6a27
+Create Date: 2026-10-17 18:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2b7a4c91f36'
+down_revision: Union[str, Sequence[str], None] = 'c5f81d3e6a27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Generated column: STORED on PostgreSQL, VIRTUAL on SQLite
+    op.add_column(
+        'tasks',
+        sa.Column(
+            'priority_rank',
+            sa.SmallInteger(),
+            sa.Computed("CASE priority WHEN 'HIGH' THEN 3 WHEN 'MEDIUM' THEN 2 WHEN 'LOW' THEN 1 END"),
+            nullable=False
+        )
+    )
+    op.create_index('ix_tasks_assigned_to_updated_at', 'tasks', ['assigned_to', 'updated_at', 'id'], unique=False)
+    op.create_index('ix_tasks_assigned_to_due_date', 'tasks', ['assigned_to', 'due_date', 'id'], unique=False)
+    op.create_index('ix_tasks_assigned_to_priority_rank', 'tasks', ['assigned_to', 'priority_rank', 'id'], unique=False)
+    op.create_index('ix_tasks_assigned_to_title', 'tasks', ['assigned_to', 'title', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_tasks_assigned_to_title', table_name='tasks')
+    op.drop_index('ix_tasks_assigned_to_priority_rank', table_name='tasks')
+    op.drop_index('ix_tasks_assigned_to_due_date', table_name='tasks')
+    op.drop_index('ix_tasks_assigned_to_updated_at', table_name='tasks')
+    op.drop_column('tasks', 'priority_rank')
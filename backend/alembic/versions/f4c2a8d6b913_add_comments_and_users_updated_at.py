@@ -0,0 +1,38 @@
+"""Add comments.updated_at and users.updated_at row versions
+
+Revision ID: f4c2a8d6b913
+Revises: e2b7a4c91f36
+Create Date: 2026-10-17 20:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f4c2a8d6b913'
+down_revision: Union[str, Sequence[str], None] = 'e2b7a4c91f36'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Added nullable and backfilled first: SQLite cannot add a NOT NULL
+    # column with a non-constant default
+    op.add_column('comments', sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True))
+    op.add_column('users', sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True))
+    op.execute("UPDATE comments SET updated_at = created_at")
+    op.execute("UPDATE users SET updated_at = CURRENT_TIMESTAMP")
+    with op.batch_alter_table('comments') as batch_op:
+        batch_op.alter_column('updated_at', existing_type=sa.DateTime(timezone=True), nullable=False)
+    with op.batch_alter_table('users') as batch_op:
+        batch_op.alter_column('updated_at', existing_type=sa.DateTime(timezone=True), nullable=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('users', 'updated_at')
+    op.drop_column('comments', 'updated_at')
@@ -3,12 +3,23 @@ API v1 router aggregation.
 """
 from fastapi import APIRouter
 
-from app.api.v1 import auth, tasks, comments, users
+from app.config import settings
+from app.api.v1 import auth, tasks, comments, users, jobs, metrics
+from app.api.v1 import tasks_async, comments_async
 
 api_router = APIRouter()
 
+# Async routes are matched first; anything they don't cover falls through
+# to the sync routers below. They share the sync routes' contract, so only
+# the sync ones are documented.
+if settings.database_async:
+    api_router.include_router(tasks_async.router, prefix="/tasks", include_in_schema=False)
+    api_router.include_router(comments_async.router, include_in_schema=False)
+
 # Include all routers
 api_router.include_router(auth.router, prefix="/auth", tags=["Authentication"])
 api_router.include_router(tasks.router, prefix="/tasks", tags=["Tasks"])
 api_router.include_router(comments.router, tags=["Comments"])
 api_router.include_router(users.router, prefix="/users", tags=["Users"])
+api_router.include_router(jobs.router, prefix="/jobs", tags=["Jobs"])
+api_router.include_router(metrics.router, prefix="/metrics", tags=["Metrics"])
@@ -5,12 +5,13 @@ from datetime import timedelta
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
 from app.db.session import get_db
 from app.dependencies import get_current_user
-from app.core.security import create_access_token
+from app.core.security import create_access_token, build_token_claims, aget_password_hash, averify_password
 from app.core.exceptions import BadRequestException
-from app.crud.user import create_user, authenticate_user, get_user_by_email
+from app.crud.user import get_user_by_email, insert_user
 from app.schemas.user import UserCreate, UserOut, Token
 from app.models.user import User
 from app.config import settings
@@ -19,13 +20,16 @@ router = APIRouter()
 
 
 @router.post("/register", response_model=UserOut, status_code=status.HTTP_201_CREATED)
-def register(
+async def register(
     user: UserCreate,
     db: Session = Depends(get_db)
 ):
     """
     Register a new user.
     
+    Async so that no request thread is held while bcrypt is queued in
+    the password pool; only the INSERT runs in the thread pool.
+    
     Args:
         user: User registration data
         db: Database session
@@ -36,24 +40,25 @@ def register(
     Raises:
         BadRequestException: If email already registered
     """
-    # Check if user already exists
-    db_user = get_user_by_email(db, email=user.email)
-    if db_user:
+    hashed_password = await aget_password_hash(user.password)
+    # A taken email fails the INSERT (unique index), without a lookup first
+    new_user = await run_in_threadpool(insert_user, db, user, hashed_password)
+    if new_user is None:
         raise BadRequestException(detail="Email already registered")
-    
-    # Create new user
-    new_user = create_user(db, user)
     return new_user
 
 
 @router.post("/login", response_model=Token)
-def login(
+async def login(
     form_data: OAuth2PasswordRequestForm = Depends(),
     db: Session = Depends(get_db)
 ):
     """
     Login with email and password to get JWT token.
     
+    Async so that no request thread is held while bcrypt is queued in
+    the password pool; only the user lookup runs in the thread pool.
+    
     Args:
         form_data: OAuth2 form with username (email) and password
         db: Database session
@@ -64,9 +69,14 @@ def login(
     Raises:
         HTTPException: If credentials are invalid
     """
-    # Authenticate user (username is email in OAuth2PasswordRequestForm)
-    user = authenticate_user(db, email=form_data.username, password=form_data.password)
-    if not user:
+    # Authenticate user (username is email in OAuth2PasswordRequestForm),
+    # as app.crud.user.authenticate_user does
+    user = await run_in_threadpool(get_user_by_email, db, form_data.username)
+    if (
+        user is None
+        or not await averify_password(form_data.password, user.hashed_password)
+        or not user.is_active
+    ):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -76,7 +86,7 @@ def login(
     # Create access token
     access_token_expires = timedelta(days=1)
     access_token = create_access_token(
-        data={"sub": user.email},
+        data=build_token_claims(user),
         expires_delta=access_token_expires
     )
     
@@ -1,28 +1,61 @@
 """
 Comment endpoints for tasks.
 """
-from fastapi import APIRouter, Depends, status, Query
+from typing import Optional, List
+from fastapi import APIRouter, Depends, Request, Response, status, Query
 from sqlalchemy.orm import Session
 
 from app.db.session import get_db
-from app.dependencies import get_current_user
-from app.models.user import User
+from app.dependencies import get_current_principal, sparse_fields
+from app.schemas.user import TokenData
 from app.crud import comment as crud_comment
 from app.crud import task as crud_task
-from app.crud.user import is_admin
+from app.crud.user import get_principal_by_email, is_admin
+from app.models.comment import Comment
+from app.models.task import Task
 from app.schemas.comment import CommentCreate, CommentUpdate, CommentOut
 from app.schemas.common import MessageResponse, PaginatedResponse
 from app.core.exceptions import NotFoundException, ForbiddenException
+from app.utils.etag import check_etag, etag_headers, request_etag
+from app.utils.fieldsets import sparse_page
 
 router = APIRouter()
 
 
+def comment_write_error(
+    comment: Optional[Comment],
+    task: Optional[Task],
+    task_id: int,
+    user_id: int,
+    action: str
+) -> Exception:
+    """
+    Explain why a comment write guarded by the permission checks matched nothing.
+    
+    Args:
+        comment: The comment as it exists after the write, or None
+        task: The task of the request path, or None
+        task_id: Task ID of the request path
+        user_id: Current user ID
+        action: "update" or "delete", for the error message
+        
+    Returns:
+        NotFoundException for a missing comment or a task not assigned to
+        the user, else ForbiddenException (the user is not the author)
+    """
+    if comment is None or comment.task_id != task_id:
+        return NotFoundException(resource="Comment")
+    if task is None or task.assigned_to != user_id:
+        return NotFoundException(resource="Task")
+    return ForbiddenException(detail=f"You don't have permission to {action} this comment")
+
+
 @router.post("/tasks/{task_id}/comments", response_model=CommentOut, status_code=status.HTTP_201_CREATED)
 def create_comment(
     task_id: int,
     comment: CommentCreate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: TokenData = Depends(get_current_principal)
 ):
     """
     Add a comment to a task (only if task is assigned to current user).
@@ -31,7 +64,7 @@ def create_comment(
         task_id: Task ID
         comment: Comment creation data
         db: Database session
-        current_user: Current authenticated user
+        current_user: Current authenticated principal
         
     Returns:
         Created comment information
@@ -39,44 +72,47 @@ def create_comment(
     Raises:
         NotFoundException: If task not found or not assigned to user
     """
-    # Check if task exists and is assigned to current user
-    task = crud_task.get_task(db, task_id)
-    if not task:
-        raise NotFoundException(resource="Task")
-    
-    if task.assigned_to != current_user.id:
-        raise NotFoundException(resource="Task")
-    
-    # Create comment
+    # The task must exist and be assigned to the current user: checked by
+    # the INSERT. The author shown in the response is usually cached.
     new_comment = crud_comment.create_comment(
         db,
         comment,
         task_id=task_id,
-        user_id=current_user.id
+        user_id=current_user.id,
+        assigned_only=True,
+        author=get_principal_by_email(db, current_user.email)
     )
+    if new_comment is None:
+        raise NotFoundException(resource="Task")
     return new_comment
 
 
 @router.get("/tasks/{task_id}/comments", response_model=PaginatedResponse[CommentOut])
 def get_task_comments(
     task_id: int,
+    request: Request,
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
+    fields: Optional[List[str]] = Depends(sparse_fields(CommentOut)),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: TokenData = Depends(get_current_principal)
 ):
     """
     Get all comments for a specific task (only if task is assigned to current user).
     
     Args:
         task_id: Task ID
+        request: Incoming request
+        response: Response receiving the ETag
         skip: Number of records to skip
         limit: Maximum number of records to return
+        fields: Optional sparse fieldset ("user" adds the author join)
         db: Database session
-        current_user: Current authenticated user
+        current_user: Current authenticated principal
         
     Returns:
-        Paginated list of comments
+        Paginated list of comments, or 304 Not Modified
         
     Raises:
         NotFoundException: If task not found or not assigned to user
@@ -89,15 +125,25 @@ def get_task_comments(
     if task.assigned_to != current_user.id:
         raise NotFoundException(resource="Task")
     
+    etag = request_etag(request, current_user, *crud_comment.get_task_comments_version(db, task_id))
+    not_modified = check_etag(request, response, etag)
+    if not_modified is not None:
+        return not_modified
+    
     # Get comments
-    comments, total = crud_comment.get_task_comments(db, task_id, skip=skip, limit=limit)
+    comments, total = crud_comment.get_task_comments(
+        db, task_id, skip=skip, limit=limit, columns=fields
+    )
     
-    return PaginatedResponse.create(
+    page = PaginatedResponse.create(
         items=comments,
         total=total,
         skip=skip,
         limit=limit
     )
+    if fields is not None:
+        return sparse_page(page, CommentOut, fields, headers=etag_headers(etag))
+    return page
 
 
 @router.put("/tasks/{task_id}/comments/{comment_id}", response_model=CommentOut)
@@ -106,7 +152,7 @@ def update_comment(
     comment_id: int,
     comment_update: CommentUpdate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: TokenData = Depends(get_current_principal)
 ):
     """
     Update a comment (only if task is assigned to current user and user is comment author).
@@ -116,7 +162,7 @@ def update_comment(
         comment_id: Comment ID
         comment_update: Comment update data
         db: Database session
-        current_user: Current authenticated user
+        current_user: Current authenticated principal
         
     Returns:
         Updated comment
@@ -125,26 +171,17 @@ def update_comment(
         NotFoundException: If comment not found or task not assigned to user
         ForbiddenException: If user doesn't have permission
     """
-    # Get comment
-    comment = crud_comment.get_comment(db, comment_id)
-    if not comment:
-        raise NotFoundException(resource="Comment")
-    
-    # Verify comment belongs to this task
-    if comment.task_id != task_id:
-        raise NotFoundException(resource="Comment")
-    
-    # Check if task is assigned to current user
-    task = crud_task.get_task(db, task_id)
-    if not task or task.assigned_to != current_user.id:
-        raise NotFoundException(resource="Task")
-    
-    # Check permissions (only comment author can update)
-    if comment.user_id != current_user.id:
-        raise ForbiddenException(detail="You don't have permission to update this comment")
-    
-    # Update comment
-    updated_comment = crud_comment.update_comment(db, comment_id, comment_update)
+    # Only the author can update, and only while the task is assigned to
+    # them. The UPDATE checks both; the rows are read only to pick the error
+    updated_comment = crud_comment.update_comment(
+        db, comment_id, comment_update, task_id=task_id, user_id=current_user.id,
+        author=get_principal_by_email(db, current_user.email)
+    )
+    if updated_comment is None:
+        raise comment_write_error(
+            crud_comment.get_comment(db, comment_id), crud_task.get_task(db, task_id),
+            task_id, current_user.id, "update"
+        )
     return updated_comment
 
 
@@ -153,7 +190,7 @@ def delete_comment(
     task_id: int,
     comment_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: TokenData = Depends(get_current_principal)
 ):
     """
     Delete a comment (only if task is assigned to current user and user is comment author).
@@ -162,7 +199,7 @@ def delete_comment(
         task_id: Task ID
         comment_id: Comment ID
         db: Database session
-        current_user: Current authenticated user
+        current_user: Current authenticated principal
         
     Returns:
         Success message
@@ -171,24 +208,10 @@ def delete_comment(
         NotFoundException: If comment not found or task not assigned to user
         ForbiddenException: If user doesn't have permission
     """
-    # Get comment
-    comment = crud_comment.get_comment(db, comment_id)
-    if not comment:
-        raise NotFoundException(resource="Comment")
-    
-    # Verify comment belongs to this task
-    if comment.task_id != task_id:
-        raise NotFoundException(resource="Comment")
-    
-    # Check if task is assigned to current user
-    task = crud_task.get_task(db, task_id)
-    if not task or task.assigned_to != current_user.id:
-        raise NotFoundException(resource="Task")
-    
-    # Check permissions (only comment author can delete)
-    if comment.user_id != current_user.id:
-        raise ForbiddenException(detail="You don't have permission to delete this comment")
-    
-    # Delete comment
-    crud_comment.delete_comment(db, comment_id)
+    # Same checks as update_comment, in the DELETE
+    if not crud_comment.delete_comment(db, comment_id, task_id=task_id, user_id=current_user.id):
+        raise comment_write_error(
+            crud_comment.get_comment(db, comment_id), crud_task.get_task(db, task_id),
+            task_id, current_user.id, "delete"
+        )
     return MessageResponse(message="Comment deleted successfully")
@@ -0,0 +1,142 @@
+"""
+Comment endpoints on the async database path.
+
+Mounted ahead of app.api.v1.comments when settings.database_async is enabled.
+"""
+from typing import Optional, List
+from fastapi import APIRouter, Depends, Request, Response, status, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.session import get_async_db
+from app.dependencies import get_current_principal, sparse_fields
+from app.schemas.user import TokenData
+from app.crud.aio import comment as crud_comment
+from app.crud.aio import task as crud_task
+from app.schemas.comment import CommentCreate, CommentUpdate, CommentOut
+from app.schemas.common import MessageResponse, PaginatedResponse
+from app.api.v1.comments import comment_write_error
+from app.core.exceptions import NotFoundException
+from app.utils.etag import check_etag, etag_headers, request_etag
+from app.utils.fieldsets import sparse_page
+
+router = APIRouter()
+
+
+async def _get_assigned_task(db: AsyncSession, task_id: int, user_id: int):
+    """Load a task, raising 404 unless it is assigned to the given user."""
+    task = await crud_task.get_task(db, task_id)
+    if not task or task.assigned_to != user_id:
+        raise NotFoundException(resource="Task")
+    return task
+
+
+@router.post("/tasks/{task_id:int}/comments", response_model=CommentOut, status_code=status.HTTP_201_CREATED)
+async def create_comment(
+    task_id: int,
+    comment: CommentCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: TokenData = Depends(get_current_principal)
+):
+    """
+    Add a comment to a task (only if task is assigned to current user).
+    
+    Raises:
+        NotFoundException: If task not found or not assigned to user
+    """
+    new_comment = await crud_comment.create_comment(
+        db,
+        comment,
+        task_id=task_id,
+        user_id=current_user.id,
+        assigned_only=True
+    )
+    if new_comment is None:
+        raise NotFoundException(resource="Task")
+    return new_comment
+
+
+@router.get("/tasks/{task_id:int}/comments", response_model=PaginatedResponse[CommentOut])
+async def get_task_comments(
+    task_id: int,
+    request: Request,
+    response: Response,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=100),
+    fields: Optional[List[str]] = Depends(sparse_fields(CommentOut)),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: TokenData = Depends(get_current_principal)
+):
+    """
+    Get all comments for a specific task (only if task is assigned to current user).
+    
+    Raises:
+        NotFoundException: If task not found or not assigned to user
+    """
+    await _get_assigned_task(db, task_id, current_user.id)
+    
+    etag = request_etag(request, current_user, *await crud_comment.get_task_comments_version(db, task_id))
+    not_modified = check_etag(request, response, etag)
+    if not_modified is not None:
+        return not_modified
+    
+    comments, total = await crud_comment.get_task_comments(
+        db, task_id, skip=skip, limit=limit, columns=fields
+    )
+    
+    page = PaginatedResponse.create(
+        items=comments,
+        total=total,
+        skip=skip,
+        limit=limit
+    )
+    if fields is not None:
+        return sparse_page(page, CommentOut, fields, headers=etag_headers(etag))
+    return page
+
+
+@router.put("/tasks/{task_id:int}/comments/{comment_id:int}", response_model=CommentOut)
+async def update_comment(
+    task_id: int,
+    comment_id: int,
+    comment_update: CommentUpdate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: TokenData = Depends(get_current_principal)
+):
+    """
+    Update a comment (only if task is assigned to current user and user is comment author).
+    
+    Raises:
+        NotFoundException: If comment not found or task not assigned to user
+        ForbiddenException: If user doesn't have permission
+    """
+    updated_comment = await crud_comment.update_comment(
+        db, comment_id, comment_update, task_id=task_id, user_id=current_user.id
+    )
+    if updated_comment is None:
+        raise comment_write_error(
+            await crud_comment.get_comment(db, comment_id), await crud_task.get_task(db, task_id),
+            task_id, current_user.id, "update"
+        )
+    return updated_comment
+
+
+@router.delete("/tasks/{task_id:int}/comments/{comment_id:int}", response_model=MessageResponse)
+async def delete_comment(
+    task_id: int,
+    comment_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: TokenData = Depends(get_current_principal)
+):
+    """
+    Delete a comment (only if task is assigned to current user and user is comment author).
+    
+    Raises:
+        NotFoundException: If comment not found or task not assigned to user
+        ForbiddenException: If user doesn't have permission
+    """
+    if not await crud_comment.delete_comment(db, comment_id, task_id=task_id, user_id=current_user.id):
+        raise comment_write_error(
+            await crud_comment.get_comment(db, comment_id), await crud_task.get_task(db, task_id),
+            task_id, current_user.id, "delete"
+        )
+    return MessageResponse(message="Comment deleted successfully")
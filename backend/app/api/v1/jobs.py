@@ -0,0 +1,45 @@
+"""
+Background job endpoints.
+"""
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+
+from app.db.session import get_db
+from app.dependencies import get_current_principal
+from app.schemas.purge_job import PurgeJobOut
+from app.schemas.user import TokenData
+from app.core.exceptions import NotFoundException, ForbiddenException
+from app.crud.user import get_purge_job, is_admin
+
+router = APIRouter()
+
+
+@router.get("/{job_id}", response_model=PurgeJobOut)
+def get_job(
+    job_id: int,
+    db: Session = Depends(get_db),
+    current_user: TokenData = Depends(get_current_principal)
+):
+    """
+    Get the status of a purge job started by DELETE /users/{id}.
+    
+    Only admins and the principal who requested the deletion may read it.
+    
+    Args:
+        job_id: Purge job ID
+        db: Database session
+        current_user: Current authenticated principal
+        
+    Returns:
+        Purge job status and progress
+        
+    Raises:
+        NotFoundException: If job not found
+        ForbiddenException: If the job was requested by someone else
+    """
+    job = get_purge_job(db, job_id)
+    if job is None:
+        raise NotFoundException(resource="Job")
+    if not is_admin(current_user) and job.requested_by != current_user.id:
+        raise ForbiddenException(detail="You don't have permission to view this job")
+    return job
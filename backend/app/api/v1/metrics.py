@@ -0,0 +1,40 @@
+"""
+Runtime metrics endpoints.
+"""
+from typing import Any, Dict
+from fastapi import APIRouter, Depends
+
+from app.dependencies import get_current_active_admin
+from app.schemas.user import TokenData
+from app.core.cache import principal_cache, token_cache, token_version_cache
+from app.core.password_pool import password_pool
+from app.core.purge import purge_worker
+from app.core.response_cache import response_cache
+from app.db.session import replicas, get_pool_stats
+
+router = APIRouter()
+
+
+@router.get("/", response_model=Dict[str, Any])
+def get_metrics(
+    current_user: TokenData = Depends(get_current_active_admin)
+):
+    """
+    Get in-process runtime counters (admin only).
+    
+    Args:
+        current_user: Current authenticated admin principal
+        
+    Returns:
+        Counters grouped by subsystem
+    """
+    return {
+        "principal_cache": principal_cache.stats(),
+        "token_cache": token_cache.stats(),
+        "token_version_cache": token_version_cache.stats(),
+        "response_cache": response_cache.stats(),
+        "password_pool": password_pool.stats(),
+        "purge_worker": purge_worker.stats(),
+        "replicas": replicas.stats(),
+        "database_pool": get_pool_stats(),
+    }
@@ -1,29 +1,217 @@
 """
 Task management endpoints.
 """
-from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from datetime import datetime, timedelta, timezone
+from typing import Optional, List, Tuple, Any
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, Query
+from fastapi.responses import JSONResponse, StreamingResponse
 from sqlalchemy.orm import Session
 
+from app.config import settings
 from app.db.session import get_db
-from app.dependencies import get_current_user
-from app.models.user import User
+from app.dependencies import get_current_principal, sparse_fields
+from app.models.task import Task
+from app.models.user import UserRole
+from app.schemas.user import TokenData
 from app.crud import task as crud_task
 from app.schemas.task import (
     TaskCreate, TaskUpdate, TaskOut, TaskWithDetails,
-    TaskFilter, TaskStatistics
+    TaskFilter, TaskSortField, TaskStatistics, TaskSuggestion, TaskChanges,
+    TaskBulkCreate, TaskBulkCreated, TaskBulkSelection, TaskBulkUpdate, TaskBulkResult
 )
 from app.schemas.common import PaginatedResponse, MessageResponse
-from app.core.exceptions import NotFoundException, ForbiddenException
+from app.core.exceptions import NotFoundException, ForbiddenException, BadRequestException
+from app.core.response_cache import ALL_TASKS, CachedResponse, response_cache
+from app.utils.etag import check_etag, etag_headers, request_etag
+from app.utils.export import EXPORT_MEDIA_TYPES, csv_chunks, ndjson_chunks
+from app.utils.fieldsets import dump_fields, sparse_page
 
 router = APIRouter()
 
 
+def build_task_filter(
+    current_user: TokenData,
+    completed: Optional[bool] = None,
+    priority: Optional[str] = None,
+    assigned_to: Optional[int] = None,
+    search: Optional[str] = None
+) -> TaskFilter:
+    """
+    Build the task filter for a list request, scoped by the user's role.
+    
+    Args:
+        current_user: Current authenticated principal
+        completed: Filter by completion status
+        priority: Filter by priority
+        assigned_to: Requested assignee filter (honored for admins only)
+        search: Search term for title, description and comments
+        
+    Returns:
+        TaskFilter for the crud layer
+    """
+    # Determine assigned_to filter based on user role
+    if current_user.role == UserRole.ADMIN:
+        # Admin can filter by specific user or see all tasks
+        filter_assigned_to = assigned_to  # Can be None (all tasks) or specific user ID
+    else:
+        # Regular users always see only their own tasks
+        filter_assigned_to = current_user.id
+    
+    return TaskFilter(
+        completed=completed,
+        priority=priority,
+        created_by=None,
+        assigned_to=filter_assigned_to,
+        search=search
+    )
+
+
+def decode_task_cursor_param(
+    cursor: Optional[str],
+    sort_by: str,
+    sort_order: str
+) -> Optional[Tuple[Any, int]]:
+    """
+    Decode the cursor query parameter of a task list request.
+    
+    Raises:
+        BadRequestException: If the cursor is malformed or was issued for another sort
+    """
+    if cursor is None:
+        return None
+    try:
+        return crud_task.decode_task_cursor(cursor, sort_by, sort_order)
+    except ValueError:
+        raise BadRequestException(detail="Invalid cursor")
+
+
+def build_task_page(
+    tasks: List[Task],
+    total: int,
+    skip: int,
+    limit: int,
+    sort_by: str,
+    sort_order: str
+) -> PaginatedResponse:
+    """
+    Build a task list page from up to limit + 1 fetched rows.
+    
+    The extra row only signals that another page exists; next_cursor
+    points after the last returned row (offset paging only for relevance).
+    """
+    has_more = len(tasks) > limit
+    tasks = tasks[:limit]
+    next_cursor = None
+    if has_more and tasks:
+        next_cursor = crud_task.encode_task_cursor(tasks[-1], sort_by, sort_order)
+    
+    return PaginatedResponse.create(
+        items=tasks,
+        total=total,
+        skip=skip,
+        limit=limit,
+        next_cursor=next_cursor,
+        has_more=has_more
+    )
+
+
+def decode_sync_token_param(since: Optional[str]) -> Tuple[Optional[Tuple[datetime, int]], Optional[datetime]]:
+    """
+    Decode the since query parameter of a delta sync.
+    
+    Returns:
+        (updated_at, id) to continue after and the deletions watermark,
+        both None for an initial sync
+        
+    Raises:
+        BadRequestException: If the token is malformed
+    """
+    if since is None:
+        return None, None
+    try:
+        return crud_task.decode_sync_token(since)
+    except ValueError:
+        raise BadRequestException(detail="Invalid sync token")
+
+
+def sync_horizon() -> datetime:
+    """Get the newest position a sync token may point at."""
+    return datetime.now(timezone.utc) - timedelta(seconds=settings.task_sync_overlap_seconds)
+
+
+def build_task_changes(
+    tasks: List[Task],
+    limit: int,
+    deleted: List[int],
+    deleted_after: Optional[datetime],
+    horizon: datetime
+) -> TaskChanges:
+    """
+    Build a delta sync response from up to limit + 1 changed tasks.
+    
+    While changes are pending, the token continues right after the last
+    one returned and deletions wait for the last page. The last page's
+    token restarts from the horizon, so changes from the last few seconds
+    may be delivered twice; clients apply them by id.
+    """
+    has_more = len(tasks) > limit
+    tasks = tasks[:limit]
+    if has_more:
+        token = crud_task.encode_sync_token((tasks[-1].updated_at, tasks[-1].id), deleted_after or horizon)
+    else:
+        token = crud_task.encode_sync_token((horizon, 0), horizon)
+    return TaskChanges(changed=tasks, deleted=deleted, sync_token=token, has_more=has_more)
+
+
+def build_bulk_result(ids: Optional[List[int]], affected: List[int]) -> TaskBulkResult:
+    """
+    Build a bulk update or delete response, listing requested IDs that were not affected.
+    """
+    affected_ids = set(affected)
+    skipped = [] if ids is None else [task_id for task_id in dict.fromkeys(ids) if task_id not in affected_ids]
+    return TaskBulkResult(affected=len(affected), ids=affected, skipped=skipped)
+
+
+def task_write_error(task: Optional[Task], action: str) -> Exception:
+    """
+    Explain why a write guarded by the ownership check matched no task.
+    
+    Args:
+        task: The task as it exists after the write, or None if it does not
+        action: "update" or "delete", for the error message
+        
+    Returns:
+        NotFoundException for a missing task, else ForbiddenException
+    """
+    if task is None:
+        return NotFoundException(resource="Task")
+    return ForbiddenException(detail=f"You don't have permission to {action} this task")
+
+
+def render_task_page(page: PaginatedResponse, fields: Optional[List[str]], etag: Optional[str]) -> CachedResponse:
+    """
+    Serialize a task list page (full or sparse items) with its ETag.
+    """
+    if fields is not None:
+        return CachedResponse(etag=etag, body=sparse_page(page, TaskOut, fields).body)
+    return CachedResponse.render(PaginatedResponse[TaskOut].model_validate(page, from_attributes=True), etag)
+
+
+def task_cache_scopes(filters: TaskFilter) -> List[Any]:
+    """
+    Get the response cache generation scopes of a task list.
+    
+    A list filtered by assignee only changes when that user's tasks do;
+    an unfiltered (admin) list changes with any task.
+    """
+    return [ALL_TASKS] if filters.assigned_to is None else [filters.assigned_to]
+
+
 @router.post("/", response_model=TaskOut, status_code=status.HTTP_201_CREATED)
 def create_task(
     task: TaskCreate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: TokenData = Depends(get_current_principal)
 ):
     """
     Create a new task assigned to the current user.
@@ -31,7 +219,7 @@ def create_task(
     Args:
         task: Task creation data
         db: Database session
-        current_user: Current authenticated user
+        current_user: Current authenticated principal
         
     Returns:
         Created task information
@@ -42,18 +230,99 @@ def create_task(
     return new_task
 
 
+@router.post("/bulk", response_model=TaskBulkCreated, status_code=status.HTTP_201_CREATED)
+def create_tasks_bulk(
+    payload: TaskBulkCreate,
+    db: Session = Depends(get_db),
+    current_user: TokenData = Depends(get_current_principal)
+):
+    """
+    Create up to TASK_BULK_MAX_ITEMS tasks assigned to the current user.
+    
+    All items are validated before anything is written: if any is
+    invalid, the 422 response lists the errors of every item (its index
+    is in each error's loc) and no task is created.
+    
+    Args:
+        payload: Tasks to create
+        db: Database session
+        current_user: Current authenticated principal
+        
+    Returns:
+        Number of created tasks and the tasks, in request order
+    """
+    # Same rule as single creation: tasks are assigned to their creator
+    tasks = [task.model_copy(update={"assigned_to": current_user.id}) for task in payload.tasks]
+    created = crud_task.create_tasks(db, tasks, creator_id=current_user.id)
+    return TaskBulkCreated(created=len(created), tasks=created)
+
+
+@router.patch("/bulk", response_model=TaskBulkResult)
+def update_tasks_bulk(
+    payload: TaskBulkUpdate,
+    db: Session = Depends(get_db),
+    current_user: TokenData = Depends(get_current_principal)
+):
+    """
+    Apply the same update to many tasks with one set-based UPDATE.
+    
+    Tasks are selected by ids or by filter; only those assigned to the
+    current user are changed, as with single updates.
+    
+    Args:
+        payload: Task selection and the fields to set
+        db: Database session
+        current_user: Current authenticated principal
+        
+    Returns:
+        Number and IDs of updated tasks, and requested IDs that were skipped
+    """
+    updated = crud_task.update_tasks(
+        db, current_user.id, payload.update, ids=payload.ids, filters=payload.filter
+    )
+    return build_bulk_result(payload.ids, updated)
+
+
+@router.delete("/bulk", response_model=TaskBulkResult)
+def delete_tasks_bulk(
+    payload: TaskBulkSelection,
+    db: Session = Depends(get_db),
+    current_user: TokenData = Depends(get_current_principal)
+):
+    """
+    Delete many tasks (and their comments) with set-based DELETEs.
+    
+    Tasks are selected by ids or by filter; only those assigned to the
+    current user are deleted, as with single deletes.
+    
+    Args:
+        payload: Task selection
+        db: Database session
+        current_user: Current authenticated principal
+        
+    Returns:
+        Number and IDs of deleted tasks, and requested IDs that were skipped
+    """
+    deleted = crud_task.delete_tasks(db, current_user.id, ids=payload.ids, filters=payload.filter)
+    return build_bulk_result(payload.ids, deleted)
+
+
 @router.get("/", response_model=PaginatedResponse[TaskOut])
 def get_tasks(
+    request: Request,
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor (skip is ignored)"),
     completed: Optional[bool] = None,
     priority: Optional[str] = None,
     assigned_to: Optional[int] = Query(None, description="Filter by assigned user ID (admin only)"),
     search: Optional[str] = None,
-    sort_by: str = Query("created_at", description="Field to sort by"),
+    sort_by: TaskSortField = Query(TaskSortField.CREATED_AT, description="Field to sort by"),
     sort_order: str = Query("desc", pattern="^(asc|desc)$"),
+    fields: Optional[List[str]] = Depends(sparse_fields(TaskOut)),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: TokenData = Depends(get_current_principal)
 ):
     """
     Get list of tasks with filtering, sorting, and pagination.
@@ -63,101 +332,280 @@ def get_tasks(
         - If assigned_to is provided, see tasks for that specific user
         - If assigned_to is not provided, see all tasks in the system
     
+    Pages can be walked by offset (skip) or, at constant cost for deep
+    pages, by passing back next_cursor with the same sort parameters.
+    Rendered pages (except searches) are served from the response cache
+    until a task of the listed assignee changes.
+    
     Args:
+        request: Incoming request
+        response: Response receiving the ETag
         skip: Number of records to skip
         limit: Maximum number of records to return
+        cursor: Opaque keyset cursor from a previous page
         completed: Filter by completion status
         priority: Filter by priority
         assigned_to: Filter by assigned user ID (admin only)
-        search: Search term for title and description
-        sort_by: Field to sort by
+        search: Search term for title, description and comments
+        sort_by: Whitelisted field to sort by ("relevance" ranks search matches)
         sort_order: Sort order (asc/desc)
+        fields: Optional sparse fieldset; only those columns are selected
         db: Database session
-        current_user: Current authenticated user
+        current_user: Current authenticated principal
         
     Returns:
-        Paginated list of tasks based on user role and filters
+        Paginated list of tasks based on user role and filters, or
+        304 Not Modified when If-None-Match carries the current ETag
+        
+    Raises:
+        BadRequestException: If the cursor or a requested field is invalid
     """
-    from app.models.user import UserRole
+    filters = build_task_filter(
+        current_user,
+        completed=completed,
+        priority=priority,
+        assigned_to=assigned_to,
+        search=search
+    )
     
-    # Determine assigned_to filter based on user role
-    if current_user.role == UserRole.ADMIN:
-        # Admin can filter by specific user or see all tasks
-        filter_assigned_to = assigned_to  # Can be None (all tasks) or specific user ID
-    else:
-        # Regular users always see only their own tasks
-        filter_assigned_to = current_user.id
+    after = decode_task_cursor_param(cursor, sort_by.value, sort_order)
+    if after is not None:
+        skip = 0
+    
+    # Searches also match comment text, which neither the version nor
+    # the cache generations cover
+    versioned = search is None
+    cache_key = None
+    if versioned:
+        cache_key = response_cache.key("tasks", current_user, request, task_cache_scopes(filters))
     
-    # Build filters
-    filters = TaskFilter(
+    # Without the cache, revalidations are answered from a count/max(updated_at)
+    # query before the page is loaded
+    if cache_key is None and versioned and "if-none-match" in request.headers:
+        version = crud_task.get_tasks_version(db, filters)
+        not_modified = check_etag(request, response, request_etag(request, current_user, *version))
+        if not_modified is not None:
+            return not_modified
+    
+    def render() -> CachedResponse:
+        # Get tasks, total and version in one query (one extra row tells whether another page exists)
+        tasks, total, last_updated = crud_task.get_tasks_page(
+            db,
+            skip=skip,
+            limit=limit + 1,
+            filters=filters,
+            sort_by=sort_by.value,
+            sort_order=sort_order,
+            after=after,
+            columns=fields
+        )
+        etag = request_etag(request, current_user, total, last_updated) if versioned else None
+        page = build_task_page(tasks, total, skip, limit, sort_by.value, sort_order)
+        return render_task_page(page, fields, etag)
+    
+    return response_cache.fetch(cache_key, render).to_response(request)
+
+
+@router.get("/export", response_class=StreamingResponse)
+def export_tasks(
+    export_format: str = Query("ndjson", alias="format", pattern="^(ndjson|csv)$"),
+    completed: Optional[bool] = None,
+    priority: Optional[str] = None,
+    assigned_to: Optional[int] = Query(None, description="Filter by assigned user ID (admin only)"),
+    search: Optional[str] = None,
+    sort_by: TaskSortField = Query(TaskSortField.CREATED_AT, description="Field to sort by"),
+    sort_order: str = Query("desc", pattern="^(asc|desc)$"),
+    fields: Optional[List[str]] = Depends(sparse_fields(TaskOut)),
+    db: Session = Depends(get_db),
+    current_user: TokenData = Depends(get_current_principal)
+):
+    """
+    Stream every matching task as NDJSON or CSV.
+    
+    Takes the same filters and scoping as the task list, without
+    pagination: rows are streamed as they are fetched, so memory use
+    does not depend on how many tasks match.
+    
+    Args:
+        export_format: "ndjson" (one JSON object per line) or "csv"
+        completed: Filter by completion status
+        priority: Filter by priority
+        assigned_to: Filter by assigned user ID (admin only)
+        search: Search term for title, description and comments
+        sort_by: Whitelisted field to sort by
+        sort_order: Sort order (asc/desc)
+        fields: Optional sparse fieldset (defaults to all task fields)
+        db: Database session
+        current_user: Current authenticated principal
+        
+    Returns:
+        Streaming response with the exported tasks
+    """
+    filters = build_task_filter(
+        current_user,
         completed=completed,
         priority=priority,
-        created_by=None,
-        assigned_to=filter_assigned_to,
+        assigned_to=assigned_to,
         search=search
     )
-    
-    # Get tasks
-    tasks = crud_task.get_tasks(
+    fields = fields or list(TaskOut.model_fields)
+    batches = crud_task.stream_tasks(
         db,
-        skip=skip,
-        limit=limit,
+        fields,
         filters=filters,
-        sort_by=sort_by,
+        sort_by=sort_by.value,
         sort_order=sort_order
     )
     
-    # Get total count
-    total = crud_task.get_tasks_count(db, filters=filters)
-    
-    return PaginatedResponse.create(
-        items=tasks,
-        total=total,
-        skip=skip,
-        limit=limit
+    render = csv_chunks if export_format == "csv" else ndjson_chunks
+    return StreamingResponse(
+        render(batches, fields),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="tasks.{export_format}"'}
     )
 
 
+@router.get("/suggest", response_model=List[TaskSuggestion])
+def suggest_tasks(
+    q: str = Query(..., min_length=1, max_length=100, description="Title text typed so far"),
+    limit: int = Query(10, ge=1, le=20),
+    db: Session = Depends(get_db),
+    current_user: TokenData = Depends(get_current_principal)
+):
+    """
+    Suggest tasks whose titles match what the user has typed so far.
+    
+    Meant to be called on every keystroke: results are limited to a few
+    visible tasks (same scoping as the task list), best match first.
+    
+    Args:
+        q: Title text typed so far
+        limit: Maximum number of suggestions
+        db: Database session
+        current_user: Current authenticated principal
+        
+    Returns:
+        List of task ids and titles
+    """
+    filters = build_task_filter(current_user)
+    return crud_task.suggest_tasks(db, q, filters=filters, limit=limit)
+
+
 @router.get("/statistics", response_model=TaskStatistics)
 def get_task_statistics(
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: TokenData = Depends(get_current_principal)
 ):
     """
     Get task statistics for the current user.
     
     Args:
+        request: Incoming request
+        response: Response receiving the ETag
         db: Database session
-        current_user: Current authenticated user
+        current_user: Current authenticated principal
         
     Returns:
-        Task statistics for the current user
+        Task statistics for the current user, or 304 Not Modified
     """
+    # Cached statistics change with the user's tasks; the overdue count
+    # may lag behind the clock by up to the cache TTL
+    cache_key = response_cache.key("statistics", current_user, request, [current_user.id])
+    if cache_key is not None:
+        def render() -> CachedResponse:
+            version = crud_task.get_task_statistics_version(db, user_id=current_user.id)
+            stats = crud_task.get_task_statistics(db, user_id=current_user.id)
+            return CachedResponse.render(stats, request_etag(request, current_user, *version))
+        
+        return response_cache.fetch(cache_key, render).to_response(request)
+    
+    version = crud_task.get_task_statistics_version(db, user_id=current_user.id)
+    not_modified = check_etag(request, response, request_etag(request, current_user, *version))
+    if not_modified is not None:
+        return not_modified
+    
     stats = crud_task.get_task_statistics(db, user_id=current_user.id)
     return stats
 
 
+@router.get("/changes", response_model=TaskChanges)
+def get_task_changes(
+    since: Optional[str] = Query(None, description="sync_token from the previous sync (omit for a full sync)"),
+    limit: int = Query(500, ge=1, le=1000),
+    assigned_to: Optional[int] = Query(None, description="Filter by assigned user ID (admin only)"),
+    db: Session = Depends(get_db),
+    current_user: TokenData = Depends(get_current_principal)
+):
+    """
+    Get the tasks created, updated or deleted since a sync token.
+    
+    Returns the caller's tasks (same scoping as the task list) in
+    updated_at order, so the work done depends on how much changed rather
+    than on how many tasks there are. Deleted tasks, and tasks reassigned
+    to someone else, come back as ids in ``deleted``.
+    
+    Args:
+        since: Token from a previous response
+        limit: Maximum number of changed tasks to return
+        assigned_to: Filter by assigned user ID (admin only)
+        db: Database session
+        current_user: Current authenticated principal
+        
+    Returns:
+        Changed tasks, deleted task ids and the next sync token
+        
+    Raises:
+        BadRequestException: If the sync token is invalid
+    """
+    filters = build_task_filter(current_user, assigned_to=assigned_to)
+    after, deleted_after = decode_sync_token_param(since)
+    horizon = sync_horizon()
+    
+    tasks = crud_task.get_tasks(
+        db,
+        limit=limit + 1,
+        filters=filters,
+        sort_by=TaskSortField.UPDATED_AT.value,
+        sort_order="asc",
+        after=after
+    )
+    deleted = []
+    if len(tasks) <= limit and deleted_after is not None:
+        deleted = crud_task.get_deleted_task_ids(db, deleted_after, filters=filters)
+    
+    return build_task_changes(tasks, limit, deleted, deleted_after, horizon)
+
+
 @router.get("/{task_id}", response_model=TaskOut)
 def get_task(
     task_id: int,
+    request: Request,
+    response: Response,
+    fields: Optional[List[str]] = Depends(sparse_fields(TaskOut)),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: TokenData = Depends(get_current_principal)
 ):
     """
     Get a specific task by ID (only if assigned to current user).
     
     Args:
         task_id: Task ID
+        request: Incoming request
+        response: Response receiving the ETag
+        fields: Optional sparse fieldset
         db: Database session
-        current_user: Current authenticated user
+        current_user: Current authenticated principal
         
     Returns:
-        Task information
+        Task information, or 304 Not Modified
         
     Raises:
         NotFoundException: If task not found or not assigned to user
     """
-    task = crud_task.get_task(db, task_id)
+    columns = None if fields is None else [*fields, "assigned_to", "updated_at"]
+    task = crud_task.get_task(db, task_id, columns=columns)
     if not task:
         raise NotFoundException(resource="Task")
     
@@ -165,6 +613,13 @@ def get_task(
     if task.assigned_to != current_user.id:
         raise NotFoundException(resource="Task")
     
+    etag = request_etag(request, current_user, task.id, task.updated_at)
+    not_modified = check_etag(request, response, etag)
+    if not_modified is not None:
+        return not_modified
+    
+    if fields is not None:
+        return JSONResponse(content=dump_fields(task, TaskOut, fields), headers=etag_headers(etag))
     return task
 
 
@@ -173,7 +628,7 @@ def update_task(
     task_id: int,
     task_update: TaskUpdate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: TokenData = Depends(get_current_principal)
 ):
     """
     Update a task (only if assigned to current user).
@@ -182,7 +637,7 @@ def update_task(
         task_id: Task ID
         task_update: Task update data
         db: Database session
-        current_user: Current authenticated user
+        current_user: Current authenticated principal
         
     Returns:
         Updated task information
@@ -191,17 +646,11 @@ def update_task(
         NotFoundException: If task not found or not assigned to user
         ForbiddenException: If user doesn't have permission
     """
-    # Get existing task
-    existing_task = crud_task.get_task(db, task_id)
-    if not existing_task:
-        raise NotFoundException(resource="Task")
-    
-    # Check permissions (only assigned user can update)
-    if existing_task.assigned_to != current_user.id:
-        raise ForbiddenException(detail="You don't have permission to update this task")
-    
-    # Update task
-    updated_task = crud_task.update_task(db, task_id, task_update)
+    # Only the assigned user can update: checked by the UPDATE itself, and
+    # the task is only read when nothing matched, to pick the error
+    updated_task = crud_task.update_task(db, task_id, task_update, owner_id=current_user.id)
+    if updated_task is None:
+        raise task_write_error(crud_task.get_task(db, task_id), "update")
     return updated_task
 
 
@@ -209,7 +658,7 @@ def update_task(
 def delete_task(
     task_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: TokenData = Depends(get_current_principal)
 ):
     """
     Delete a task (only if assigned to current user).
@@ -217,7 +666,7 @@ def delete_task(
     Args:
         task_id: Task ID
         db: Database session
-        current_user: Current authenticated user
+        current_user: Current authenticated principal
         
     Returns:
         Success message
@@ -226,15 +675,7 @@ def delete_task(
         NotFoundException: If task not found or not assigned to user
         ForbiddenException: If user doesn't have permission
     """
-    # Get existing task
-    existing_task = crud_task.get_task(db, task_id)
-    if not existing_task:
-        raise NotFoundException(resource="Task")
-    
-    # Check permissions (only assigned user can delete)
-    if existing_task.assigned_to != current_user.id:
-        raise ForbiddenException(detail="You don't have permission to delete this task")
-    
-    # Delete task
-    crud_task.delete_task(db, task_id)
+    # Only the assigned user can delete (see update_task)
+    if not crud_task.delete_task(db, task_id, owner_id=current_user.id):
+        raise task_write_error(crud_task.get_task(db, task_id), "delete")
     return MessageResponse(message="Task deleted successfully")
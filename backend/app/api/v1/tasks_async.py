@@ -0,0 +1,367 @@
+"""
+Task management endpoints on the async database path.
+
+Mounted ahead of app.api.v1.tasks when settings.database_async is enabled.
+Path parameters use the ``int`` convertor so static routes that only exist
+on the sync router are never shadowed by ``/{task_id}``.
+"""
+from typing import Optional, List
+from fastapi import APIRouter, Depends, Request, Response, status, Query
+from fastapi.responses import JSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.session import get_async_db
+from app.dependencies import get_current_principal, sparse_fields
+from app.schemas.user import TokenData
+from app.crud.aio import task as crud_task
+from app.api.v1.tasks import (
+    build_task_filter, build_task_page, decode_task_cursor_param, render_task_page, task_cache_scopes,
+    decode_sync_token_param, sync_horizon, build_task_changes, build_bulk_result, task_write_error
+)
+from app.schemas.task import (
+    TaskCreate, TaskUpdate, TaskOut, TaskSortField, TaskStatistics, TaskSuggestion, TaskChanges,
+    TaskBulkCreate, TaskBulkCreated, TaskBulkSelection, TaskBulkUpdate, TaskBulkResult
+)
+from app.schemas.common import PaginatedResponse, MessageResponse
+from app.core.exceptions import NotFoundException
+from app.core.response_cache import CachedResponse, response_cache
+from app.utils.etag import check_etag, etag_headers, request_etag
+from app.utils.fieldsets import dump_fields
+
+router = APIRouter()
+
+
+@router.post("/", response_model=TaskOut, status_code=status.HTTP_201_CREATED)
+async def create_task(
+    task: TaskCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: TokenData = Depends(get_current_principal)
+):
+    """
+    Create a new task assigned to the current user.
+    
+    Args:
+        task: Task creation data
+        db: Async database session
+        current_user: Current authenticated principal
+        
+    Returns:
+        Created task information
+    """
+    # Override assigned_to to always be the current user
+    task_data = task.model_copy(update={"assigned_to": current_user.id})
+    return await crud_task.create_task(db, task_data, creator_id=current_user.id)
+
+
+@router.post("/bulk", response_model=TaskBulkCreated, status_code=status.HTTP_201_CREATED)
+async def create_tasks_bulk(
+    payload: TaskBulkCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: TokenData = Depends(get_current_principal)
+):
+    """
+    Create up to TASK_BULK_MAX_ITEMS tasks assigned to the current user.
+    
+    All items are validated before anything is written: if any is
+    invalid, the 422 response lists the errors of every item (its index
+    is in each error's loc) and no task is created.
+    
+    Args:
+        payload: Tasks to create
+        db: Async database session
+        current_user: Current authenticated principal
+        
+    Returns:
+        Number of created tasks and the tasks, in request order
+    """
+    # Same rule as single creation: tasks are assigned to their creator
+    tasks = [task.model_copy(update={"assigned_to": current_user.id}) for task in payload.tasks]
+    created = await crud_task.create_tasks(db, tasks, creator_id=current_user.id)
+    return TaskBulkCreated(created=len(created), tasks=created)
+
+
+@router.patch("/bulk", response_model=TaskBulkResult)
+async def update_tasks_bulk(
+    payload: TaskBulkUpdate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: TokenData = Depends(get_current_principal)
+):
+    """
+    Apply the same update to many tasks with one set-based UPDATE.
+    
+    Tasks are selected by ids or by filter; only those assigned to the
+    current user are changed, as with single updates.
+    
+    Args:
+        payload: Task selection and the fields to set
+        db: Async database session
+        current_user: Current authenticated principal
+        
+    Returns:
+        Number and IDs of updated tasks, and requested IDs that were skipped
+    """
+    updated = await crud_task.update_tasks(
+        db, current_user.id, payload.update, ids=payload.ids, filters=payload.filter
+    )
+    return build_bulk_result(payload.ids, updated)
+
+
+@router.delete("/bulk", response_model=TaskBulkResult)
+async def delete_tasks_bulk(
+    payload: TaskBulkSelection,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: TokenData = Depends(get_current_principal)
+):
+    """
+    Delete many tasks (and their comments) with set-based DELETEs.
+    
+    Tasks are selected by ids or by filter; only those assigned to the
+    current user are deleted, as with single deletes.
+    
+    Args:
+        payload: Task selection
+        db: Async database session
+        current_user: Current authenticated principal
+        
+    Returns:
+        Number and IDs of deleted tasks, and requested IDs that were skipped
+    """
+    deleted = await crud_task.delete_tasks(db, current_user.id, ids=payload.ids, filters=payload.filter)
+    return build_bulk_result(payload.ids, deleted)
+
+
+@router.get("/", response_model=PaginatedResponse[TaskOut])
+async def get_tasks(
+    request: Request,
+    response: Response,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor (skip is ignored)"),
+    completed: Optional[bool] = None,
+    priority: Optional[str] = None,
+    assigned_to: Optional[int] = Query(None, description="Filter by assigned user ID (admin only)"),
+    search: Optional[str] = None,
+    sort_by: TaskSortField = Query(TaskSortField.CREATED_AT, description="Field to sort by"),
+    sort_order: str = Query("desc", pattern="^(asc|desc)$"),
+    fields: Optional[List[str]] = Depends(sparse_fields(TaskOut)),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: TokenData = Depends(get_current_principal)
+):
+    """
+    Get list of tasks with filtering, sorting, and pagination.
+    
+    Same visibility rules as the sync endpoint: regular users only see
+    their own tasks, admins may filter by assignee or see everything.
+    
+    Returns:
+        Paginated list of tasks based on user role and filters, or 304 Not Modified
+    """
+    filters = build_task_filter(
+        current_user,
+        completed=completed,
+        priority=priority,
+        assigned_to=assigned_to,
+        search=search
+    )
+    
+    after = decode_task_cursor_param(cursor, sort_by.value, sort_order)
+    if after is not None:
+        skip = 0
+    
+    # Searches also match comment text, which neither the version nor
+    # the cache generations cover
+    versioned = search is None
+    cache_key = None
+    if versioned:
+        cache_key = await response_cache.akey("tasks", current_user, request, task_cache_scopes(filters))
+    
+    # Without the cache, revalidations are answered from a count/max(updated_at)
+    # query before the page is loaded
+    if cache_key is None and versioned and "if-none-match" in request.headers:
+        version = await crud_task.get_tasks_version(db, filters)
+        not_modified = check_etag(request, response, request_etag(request, current_user, *version))
+        if not_modified is not None:
+            return not_modified
+    
+    async def render() -> CachedResponse:
+        # Get tasks, total and version in one query (one extra row tells whether another page exists)
+        tasks, total, last_updated = await crud_task.get_tasks_page(
+            db,
+            skip=skip,
+            limit=limit + 1,
+            filters=filters,
+            sort_by=sort_by.value,
+            sort_order=sort_order,
+            after=after,
+            columns=fields
+        )
+        etag = request_etag(request, current_user, total, last_updated) if versioned else None
+        page = build_task_page(tasks, total, skip, limit, sort_by.value, sort_order)
+        return render_task_page(page, fields, etag)
+    
+    return (await response_cache.afetch(cache_key, render)).to_response(request)
+
+
+@router.get("/suggest", response_model=List[TaskSuggestion])
+async def suggest_tasks(
+    q: str = Query(..., min_length=1, max_length=100, description="Title text typed so far"),
+    limit: int = Query(10, ge=1, le=20),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: TokenData = Depends(get_current_principal)
+):
+    """
+    Suggest tasks whose titles match what the user has typed so far.
+    
+    Meant to be called on every keystroke: results are limited to a few
+    visible tasks (same scoping as the task list), best match first.
+    
+    Args:
+        q: Title text typed so far
+        limit: Maximum number of suggestions
+        db: Async database session
+        current_user: Current authenticated principal
+        
+    Returns:
+        List of task ids and titles
+    """
+    filters = build_task_filter(current_user)
+    return await crud_task.suggest_tasks(db, q, filters=filters, limit=limit)
+
+
+@router.get("/statistics", response_model=TaskStatistics)
+async def get_task_statistics(
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: TokenData = Depends(get_current_principal)
+):
+    """
+    Get task statistics for the current user.
+    
+    Args:
+        request: Incoming request
+        response: Response receiving the ETag
+        db: Async database session
+        current_user: Current authenticated principal
+        
+    Returns:
+        Task statistics for the current user, or 304 Not Modified
+    """
+    cache_key = await response_cache.akey("statistics", current_user, request, [current_user.id])
+    if cache_key is not None:
+        async def render() -> CachedResponse:
+            version = await crud_task.get_task_statistics_version(db, user_id=current_user.id)
+            stats = await crud_task.get_task_statistics(db, user_id=current_user.id)
+            return CachedResponse.render(stats, request_etag(request, current_user, *version))
+        
+        return (await response_cache.afetch(cache_key, render)).to_response(request)
+    
+    version = await crud_task.get_task_statistics_version(db, user_id=current_user.id)
+    not_modified = check_etag(request, response, request_etag(request, current_user, *version))
+    if not_modified is not None:
+        return not_modified
+    
+    return await crud_task.get_task_statistics(db, user_id=current_user.id)
+
+
+@router.get("/changes", response_model=TaskChanges)
+async def get_task_changes(
+    since: Optional[str] = Query(None, description="sync_token from the previous sync (omit for a full sync)"),
+    limit: int = Query(500, ge=1, le=1000),
+    assigned_to: Optional[int] = Query(None, description="Filter by assigned user ID (admin only)"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: TokenData = Depends(get_current_principal)
+):
+    """
+    Get the tasks created, updated or deleted since a sync token.
+    
+    Same scoping and token semantics as the sync endpoint.
+    
+    Returns:
+        Changed tasks, deleted task ids and the next sync token
+    """
+    filters = build_task_filter(current_user, assigned_to=assigned_to)
+    after, deleted_after = decode_sync_token_param(since)
+    horizon = sync_horizon()
+    
+    tasks = await crud_task.get_tasks(
+        db,
+        limit=limit + 1,
+        filters=filters,
+        sort_by=TaskSortField.UPDATED_AT.value,
+        sort_order="asc",
+        after=after
+    )
+    deleted = []
+    if len(tasks) <= limit and deleted_after is not None:
+        deleted = await crud_task.get_deleted_task_ids(db, deleted_after, filters=filters)
+    
+    return build_task_changes(tasks, limit, deleted, deleted_after, horizon)
+
+
+@router.get("/{task_id:int}", response_model=TaskOut)
+async def get_task(
+    task_id: int,
+    request: Request,
+    response: Response,
+    fields: Optional[List[str]] = Depends(sparse_fields(TaskOut)),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: TokenData = Depends(get_current_principal)
+):
+    """
+    Get a specific task by ID (only if assigned to current user).
+    
+    Raises:
+        NotFoundException: If task not found or not assigned to user
+    """
+    columns = None if fields is None else [*fields, "assigned_to", "updated_at"]
+    task = await crud_task.get_task(db, task_id, columns=columns)
+    if not task or task.assigned_to != current_user.id:
+        raise NotFoundException(resource="Task")
+    
+    etag = request_etag(request, current_user, task.id, task.updated_at)
+    not_modified = check_etag(request, response, etag)
+    if not_modified is not None:
+        return not_modified
+    
+    if fields is not None:
+        return JSONResponse(content=dump_fields(task, TaskOut, fields), headers=etag_headers(etag))
+    return task
+
+
+@router.put("/{task_id:int}", response_model=TaskOut)
+async def update_task(
+    task_id: int,
+    task_update: TaskUpdate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: TokenData = Depends(get_current_principal)
+):
+    """
+    Update a task (only if assigned to current user).
+    
+    Raises:
+        NotFoundException: If task not found
+        ForbiddenException: If user doesn't have permission
+    """
+    updated_task = await crud_task.update_task(db, task_id, task_update, owner_id=current_user.id)
+    if updated_task is None:
+        raise task_write_error(await crud_task.get_task(db, task_id), "update")
+    return updated_task
+
+
+@router.delete("/{task_id:int}", response_model=MessageResponse)
+async def delete_task(
+    task_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: TokenData = Depends(get_current_principal)
+):
+    """
+    Delete a task (only if assigned to current user).
+    
+    Raises:
+        NotFoundException: If task not found
+        ForbiddenException: If user doesn't have permission
+    """
+    if not await crud_task.delete_task(db, task_id, owner_id=current_user.id):
+        raise task_write_error(await crud_task.get_task(db, task_id), "delete")
+    return MessageResponse(message="Task deleted successfully")
@@ -1,55 +1,73 @@
 """
 User management endpoints.
 """
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, BackgroundTasks, Depends, Request, Response, status
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
 from app.db.session import get_db
-from app.dependencies import get_current_user
+from app.dependencies import get_current_principal
 from app.models.user import User
-from app.schemas.user import UserOut, UserUpdate
-from app.schemas.common import MessageResponse
+from app.schemas.user import UserOut, UserUpdate, TokenData
+from app.schemas.purge_job import PurgeJobOut
+from app.config import settings
 from app.core.exceptions import NotFoundException
-from app.crud.user import get_user, update_user, delete_user
+from app.core.security import aget_password_hash
+from app.core.purge import purge_worker
+from app.crud.user import get_user, get_users_version, update_user, soft_delete_user
+from app.utils.etag import check_etag, request_etag
 
 router = APIRouter()
 
 
 @router.get("/", response_model=list[UserOut])
 def get_all_users(
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: TokenData = Depends(get_current_principal)
 ):
     """
     Get a list of all users.
     
     Args:
+        request: Incoming request
+        response: Response receiving the ETag
         db: Database session
-        current_user: Current authenticated user
+        current_user: Current authenticated principal
         
     Returns:
-        List of all users
+        List of all users, or 304 Not Modified
     """
-    users = db.query(User).all()
+    etag = request_etag(request, current_user, *get_users_version(db))
+    not_modified = check_etag(request, response, etag)
+    if not_modified is not None:
+        return not_modified
+    
+    users = db.query(User).filter(User.deleted_at.is_(None)).all()
     return users
 
 
 @router.get("/{user_id}", response_model=UserOut)
 def get_user_by_id(
     user_id: int,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: TokenData = Depends(get_current_principal)
 ):
     """
     Get a specific user by ID.
     
     Args:
         user_id: User ID
+        request: Incoming request
+        response: Response receiving the ETag
         db: Database session
-        current_user: Current authenticated user
+        current_user: Current authenticated principal
         
     Returns:
-        User information
+        User information, or 304 Not Modified
         
     Raises:
         NotFoundException: If user not found
@@ -58,24 +76,31 @@ def get_user_by_id(
     if not user:
         raise NotFoundException(resource="User")
     
+    not_modified = check_etag(request, response, request_etag(request, current_user, user.id, user.updated_at))
+    if not_modified is not None:
+        return not_modified
+    
     return user
 
 
 @router.put("/{user_id}", response_model=UserOut)
-def update_user_info(
+async def update_user_info(
     user_id: int,
     user_update: UserUpdate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: TokenData = Depends(get_current_principal)
 ):
     """
     Update user information.
     
+    Async so that no request thread is held while a new password is
+    hashed in the password pool; only the UPDATE runs in the thread pool.
+    
     Args:
         user_id: User ID
         user_update: User update data
         db: Database session
-        current_user: Current authenticated user
+        current_user: Current authenticated principal
         
     Returns:
         Updated user information
@@ -83,37 +108,45 @@ def update_user_info(
     Raises:
         NotFoundException: If user not found
     """
-    user = get_user(db, user_id)
-    if not user:
+    hashed_password = None
+    if user_update.password is not None:
+        hashed_password = await aget_password_hash(user_update.password)
+    updated_user = await run_in_threadpool(update_user, db, user_id, user_update, hashed_password)
+    if updated_user is None:
         raise NotFoundException(resource="User")
-    
-    updated_user = update_user(db, user_id, user_update)
     return updated_user
 
 
-@router.delete("/{user_id}", response_model=MessageResponse)
+@router.delete("/{user_id}", response_model=PurgeJobOut, status_code=status.HTTP_202_ACCEPTED)
 def delete_user_by_id(
     user_id: int,
+    response: Response,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: TokenData = Depends(get_current_principal)
 ):
     """
     Delete a user.
     
+    The user and their comments disappear from reads at once; the rows are
+    removed by a background purge job, reported by GET /jobs/{job_id}.
+    
     Args:
         user_id: User ID
+        response: Response receiving the job's Location
+        background_tasks: Queues the purge once the response is sent
         db: Database session
-        current_user: Current authenticated user
+        current_user: Current authenticated principal
         
     Returns:
-        Success message
+        Accepted purge job
         
     Raises:
         NotFoundException: If user not found
     """
-    user = get_user(db, user_id)
-    if not user:
+    job = soft_delete_user(db, user_id, requested_by=current_user.id)
+    if job is None:
         raise NotFoundException(resource="User")
-    
-    delete_user(db, user_id)
-    return MessageResponse(message="User deleted successfully")
+    background_tasks.add_task(purge_worker.submit, job.id)
+    response.headers["Location"] = f"{settings.api_v1_prefix}/jobs/{job.id}"
+    return job
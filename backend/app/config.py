@@ -3,7 +3,7 @@ Application configuration using Pydantic Settings.
 """
 import os
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -17,12 +17,73 @@ class Settings(BaseSettings):
     
     # Database
     database_url: str
+    # Serve the async-capable routes through AsyncEngine/AsyncSession
+    database_async: bool = False
+    # Optional explicit async URL; derived from database_url when unset
+    async_database_url: Optional[str] = None
+    # Connection pool (per engine, per worker process)
+    db_pool_size: int = 10
+    db_max_overflow: int = 20
+    db_pool_timeout: float = 30.0
+    db_pool_recycle: int = -1
+    # Derive pool size/overflow from the settings below instead
+    db_pool_auto_size: bool = False
+    db_max_connections: int = 100
+    web_concurrency: int = 1
+    # Concurrent DB users per process (AnyIO's default thread pool size)
+    db_pool_concurrency: int = 40
+    # Read replicas for GET requests (empty list disables routing)
+    database_replica_urls: List[str] = []
+    # After a write, the same client reads from the primary for this long
+    replica_sticky_seconds: float = 5.0
+    # Interval of the background replica health checks
+    replica_health_check_seconds: float = 10.0
     
     # Security
     secret_key: str
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
     
+    # Principal cache (authenticated users, keyed by token subject)
+    principal_cache_ttl_seconds: int = 60
+    principal_cache_max_size: int = 1024
+    
+    # Token version cache (revocation state for self-contained tokens)
+    token_version_cache_ttl_seconds: int = 30
+    token_version_cache_max_size: int = 4096
+    
+    # Decoded token cache (0 entries disables it)
+    token_cache_max_size: int = 4096
+    token_cache_ttl_seconds: int = 300
+    
+    # Response cache for task lists and statistics (0 TTL disables it)
+    response_cache_ttl_seconds: float = 30.0
+    # How long one request may render a missing entry while others wait
+    response_cache_lock_seconds: float = 2.0
+    response_cache_socket_timeout_seconds: float = 0.25
+    # In-process fake instead of Redis (tests, single-process local runs)
+    response_cache_fake_redis: bool = False
+    
+    # Delta syncs: tokens trail the clock by this much so that writes
+    # committed late (or stamped by a skewed clock) are sent again, not missed
+    task_sync_overlap_seconds: float = 5.0
+    
+    # Password hashing pool (0 workers hashes in AnyIO's request thread pool).
+    # Login and register await the pool without holding a request thread,
+    # so workers + queue only bound bcrypt work, not db_pool_concurrency
+    password_pool_max_workers: int = 4
+    password_pool_max_queue: int = 32
+    
+    # Background purge of deleted users (0 threads purges inline, after the response)
+    purge_worker_threads: int = 1
+    # Rows deleted or updated per purge transaction
+    purge_chunk_size: int = 1000
+    # A running job without progress for this long is taken over by another worker
+    purge_job_stale_seconds: float = 300.0
+    # A failed job is retried after this long, doubled on every further failure
+    purge_retry_seconds: float = 30.0
+    purge_max_attempts: int = 5
+    
     # API
     api_v1_prefix: str = "/api/v1"
     project_name: str = "Avocado Task Manager"
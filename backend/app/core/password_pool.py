@@ -0,0 +1,136 @@
+"""
+Bounded executor for CPU-heavy password hashing.
+"""
+import asyncio
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from starlette.concurrency import run_in_threadpool
+
+from app.config import settings
+from app.core.exceptions import ServiceUnavailableException
+
+
+class PasswordHashingPool:
+    """
+    Size-limited thread pool for bcrypt work.
+
+    bcrypt releases the GIL while hashing, so a small thread pool gives
+    real parallelism without the pickling cost of a process pool. At most
+    ``max_workers`` hashes run at once and at most ``max_queue`` more may
+    wait; anything beyond that is rejected immediately with a 503.
+    
+    Request handlers await ``arun``, which holds no thread while waiting,
+    so a login burst cannot tie up AnyIO's request worker threads. ``run``
+    blocks the caller and is meant for scripts, tests and sync CRUD paths
+    off the login/register hot path.
+    """
+
+    def __init__(self, max_workers: int, max_queue: int):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor: Optional[ThreadPoolExecutor] = None
+        if max_workers > 0:
+            self._executor = ThreadPoolExecutor(
+                max_workers=max_workers,
+                thread_name_prefix="password-hash"
+            )
+        self._slots = threading.BoundedSemaphore(max(max_workers, 1) + max_queue)
+        self._lock = threading.Lock()
+        self.completed = 0
+        self.rejected = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run a hashing function in the pool and block until its result.
+        
+        Args:
+            fn: Function to run
+            *args: Positional arguments for fn
+            
+        Returns:
+            Whatever fn returns
+            
+        Raises:
+            ServiceUnavailableException: If the pool queue is full
+        """
+        if self._executor is None:
+            return fn(*args)
+        return self._submit(fn, *args).result()
+
+    async def arun(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run a hashing function in the pool and await its result.
+        
+        The calling task is suspended on the pool future, so no request
+        thread is held while the hash is queued or running.
+        
+        Args:
+            fn: Function to run
+            *args: Positional arguments for fn
+            
+        Returns:
+            Whatever fn returns
+            
+        Raises:
+            ServiceUnavailableException: If the pool queue is full
+        """
+        if self._executor is None:
+            # bcrypt must not run on the event loop
+            return await run_in_threadpool(fn, *args)
+        return await asyncio.wrap_future(self._submit(fn, *args))
+
+    def _submit(self, fn: Callable[..., Any], *args: Any) -> Future:
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.rejected += 1
+            raise ServiceUnavailableException(detail="Too many authentication requests, retry shortly")
+        
+        queued_at = time.perf_counter()
+        
+        def _task() -> Any:
+            self._record_wait(time.perf_counter() - queued_at)
+            return fn(*args)
+        
+        try:
+            future = self._executor.submit(_task)
+        except BaseException:
+            self._slots.release()
+            raise
+        # The slot is held until the hash finishes, even if the awaiting
+        # request is cancelled, so admitted work stays bounded
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def _record_wait(self, waited: float) -> None:
+        with self._lock:
+            self.completed += 1
+            self.wait_seconds_total += waited
+            self.wait_seconds_max = max(self.wait_seconds_max, waited)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get pool counters.
+        
+        Returns:
+            Dictionary with limits, completed/rejected counts and wait times
+        """
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "completed": self.completed,
+                "rejected": self.rejected,
+                "wait_seconds_avg": round(self.wait_seconds_total / self.completed, 6) if self.completed else 0.0,
+                "wait_seconds_max": round(self.wait_seconds_max, 6),
+            }
+
+
+password_pool = PasswordHashingPool(
+    max_workers=settings.password_pool_max_workers,
+    max_queue=settings.password_pool_max_queue
+)
@@ -0,0 +1,183 @@
+"""
+Background worker removing the data of deleted users.
+
+DELETE /users/{id} only marks the user deleted and records a purge job;
+this worker runs the job in bounded chunks (app.crud.user.purge_user),
+one transaction each, so a heavy user never holds locks for long. Jobs
+are rows in purge_jobs: any process resumes those left pending, or
+running without a recent heartbeat, at startup. A failed job is retried
+with exponential backoff, up to settings.purge_max_attempts runs, and
+resumes from its last committed chunk.
+"""
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.crud.user import fail_purge_job, get_resumable_purge_jobs, purge_user
+from app.db.session import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+
+class PurgeWorker:
+    """
+    Thread pool running purge jobs, each in its own session.
+    
+    With 0 workers jobs run inline in the calling thread (tests, scripts).
+    """
+    
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        max_workers: int,
+        chunk_size: int,
+        stale_seconds: float,
+        retry_seconds: float,
+        max_attempts: int
+    ):
+        self.session_factory = session_factory
+        self.max_workers = max_workers
+        self.chunk_size = chunk_size
+        self.stale_seconds = stale_seconds
+        self.retry_seconds = retry_seconds
+        self.max_attempts = max_attempts
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._retries: List[threading.Timer] = []
+        self._lock = threading.Lock()
+        self.completed = 0
+        self.failed = 0
+        self.retried = 0
+    
+    def submit(self, job_id: int) -> None:
+        """
+        Queue a purge job.
+        
+        Args:
+            job_id: Purge job ID
+        """
+        if self.max_workers <= 0:
+            self.run(job_id)
+            return
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="purge")
+            self._executor.submit(self.run, job_id)
+    
+    def run(self, job_id: int) -> None:
+        """
+        Run a purge job to completion, recording a failure on the job and scheduling its retry.
+        
+        Args:
+            job_id: Purge job ID
+        """
+        db = self.session_factory()
+        retry_at = None
+        try:
+            job = purge_user(db, job_id, self.chunk_size, self._stale_before())
+            if job is not None:
+                self._count("completed")
+        except Exception as exc:
+            logger.exception("Purge job %s failed", job_id)
+            db.rollback()
+            retry_at = fail_purge_job(db, job_id, str(exc), self.retry_seconds, self.max_attempts)
+            self._count("failed")
+        finally:
+            db.close()
+        if retry_at is not None:
+            self.schedule(job_id, retry_at)
+    
+    def schedule(self, job_id: int, retry_at: datetime) -> None:
+        """
+        Queue a failed purge job once its retry is due.
+        
+        Args:
+            job_id: Purge job ID
+            retry_at: When the job may run again
+        """
+        delay = (retry_at - datetime.now(timezone.utc)).total_seconds()
+        if delay <= 0:
+            self._count("retried")
+            self.submit(job_id)
+            return
+        
+        def _retry() -> None:
+            with self._lock:
+                if timer not in self._retries:
+                    return  # cancelled by shutdown
+                self._retries.remove(timer)
+            self._count("retried")
+            self.submit(job_id)
+        
+        timer = threading.Timer(delay, _retry)
+        timer.daemon = True
+        with self._lock:
+            self._retries.append(timer)
+        timer.start()
+    
+    def resume(self) -> int:
+        """
+        Queue the jobs left pending or abandoned by a stopped process, and the failed jobs still to retry.
+        
+        Returns:
+            Number of jobs queued or scheduled
+        """
+        db = self.session_factory()
+        try:
+            jobs = get_resumable_purge_jobs(db, self._stale_before())
+        finally:
+            db.close()
+        for job_id, retry_at in jobs:
+            if retry_at is None:
+                self.submit(job_id)
+            else:
+                self.schedule(job_id, retry_at)
+        return len(jobs)
+    
+    def shutdown(self) -> None:
+        """Stop accepting jobs; a running or failed job is resumed by the next process."""
+        with self._lock:
+            for timer in self._retries:
+                timer.cancel()
+            self._retries.clear()
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+    
+    def _stale_before(self) -> datetime:
+        return datetime.now(timezone.utc) - timedelta(seconds=self.stale_seconds)
+    
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get worker counters.
+        
+        Returns:
+            Dictionary with limits and completed/failed/retried job counts
+        """
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "chunk_size": self.chunk_size,
+                "completed": self.completed,
+                "failed": self.failed,
+                "retried": self.retried,
+                "retries_scheduled": len(self._retries),
+            }
+
+
+purge_worker = PurgeWorker(
+    session_factory=SessionLocal,
+    max_workers=settings.purge_worker_threads,
+    chunk_size=settings.purge_chunk_size,
+    stale_seconds=settings.purge_job_stale_seconds,
+    retry_seconds=settings.purge_retry_seconds,
+    max_attempts=settings.purge_max_attempts
+)
@@ -0,0 +1,393 @@
+"""
+Shared cache of rendered task list and statistics responses.
+
+Entries live in Redis, keyed by the caller, the normalized query and the
+generation counters of the task owners the response depends on. Task
+writes bump those counters instead of deleting entries: stale entries are
+never looked up again and simply expire. Redis errors never fail a
+request; the cache is bypassed instead.
+"""
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import redis
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from starlette.concurrency import run_in_threadpool
+
+from app.config import settings
+from app.schemas.user import TokenData
+from app.utils.etag import etag_headers, etag_matches
+
+logger = logging.getLogger(__name__)
+
+# Generation scope bumped by every task write (responses over all tasks)
+ALL_TASKS = "all"
+
+
+class FakeRedis:
+    """
+    In-process stand-in for the Redis commands used by the response cache.
+    
+    For tests and single-process local runs without a Redis server.
+    """
+    
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self._data: Dict[str, Tuple[Optional[float], Any]] = {}
+        self._lock = threading.Lock()
+    
+    def _live(self, name: str) -> Optional[Any]:
+        entry = self._data.get(name)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at is not None and expires_at <= self._clock():
+            del self._data[name]
+            return None
+        return value
+    
+    def get(self, name: str) -> Optional[bytes]:
+        with self._lock:
+            return self._live(name)
+    
+    def mget(self, names: Sequence[str]) -> List[Optional[bytes]]:
+        with self._lock:
+            return [self._live(name) for name in names]
+    
+    def set(self, name: str, value: Any, px: Optional[int] = None, nx: bool = False) -> Optional[bool]:
+        if isinstance(value, str):
+            value = value.encode("utf-8")
+        elif isinstance(value, int):
+            value = str(value).encode("ascii")
+        with self._lock:
+            if nx and self._live(name) is not None:
+                return None
+            expires_at = None if px is None else self._clock() + px / 1000
+            self._data[name] = (expires_at, value)
+            return True
+    
+    def incr(self, name: str) -> int:
+        with self._lock:
+            value = int(self._live(name) or 0) + 1
+            self._data[name] = (None, str(value).encode("ascii"))
+            return value
+    
+    def delete(self, *names: str) -> int:
+        with self._lock:
+            return sum(self._data.pop(name, None) is not None for name in names)
+    
+    def flushall(self) -> bool:
+        with self._lock:
+            self._data.clear()
+            return True
+
+
+@dataclass
+class CachedResponse:
+    """A rendered response body and its ETag."""
+    etag: Optional[str]
+    body: bytes
+    
+    def encode(self) -> bytes:
+        return (self.etag or "").encode("ascii") + b"\n" + self.body
+    
+    @classmethod
+    def decode(cls, raw: bytes) -> "CachedResponse":
+        etag, _, body = raw.partition(b"\n")
+        return cls(etag=etag.decode("ascii") or None, body=body)
+    
+    @classmethod
+    def render(cls, content: Any, etag: Optional[str] = None) -> "CachedResponse":
+        """
+        Serialize a JSON response body.
+        
+        Args:
+            content: JSON-compatible value or pydantic model
+            etag: Entity tag of the body
+        
+        Returns:
+            Rendered response
+        """
+        return cls(etag=etag, body=JSONResponse(content=jsonable_encoder(content)).body)
+    
+    def to_response(self, request: Request) -> Response:
+        """
+        Answer a request with this body, or 304 if the client's copy is current.
+        
+        Args:
+            request: Incoming request (If-None-Match)
+        
+        Returns:
+            JSON or 304 Not Modified response carrying the ETag headers
+        """
+        headers = etag_headers(self.etag)
+        if self.etag is not None and etag_matches(request.headers.get("if-none-match"), self.etag):
+            return Response(status_code=304, headers=headers)
+        return Response(content=self.body, media_type="application/json", headers=headers)
+
+
+class ResponseCache:
+    """
+    Response cache with per-owner generation counters and stampede protection.
+    
+    On a miss, only the request holding a short lock renders the response;
+    concurrent requests for the same key wait for its result instead of
+    running the same queries.
+    """
+    
+    def __init__(
+        self,
+        client: Any,
+        ttl_seconds: float,
+        lock_seconds: float,
+        wait_interval_seconds: float = 0.01
+    ):
+        self.client = client
+        self.ttl_seconds = ttl_seconds
+        self.lock_seconds = lock_seconds
+        self.wait_interval_seconds = wait_interval_seconds
+        self._stats_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.waits = 0
+        self.errors = 0
+    
+    @property
+    def enabled(self) -> bool:
+        """Whether responses are cached at all."""
+        return self.client is not None and self.ttl_seconds > 0
+    
+    def _count(self, counter: str) -> None:
+        with self._stats_lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+    
+    def _error(self, operation: str, exc: Exception) -> None:
+        self._count("errors")
+        logger.warning("Response cache %s failed: %s", operation, exc)
+    
+    def key(self, kind: str, principal: TokenData, request: Request, scopes: Sequence[Any]) -> Optional[str]:
+        """
+        Build the cache key of a read.
+        
+        Args:
+            kind: Response kind, e.g. "tasks" or "statistics"
+            principal: Current authenticated principal
+            request: Incoming request (normalized query parameters)
+            scopes: Generation scopes (owner user ids or ALL_TASKS) the response depends on
+        
+        Returns:
+            Cache key, or None if the cache is unavailable
+        """
+        if not self.enabled:
+            return None
+        try:
+            generations = self.client.mget([f"taskgen:{scope}" for scope in scopes])
+        except redis.RedisError as exc:
+            self._error("key", exc)
+            return None
+        
+        query = sorted(request.query_params.multi_items())
+        raw = json.dumps(
+            [principal.id, principal.role, query, [str(scope) for scope in scopes],
+             [generation.decode("ascii") if generation else "0" for generation in generations]],
+            separators=(",", ":")
+        )
+        return f"response:{kind}:{hashlib.sha256(raw.encode('utf-8')).hexdigest()}"
+    
+    async def akey(self, kind: str, principal: TokenData, request: Request, scopes: Sequence[Any]) -> Optional[str]:
+        """Async variant of key()."""
+        if not self.enabled:
+            return None
+        return await run_in_threadpool(self.key, kind, principal, request, scopes)
+    
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """
+        Get a cached response.
+        
+        Args:
+            key: Cache key from key()
+        
+        Returns:
+            Cached response or None
+        """
+        try:
+            raw = self.client.get(key)
+        except redis.RedisError as exc:
+            self._error("get", exc)
+            return None
+        return CachedResponse.decode(raw) if raw is not None else None
+    
+    def set(self, key: str, entry: CachedResponse) -> None:
+        """
+        Store a rendered response.
+        
+        Args:
+            key: Cache key from key()
+            entry: Rendered response
+        """
+        try:
+            self.client.set(key, entry.encode(), px=int(self.ttl_seconds * 1000))
+        except redis.RedisError as exc:
+            self._error("set", exc)
+    
+    def acquire(self, key: str) -> bool:
+        """
+        Try to take the render lock of a key.
+        
+        Returns:
+            True if this request should render the response (also when Redis fails)
+        """
+        try:
+            return bool(self.client.set(f"{key}:lock", b"1", px=int(self.lock_seconds * 1000), nx=True))
+        except redis.RedisError as exc:
+            self._error("lock", exc)
+            return True
+    
+    def release(self, key: str) -> None:
+        """Release the render lock of a key."""
+        try:
+            self.client.delete(f"{key}:lock")
+        except redis.RedisError as exc:
+            self._error("unlock", exc)
+    
+    def fetch(self, key: Optional[str], render: Callable[[], CachedResponse]) -> CachedResponse:
+        """
+        Get a response from the cache, rendering and storing it on a miss.
+        
+        Args:
+            key: Cache key from key(), or None to render uncached
+            render: Builds the response; runs at most once per key and lock period
+        
+        Returns:
+            Cached or freshly rendered response
+        """
+        if key is None:
+            return render()
+        
+        entry = self._lookup(key)
+        if entry is not None:
+            return entry
+        if not self.acquire(key):
+            # The holder failed or is too slow: render without caching
+            return self._wait(key) or render()
+        
+        try:
+            entry = render()
+            self.set(key, entry)
+            return entry
+        finally:
+            self.release(key)
+    
+    async def afetch(self, key: Optional[str], render: Callable[[], Awaitable[CachedResponse]]) -> CachedResponse:
+        """
+        Async variant of fetch() for routes on AsyncSession.
+        
+        Redis calls run in the thread pool; render is awaited on the event loop.
+        """
+        if key is None:
+            return await render()
+        
+        entry = await run_in_threadpool(self._lookup, key)
+        if entry is not None:
+            return entry
+        if not await run_in_threadpool(self.acquire, key):
+            return await run_in_threadpool(self._wait, key) or await render()
+        
+        try:
+            entry = await render()
+            await run_in_threadpool(self.set, key, entry)
+            return entry
+        finally:
+            await run_in_threadpool(self.release, key)
+    
+    def _lookup(self, key: str) -> Optional[CachedResponse]:
+        entry = self.get(key)
+        self._count("misses" if entry is None else "hits")
+        return entry
+    
+    def _wait(self, key: str) -> Optional[CachedResponse]:
+        # Another request holds the render lock: poll for its result
+        self._count("waits")
+        deadline = time.monotonic() + self.lock_seconds
+        while time.monotonic() < deadline:
+            time.sleep(self.wait_interval_seconds)
+            entry = self.get(key)
+            if entry is not None:
+                return entry
+        return None
+    
+    def invalidate(self, owner_ids: Iterable[Optional[int]]) -> None:
+        """
+        Bump the generations of task owners after a write.
+        
+        Args:
+            owner_ids: Creators and assignees (old and new) of the written tasks
+        """
+        if self.client is None:
+            return
+        scopes = {ALL_TASKS, *(owner_id for owner_id in owner_ids if owner_id is not None)}
+        try:
+            for scope in scopes:
+                self.client.incr(f"taskgen:{scope}")
+        except redis.RedisError as exc:
+            # Entries may stay stale until they expire
+            self._error("invalidate", exc)
+    
+    async def ainvalidate(self, owner_ids: Iterable[Optional[int]]) -> None:
+        """Async variant of invalidate()."""
+        await run_in_threadpool(self.invalidate, list(owner_ids))
+    
+    def clear(self) -> None:
+        """Drop all entries and reset the counters (fake client only)."""
+        if isinstance(self.client, FakeRedis):
+            self.client.flushall()
+        with self._stats_lock:
+            self.hits = self.misses = self.waits = self.errors = 0
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache counters.
+        
+        Returns:
+            Dictionary with hits, misses, waits for another render, and errors
+        """
+        with self._stats_lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "backend": "fake" if isinstance(self.client, FakeRedis) else "redis",
+                "hits": self.hits,
+                "misses": self.misses,
+                "waits": self.waits,
+                "errors": self.errors,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "ttl_seconds": self.ttl_seconds,
+            }
+
+
+def _create_client() -> Any:
+    if settings.response_cache_fake_redis:
+        return FakeRedis()
+    # Same server as the rate limiter; short timeouts so an unreachable
+    # Redis only costs a failed lookup
+    return redis.Redis(
+        host=os.getenv("REDIS_HOST", "redis"),
+        port=int(os.getenv("REDIS_PORT", "6379")),
+        socket_connect_timeout=settings.response_cache_socket_timeout_seconds,
+        socket_timeout=settings.response_cache_socket_timeout_seconds
+    )
+
+
+response_cache = ResponseCache(
+    client=_create_client(),
+    ttl_seconds=settings.response_cache_ttl_seconds,
+    lock_seconds=settings.response_cache_lock_seconds
+)
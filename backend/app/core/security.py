@@ -1,52 +1,93 @@
 """
 Security utilities for JWT, password hashing, and authentication.
 """
+import hmac
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 from jose import JWTError, jwt
 import bcrypt
 
 from app.config import settings
+from app.core.cache import token_cache
+from app.core.password_pool import password_pool
+
+
+def _password_bytes(password: str) -> bytes:
+    # Bcrypt has a max length of 72 bytes, truncate if needed
+    return password.encode('utf-8')[:72]
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     Verify a plain password against a hashed password.
     
+    Blocks the calling thread; request handlers use averify_password.
+    
     Args:
         plain_password: Plain text password
         hashed_password: Hashed password from database
         
     Returns:
         bool: True if password matches, False otherwise
+        
+    Raises:
+        ServiceUnavailableException: If the password pool is saturated
     """
-    # Bcrypt has a max length of 72 bytes, truncate if needed
-    password_bytes = plain_password.encode('utf-8')
-    if len(password_bytes) > 72:
-        password_bytes = password_bytes[:72]
+    return password_pool.run(bcrypt.checkpw, _password_bytes(plain_password), hashed_password.encode('utf-8'))
+
+
+async def averify_password(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify a plain password against a hashed password without holding a thread.
     
-    return bcrypt.checkpw(password_bytes, hashed_password.encode('utf-8'))
+    Args:
+        plain_password: Plain text password
+        hashed_password: Hashed password from database
+        
+    Returns:
+        bool: True if password matches, False otherwise
+        
+    Raises:
+        ServiceUnavailableException: If the password pool is saturated
+    """
+    return await password_pool.arun(
+        bcrypt.checkpw, _password_bytes(plain_password), hashed_password.encode('utf-8')
+    )
 
 
 def get_password_hash(password: str) -> str:
     """
     Hash a password using bcrypt.
     
+    Blocks the calling thread; request handlers use aget_password_hash.
+    
     Args:
         password: Plain text password
         
     Returns:
         str: Hashed password
+        
+    Raises:
+        ServiceUnavailableException: If the password pool is saturated
     """
-    # Bcrypt has a max length of 72 bytes, truncate if needed
-    password_bytes = password.encode('utf-8')
-    if len(password_bytes) > 72:
-        password_bytes = password_bytes[:72]
-    
-    # Generate salt and hash password
-    salt = bcrypt.gensalt()
-    hashed = bcrypt.hashpw(password_bytes, salt)
+    return password_pool.run(bcrypt.hashpw, _password_bytes(password), bcrypt.gensalt()).decode('utf-8')
+
+
+async def aget_password_hash(password: str) -> str:
+    """
+    Hash a password using bcrypt without holding a thread.
     
+    Args:
+        password: Plain text password
+        
+    Returns:
+        str: Hashed password
+        
+    Raises:
+        ServiceUnavailableException: If the password pool is saturated
+    """
+    hashed = await password_pool.arun(bcrypt.hashpw, _password_bytes(password), bcrypt.gensalt())
     return hashed.decode('utf-8')
 
 
@@ -80,22 +121,64 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     return encoded_jwt
 
 
+def build_token_claims(user) -> dict:
+    """
+    Build self-contained token claims for a user.
+    
+    Besides the subject (email), the token carries the user id, role and
+    token version so most requests can authorize without reading the
+    users table.
+    
+    Args:
+        user: User to issue the token for
+        
+    Returns:
+        dict: Claims to pass to create_access_token
+    """
+    return {
+        "sub": user.email,
+        "uid": user.id,
+        "role": user.role.value,
+        "tv": user.token_version or 0,
+    }
+
+
 def decode_access_token(token: str) -> Optional[dict]:
     """
     Decode and verify a JWT access token.
     
+    Verified payloads are cached by signature segment until their "exp"
+    claim, so a client resending the same token skips signature checks.
+    A cached entry is only served for the exact same token.
+    
     Args:
         token: JWT token to decode
         
     Returns:
         dict: Decoded token payload or None if invalid
     """
+    signature = token.rpartition(".")[2]
+    cached = token_cache.get(signature)
+    if cached is not None:
+        cached_token, cached_payload = cached
+        if (
+            hmac.compare_digest(cached_token, token)
+            and cached_payload["exp"] > time.time()
+        ):
+            return dict(cached_payload)
+        token_cache.invalidate(signature)
+    
     try:
         payload = jwt.decode(
             token, 
             settings.secret_key, 
             algorithms=[settings.algorithm]
         )
-        return payload
     except JWTError:
         return None
+    
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        token_cache.set(signature, (token, dict(payload)), ttl=exp - time.time())
+    
+    return payload
@@ -0,0 +1,6 @@
+"""
+Async CRUD operations, mirroring app.crud for AsyncSession.
+"""
+from app.crud.aio import user, task, comment
+
+__all__ = ["user", "task", "comment"]
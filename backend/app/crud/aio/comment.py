@@ -0,0 +1,194 @@
+"""
+Async CRUD operations for Comment model.
+"""
+from datetime import datetime
+from typing import Optional, List, Sequence, Tuple
+from sqlalchemy import select, update, delete, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+
+from app.crud.comment import (
+    comment_load_options, comment_version_statement, comment_write_clauses, comment_insert_statement,
+    comment_from_row
+)
+from app.crud.user import user_is_live
+from app.db.returning import returning_columns
+from app.models.comment import Comment
+from app.models.user import User
+from app.schemas.comment import CommentCreate, CommentUpdate
+
+
+async def get_comment(db: AsyncSession, comment_id: int) -> Optional[Comment]:
+    """
+    Get comment by ID with relationships loaded.
+    
+    Args:
+        db: Async database session
+        comment_id: Comment ID
+        
+    Returns:
+        Comment object or None if not found
+    """
+    result = await db.execute(
+        select(Comment).options(
+            joinedload(Comment.user)
+        ).where(Comment.id == comment_id, user_is_live(Comment.user_id))
+    )
+    return result.scalars().first()
+
+
+async def get_task_comments(
+    db: AsyncSession,
+    task_id: int,
+    skip: int = 0,
+    limit: int = 100,
+    columns: Optional[Sequence[str]] = None
+) -> tuple[List[Comment], int]:
+    """
+    Get all comments for a specific task with total count.
+    
+    Args:
+        db: Async database session
+        task_id: Task ID
+        skip: Number of records to skip
+        limit: Maximum number of records to return
+        columns: Sparse fieldset to load (see comment_load_options)
+        
+    Returns:
+        Tuple of (List of Comment objects, total count)
+    """
+    total = (await db.execute(
+        select(func.count(Comment.id)).where(Comment.task_id == task_id, user_is_live(Comment.user_id))
+    )).scalar_one()
+    
+    result = await db.execute(
+        select(Comment)
+        .options(*comment_load_options(columns))
+        .where(Comment.task_id == task_id, user_is_live(Comment.user_id))
+        .order_by(Comment.created_at.asc())
+        .offset(skip)
+        .limit(limit)
+    )
+    return list(result.scalars().all()), total
+
+
+async def get_task_comments_version(
+    db: AsyncSession,
+    task_id: int
+) -> Tuple[int, Optional[datetime], Optional[datetime]]:
+    """
+    Get the version of a task's comments, for ETags.
+    
+    Args:
+        db: Async database session
+        task_id: Task ID
+        
+    Returns:
+        Tuple of (count, latest comment update, latest author update)
+    """
+    result = await db.execute(comment_version_statement(task_id))
+    return tuple(result.one())
+
+
+async def create_comment(
+    db: AsyncSession,
+    comment: CommentCreate,
+    task_id: int,
+    user_id: int,
+    assigned_only: bool = False,
+    author: Optional[User] = None
+) -> Optional[Comment]:
+    """
+    Create a new comment on a task with one INSERT ... RETURNING.
+    
+    Args:
+        db: Async database session
+        comment: Comment creation schema
+        task_id: Task ID
+        user_id: ID of the user creating the comment
+        assigned_only: Only comment if the task is assigned to the user
+        author: The loaded user, for the response (read by ID if not given)
+        
+    Returns:
+        Created Comment object (detached), or None if the task did not qualify
+    """
+    row = (await db.execute(comment_insert_statement(comment.content, task_id, user_id, assigned_only))).first()
+    if row is None:
+        await db.rollback()
+        return None
+    
+    # Lazy loads are not available in async: the author is loaded explicitly
+    db_comment = comment_from_row(row, author or await db.get(User, user_id))
+    await db.commit()
+    return db_comment
+
+
+async def update_comment(
+    db: AsyncSession,
+    comment_id: int,
+    comment_update: CommentUpdate,
+    task_id: Optional[int] = None,
+    user_id: Optional[int] = None,
+    author: Optional[User] = None
+) -> Optional[Comment]:
+    """
+    Update a comment with one UPDATE ... RETURNING.
+    
+    Args:
+        db: Async database session
+        comment_id: Comment ID
+        comment_update: Comment update schema
+        task_id: Task the comment must belong to
+        user_id: Author, who must also be assigned the task
+        author: The loaded author, for the response (read by ID if not given)
+        
+    Returns:
+        Updated Comment object (detached), or None if no comment matched
+    """
+    update_data = comment_update.model_dump(exclude_unset=True)
+    row = (await db.execute(
+        update(Comment)
+        .where(*comment_write_clauses(comment_id, task_id, user_id))
+        .values(**update_data)
+        .returning(*returning_columns(Comment))
+        .execution_options(synchronize_session=False)
+    )).first()
+    if row is None:
+        await db.rollback()
+        return None
+    
+    db_comment = comment_from_row(row, author or await db.get(User, row.user_id))
+    await db.commit()
+    return db_comment
+
+
+async def delete_comment(
+    db: AsyncSession,
+    comment_id: int,
+    task_id: Optional[int] = None,
+    user_id: Optional[int] = None
+) -> bool:
+    """
+    Delete a comment with one DELETE.
+    
+    Args:
+        db: Async database session
+        comment_id: Comment ID
+        task_id: Task the comment must belong to
+        user_id: Author, who must also be assigned the task
+        
+    Returns:
+        True if deleted, False if no comment matched
+    """
+    deleted_id = await db.scalar(
+        delete(Comment)
+        .where(*comment_write_clauses(comment_id, task_id, user_id))
+        .returning(Comment.id)
+        .execution_options(synchronize_session="fetch")
+    )
+    if deleted_id is None:
+        await db.rollback()
+        return False
+    
+    await db.commit()
+    return True
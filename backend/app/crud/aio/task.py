@@ -0,0 +1,412 @@
+"""
+Async CRUD operations for Task model.
+"""
+from typing import Optional, List, Dict, Any, Sequence, Tuple
+from datetime import datetime, timezone
+from sqlalchemy import select, insert, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
+
+from app.crud.task import (
+    task_filter_clauses, task_order_by, task_keyset_clause, task_total_column, task_last_updated_column,
+    task_sort_column, task_load_options, task_suggest_clause, task_suggest_order_by,
+    task_version_statement, task_statistics_version_statement, task_deletions_statement,
+    task_bulk_insert_statement, task_bulk_rows, task_bulk_clauses, task_bulk_update_statement,
+    task_delete_statement, task_write_clauses, task_reassign_statement, task_update_statement,
+    build_task_statistics, task_statistics_statement, session_dialect, TaskLoad
+)
+from app.core.response_cache import response_cache
+from app.db.returning import detached
+from app.models.task import Task, TaskDeletion
+from app.schemas.task import TaskCreate, TaskUpdate, TaskFilter
+
+
+async def get_task(
+    db: AsyncSession,
+    task_id: int,
+    columns: Optional[Sequence[str]] = None,
+    load: TaskLoad = TaskLoad.BARE
+) -> Optional[Task]:
+    """
+    Get task by ID.
+    
+    Args:
+        db: Async database session
+        task_id: Task ID
+        columns: Load only these columns
+        load: Loading profile (relationships are not loaded by default)
+        
+    Returns:
+        Task object or None if not found
+    """
+    stmt = select(Task).options(*task_load_options(load, columns))
+    result = await db.execute(stmt.where(Task.id == task_id))
+    return result.scalars().first()
+
+
+def _task_list_statement(
+    entities: Tuple[Any, ...],
+    dialect: str,
+    filters: Optional[TaskFilter],
+    sort_by: str,
+    sort_order: str,
+    after: Optional[Tuple[Any, int]],
+    columns: Optional[Sequence[str]] = None,
+    load: TaskLoad = TaskLoad.BARE
+):
+    """
+    Build the filtered, ordered task list statement shared by get_tasks and get_tasks_page.
+    """
+    # The sort column is also needed to encode the next cursor
+    stmt = (
+        select(*entities)
+        .options(*task_load_options(load, columns, task_sort_column(sort_by).key))
+        .where(*task_filter_clauses(filters, dialect))
+        .order_by(*task_order_by(sort_by, sort_order, filters.search if filters else None, dialect))
+    )
+    if after is not None:
+        stmt = stmt.where(task_keyset_clause(sort_by, sort_order, after))
+    return stmt
+
+
+async def get_tasks(
+    db: AsyncSession,
+    skip: int = 0,
+    limit: int = 100,
+    filters: Optional[TaskFilter] = None,
+    sort_by: str = "created_at",
+    sort_order: str = "desc",
+    after: Optional[Tuple[Any, int]] = None,
+    columns: Optional[Sequence[str]] = None,
+    load: TaskLoad = TaskLoad.BARE
+) -> List[Task]:
+    """
+    Get list of tasks with filtering, sorting, and pagination.
+    
+    Args:
+        db: Async database session
+        skip: Number of records to skip
+        limit: Maximum number of records to return
+        filters: Task filter schema
+        sort_by: Field to sort by
+        sort_order: Sort order (asc/desc)
+        after: Decoded cursor (sort value, id) to continue after
+        columns: Load only these columns (sparse fieldset)
+        load: Loading profile (relationships are not loaded by default)
+        
+    Returns:
+        List of Task objects
+    """
+    stmt = _task_list_statement((Task,), session_dialect(db), filters, sort_by, sort_order, after, columns, load)
+    result = await db.execute(stmt.offset(skip).limit(limit))
+    return list(result.scalars().all())
+
+
+async def get_tasks_page(
+    db: AsyncSession,
+    skip: int = 0,
+    limit: int = 100,
+    filters: Optional[TaskFilter] = None,
+    sort_by: str = "created_at",
+    sort_order: str = "desc",
+    after: Optional[Tuple[Any, int]] = None,
+    columns: Optional[Sequence[str]] = None,
+    load: TaskLoad = TaskLoad.BARE
+) -> Tuple[List[Task], int, Optional[datetime]]:
+    """
+    Get a page of tasks together with the filtered total in one query.
+    
+    Same arguments as get_tasks. Only a page past the end falls back to
+    a separate count query.
+    
+    Returns:
+        Tuple of (list of Task objects, total count of matching tasks,
+        latest updated_at of matching tasks)
+    """
+    dialect = session_dialect(db)
+    entities = (Task, task_total_column(filters, dialect), task_last_updated_column(filters, dialect))
+    stmt = _task_list_statement(entities, dialect, filters, sort_by, sort_order, after, columns, load)
+    result = await db.execute(stmt.offset(skip).limit(limit))
+    rows = result.all()
+    
+    if rows:
+        return [row.Task for row in rows], rows[0].total, rows[0].last_updated
+    if skip == 0 and after is None:
+        return [], 0, None
+    return [], *await get_tasks_version(db, filters=filters)
+
+
+async def suggest_tasks(
+    db: AsyncSession,
+    q: str,
+    filters: Optional[TaskFilter] = None,
+    limit: int = 10
+) -> List[Task]:
+    """
+    Get the tasks whose titles best match a typeahead input.
+    
+    Args:
+        db: Async database session
+        q: Text typed so far
+        filters: Task filter schema (visibility)
+        limit: Maximum number of suggestions
+        
+    Returns:
+        List of Task objects, best match first
+    """
+    dialect = session_dialect(db)
+    result = await db.execute(
+        select(Task)
+        .options(load_only(Task.id, Task.title))
+        .where(*task_filter_clauses(filters, dialect), task_suggest_clause(q, dialect))
+        .order_by(*task_suggest_order_by(q, dialect))
+        .limit(limit)
+    )
+    return list(result.scalars().all())
+
+
+async def get_tasks_count(db: AsyncSession, filters: Optional[TaskFilter] = None) -> int:
+    """
+    Get total count of tasks matching filters.
+    
+    Args:
+        db: Async database session
+        filters: Task filter schema
+        
+    Returns:
+        Count of tasks
+    """
+    result = await db.execute(
+        select(func.count(Task.id)).where(*task_filter_clauses(filters, session_dialect(db)))
+    )
+    return result.scalar_one()
+
+
+async def get_tasks_version(db: AsyncSession, filters: Optional[TaskFilter] = None) -> Tuple[int, Optional[datetime]]:
+    """
+    Get the version of the tasks matching filters, for ETags.
+    
+    Args:
+        db: Async database session
+        filters: Task filter schema
+        
+    Returns:
+        Tuple of (count, latest updated_at)
+    """
+    result = await db.execute(task_version_statement(filters, session_dialect(db)))
+    return tuple(result.one())
+
+
+async def get_task_statistics_version(db: AsyncSession, user_id: Optional[int] = None) -> Tuple[int, Optional[datetime], int]:
+    """
+    Get the version of the task statistics, for ETags.
+    
+    Args:
+        db: Async database session
+        user_id: Optional user ID to filter statistics
+        
+    Returns:
+        Tuple of (count, latest updated_at, overdue count)
+    """
+    now = datetime.now(timezone.utc)
+    result = await db.execute(task_statistics_version_statement(user_id, now))
+    return tuple(result.one())
+
+
+async def get_deleted_task_ids(
+    db: AsyncSession,
+    deleted_after: datetime,
+    filters: Optional[TaskFilter] = None
+) -> List[int]:
+    """
+    Get the ids of tasks deleted from the filtered set after a time.
+    
+    Args:
+        db: Async database session
+        deleted_after: Deletion log watermark from a sync token
+        filters: Task filter schema (assignee scope)
+        
+    Returns:
+        List of task ids
+    """
+    result = await db.scalars(task_deletions_statement(deleted_after, filters, session_dialect(db)))
+    return list(result)
+
+
+async def create_task(db: AsyncSession, task: TaskCreate, creator_id: int) -> Task:
+    """
+    Create a new task with a single INSERT ... RETURNING.
+    
+    Args:
+        db: Async database session
+        task: Task creation schema
+        creator_id: ID of the user creating the task
+        
+    Returns:
+        Created Task object
+    """
+    return (await create_tasks(db, [task], creator_id))[0]
+
+
+async def create_tasks(db: AsyncSession, tasks: Sequence[TaskCreate], creator_id: int) -> List[Task]:
+    """
+    Create many tasks in one transaction with multi-row INSERT ... RETURNING.
+    
+    Args:
+        db: Async database session
+        tasks: Validated task creation schemas
+        creator_id: ID of the user creating the tasks
+        
+    Returns:
+        Created Task objects, in the order given
+    """
+    if not tasks:
+        return []
+    
+    dialect = session_dialect(db)
+    db_tasks = list(await db.scalars(task_bulk_insert_statement(dialect), task_bulk_rows(tasks, creator_id)))
+    if dialect == "sqlite":
+        db_tasks.sort(key=lambda db_task: db_task.id)
+    await db.commit()
+    await response_cache.ainvalidate([creator_id, *(task.assigned_to for task in tasks)])
+    return db_tasks
+
+
+async def update_task(
+    db: AsyncSession,
+    task_id: int,
+    task_update: TaskUpdate,
+    owner_id: Optional[int] = None
+) -> Optional[Task]:
+    """
+    Update task information with one UPDATE ... RETURNING.
+    
+    Args:
+        db: Async database session
+        task_id: Task ID
+        task_update: Task update schema
+        owner_id: Only update the task if it is assigned to this user
+        
+    Returns:
+        Updated Task object (detached), or None if no task matched
+    """
+    update_data = task_update.model_dump(exclude_unset=True)
+    clauses = task_write_clauses(task_id, owner_id)
+    
+    # Tombstone for delta syncs of the previous assignee
+    previous_assignee = None
+    if "assigned_to" in update_data:
+        previous_assignee = await db.scalar(task_reassign_statement(clauses, update_data["assigned_to"]))
+    
+    row = (await db.execute(task_update_statement(clauses, update_data))).first()
+    if row is None:
+        await db.rollback()
+        return None
+    
+    await db.commit()
+    db_task = detached(Task, row._mapping)
+    await response_cache.ainvalidate([db_task.created_by, db_task.assigned_to, previous_assignee])
+    return db_task
+
+
+async def delete_task(db: AsyncSession, task_id: int, owner_id: Optional[int] = None) -> bool:
+    """
+    Delete a task and its comments without loading them.
+    
+    Args:
+        db: Async database session
+        task_id: Task ID
+        owner_id: Only delete the task if it is assigned to this user
+        
+    Returns:
+        True if deleted, False if no task matched
+    """
+    row = (await db.execute(task_delete_statement(task_write_clauses(task_id, owner_id)))).first()
+    if row is None:
+        await db.rollback()
+        return False
+    
+    await db.execute(insert(TaskDeletion).values(task_id=row.id, assigned_to=row.assigned_to))
+    await db.commit()
+    await response_cache.ainvalidate([row.created_by, row.assigned_to])
+    return True
+
+
+async def update_tasks(
+    db: AsyncSession,
+    owner_id: int,
+    task_update: TaskUpdate,
+    ids: Optional[Sequence[int]] = None,
+    filters: Optional[TaskFilter] = None
+) -> List[int]:
+    """
+    Update every selected task assigned to a user with one UPDATE ... RETURNING.
+    
+    Args:
+        db: Async database session
+        owner_id: Current user ID (only their tasks are updated)
+        task_update: Task update schema
+        ids: Explicit task IDs
+        filters: Task filter schema, used when no IDs are given
+        
+    Returns:
+        IDs of the updated tasks
+    """
+    values = task_update.model_dump(exclude_unset=True)
+    result = await db.execute(task_bulk_update_statement(task_bulk_clauses(owner_id, ids, filters, session_dialect(db)), values))
+    rows = result.all()
+    updated_ids = [row.id for row in rows]
+    # Tombstones for delta syncs when the tasks leave the owner's list
+    if updated_ids and values.get("assigned_to", owner_id) != owner_id:
+        await db.execute(
+            insert(TaskDeletion), [{"task_id": task_id, "assigned_to": owner_id} for task_id in updated_ids]
+        )
+    await db.commit()
+    if updated_ids:
+        await response_cache.ainvalidate({owner_id, values.get("assigned_to"), *(row.created_by for row in rows)})
+    return updated_ids
+
+
+async def delete_tasks(
+    db: AsyncSession,
+    owner_id: int,
+    ids: Optional[Sequence[int]] = None,
+    filters: Optional[TaskFilter] = None
+) -> List[int]:
+    """
+    Delete every selected task assigned to a user, with its comments.
+    
+    Args:
+        db: Async database session
+        owner_id: Current user ID (only their tasks are deleted)
+        ids: Explicit task IDs
+        filters: Task filter schema, used when no IDs are given
+        
+    Returns:
+        IDs of the deleted tasks
+    """
+    rows = (await db.execute(task_delete_statement(task_bulk_clauses(owner_id, ids, filters, session_dialect(db))))).all()
+    deleted_ids = [row.id for row in rows]
+    if deleted_ids:
+        await db.execute(
+            insert(TaskDeletion), [{"task_id": task_id, "assigned_to": owner_id} for task_id in deleted_ids]
+        )
+    await db.commit()
+    if deleted_ids:
+        await response_cache.ainvalidate({owner_id, *(row.created_by for row in rows)})
+    return deleted_ids
+
+
+async def get_task_statistics(db: AsyncSession, user_id: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Get task statistics with one aggregate query.
+    
+    Args:
+        db: Async database session
+        user_id: Optional user ID to filter statistics
+        
+    Returns:
+        Dictionary with statistics
+    """
+    row = (await db.execute(task_statistics_statement(user_id, datetime.now(timezone.utc)))).one()
+    return build_task_statistics(**row._mapping)
@@ -0,0 +1,179 @@
+"""
+Async CRUD operations for User model.
+"""
+from typing import Optional, List
+from sqlalchemy import select, insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.purge_job import PurgeJob
+from app.models.user import User
+from app.core.cache import principal_cache, token_version_cache
+from app.core.response_cache import response_cache
+from app.core.security import aget_password_hash, averify_password
+from app.crud.user import (
+    user_update_statement, user_update_values, user_soft_delete_statement, purge_job_insert_statement
+)
+from app.db.returning import detached, returning_columns
+from app.schemas.user import UserCreate, UserUpdate
+
+
+async def get_user(db: AsyncSession, user_id: int) -> Optional[User]:
+    """
+    Get user by ID.
+    
+    Args:
+        db: Async database session
+        user_id: User ID
+        
+    Returns:
+        User object or None if not found
+    """
+    result = await db.execute(select(User).where(User.id == user_id, User.deleted_at.is_(None)))
+    return result.scalars().first()
+
+
+async def get_user_by_email(db: AsyncSession, email: str) -> Optional[User]:
+    """
+    Get user by email.
+    
+    Args:
+        db: Async database session
+        email: User email
+        
+    Returns:
+        User object or None if not found
+    """
+    result = await db.execute(select(User).where(User.email == email, User.deleted_at.is_(None)))
+    return result.scalars().first()
+
+
+async def get_users(db: AsyncSession, skip: int = 0, limit: int = 100) -> List[User]:
+    """
+    Get list of users with pagination.
+    
+    Args:
+        db: Async database session
+        skip: Number of records to skip
+        limit: Maximum number of records to return
+        
+    Returns:
+        List of User objects
+    """
+    result = await db.execute(select(User).where(User.deleted_at.is_(None)).offset(skip).limit(limit))
+    return list(result.scalars().all())
+
+
+async def create_user(db: AsyncSession, user: UserCreate) -> Optional[User]:
+    """
+    Create a new user with one INSERT ... RETURNING.
+    
+    Args:
+        db: Async database session
+        user: User creation schema
+        
+    Returns:
+        Created User object (detached), or None if the email is already registered
+    """
+    hashed_password = await aget_password_hash(user.password)
+    try:
+        result = await db.execute(
+            insert(User)
+            .values(
+                email=user.email,
+                hashed_password=hashed_password,
+                full_name=user.full_name,
+                role=user.role,
+                is_active=True
+            )
+            .returning(*returning_columns(User))
+        )
+        row = result.one()
+    except IntegrityError:
+        await db.rollback()
+        return None
+    
+    await db.commit()
+    return detached(User, row._mapping)
+
+
+async def update_user(db: AsyncSession, user_id: int, user_update: UserUpdate) -> Optional[User]:
+    """
+    Update user information with one UPDATE ... RETURNING.
+    
+    Args:
+        db: Async database session
+        user_id: User ID
+        user_update: User update schema
+        
+    Returns:
+        Updated User object (detached), or None if not found
+    """
+    update_data = user_update.model_dump(exclude_unset=True)
+    
+    # Hash password if provided
+    if "password" in update_data:
+        update_data["hashed_password"] = await aget_password_hash(update_data.pop("password"))
+    
+    previous_email = None
+    if "email" in update_data:
+        previous_email = await db.scalar(select(User.email).where(User.id == user_id, User.deleted_at.is_(None)))
+    
+    row = (await db.execute(user_update_statement(user_id, user_update_values(update_data)))).first()
+    if row is None:
+        await db.rollback()
+        return None
+    
+    await db.commit()
+    if previous_email is not None:
+        principal_cache.invalidate(previous_email)
+    principal_cache.invalidate(row.email)
+    token_version_cache.invalidate(user_id)
+    return detached(User, row._mapping)
+
+
+async def soft_delete_user(db: AsyncSession, user_id: int, requested_by: Optional[int] = None) -> Optional[PurgeJob]:
+    """
+    Mark a user deleted and queue the removal of their data.
+    
+    Args:
+        db: Async database session
+        user_id: User ID
+        requested_by: ID of the principal requesting the deletion
+        
+    Returns:
+        Created PurgeJob object (detached), or None if not found
+    """
+    email = (await db.execute(user_soft_delete_statement(user_id))).scalar()
+    if email is None:
+        await db.rollback()
+        return None
+    
+    row = (await db.execute(purge_job_insert_statement(user_id, requested_by))).one()
+    await db.commit()
+    principal_cache.invalidate(email)
+    token_version_cache.invalidate(user_id)
+    await response_cache.ainvalidate([user_id])
+    return detached(PurgeJob, row._mapping)
+
+
+async def authenticate_user(db: AsyncSession, email: str, password: str) -> Optional[User]:
+    """
+    Authenticate a user with email and password.
+    
+    Args:
+        db: Async database session
+        email: User email
+        password: Plain text password
+        
+    Returns:
+        User object if authenticated, None otherwise
+    """
+    user = await get_user_by_email(db, email)
+    if not user:
+        return None
+    if not await averify_password(password, user.hashed_password):
+        return None
+    if not user.is_active:
+        return None
+    return user
@@ -1,10 +1,19 @@
 """
 CRUD operations for Comment model.
 """
-from typing import Optional, List
-from sqlalchemy.orm import Session, joinedload
+from datetime import datetime
+from typing import Optional, List, Sequence, Tuple
+from sqlalchemy import select, insert, update, delete, func, literal
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session, joinedload, load_only
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.sql.elements import ColumnElement
 
+from app.crud.user import user_snapshot, user_is_live
+from app.db.returning import detached, returning_columns
 from app.models.comment import Comment
+from app.models.task import Task
+from app.models.user import User
 from app.schemas.comment import CommentCreate, CommentUpdate
 
 
@@ -21,14 +30,35 @@ def get_comment(db: Session, comment_id: int) -> Optional[Comment]:
     """
     return db.query(Comment).options(
         joinedload(Comment.user)
-    ).filter(Comment.id == comment_id).first()
+    ).filter(Comment.id == comment_id, user_is_live(Comment.user_id)).first()
+
+
+def comment_load_options(columns: Optional[Sequence[str]] = None) -> list:
+    """
+    Build loader options for a comment listing.
+    
+    Args:
+        columns: Sparse fieldset; "user" joins the author, other names are columns
+        
+    Returns:
+        List of loader options (the author is joined unless a fieldset omits it)
+    """
+    if columns is None:
+        return [joinedload(Comment.user)]
+    
+    names = [name for name in columns if name != "user"]
+    options = [load_only(Comment.id, *(getattr(Comment, name) for name in names))]
+    if "user" in columns:
+        options.append(joinedload(Comment.user))
+    return options
 
 
 def get_task_comments(
     db: Session,
     task_id: int,
     skip: int = 0,
-    limit: int = 100
+    limit: int = 100,
+    columns: Optional[Sequence[str]] = None
 ) -> tuple[List[Comment], int]:
     """
     Get all comments for a specific task with total count.
@@ -38,13 +68,14 @@ def get_task_comments(
         task_id: Task ID
         skip: Number of records to skip
         limit: Maximum number of records to return
+        columns: Sparse fieldset to load (see comment_load_options)
         
     Returns:
         Tuple of (List of Comment objects, total count)
     """
     query = db.query(Comment).options(
-        joinedload(Comment.user)
-    ).filter(Comment.task_id == task_id)
+        *comment_load_options(columns)
+    ).filter(Comment.task_id == task_id, user_is_live(Comment.user_id))
     
     total = query.count()
     
@@ -55,80 +86,205 @@ def get_task_comments(
     return comments, total
 
 
+def comment_version_statement(task_id: int):
+    """
+    Build the query versioning a task's comment list.
+    
+    Count and latest updated_at of the comments, plus the latest
+    updated_at of their authors, whose names are embedded in the list.
+    Comments of deleted users are left out, as in the list.
+    """
+    return (
+        select(func.count(Comment.id), func.max(Comment.updated_at), func.max(User.updated_at))
+        .select_from(Comment)
+        .join(User, Comment.user_id == User.id)
+        .where(Comment.task_id == task_id, User.deleted_at.is_(None))
+    )
+
+
+def get_task_comments_version(
+    db: Session,
+    task_id: int
+) -> Tuple[int, Optional[datetime], Optional[datetime]]:
+    """
+    Get the version of a task's comments, for ETags.
+    
+    Args:
+        db: Database session
+        task_id: Task ID
+        
+    Returns:
+        Tuple of (count, latest comment update, latest author update)
+    """
+    return tuple(db.execute(comment_version_statement(task_id)).one())
+
+
+def comment_write_clauses(
+    comment_id: int,
+    task_id: Optional[int] = None,
+    user_id: Optional[int] = None
+) -> List[ColumnElement]:
+    """
+    Build the WHERE clauses of a comment update or delete.
+    
+    The route's permission checks are part of the statement: the comment
+    belongs to the task, and the user wrote it and is the task's assignee.
+    
+    Args:
+        comment_id: Comment ID
+        task_id: Task the comment must belong to
+        user_id: Author, who must also be assigned the task
+        
+    Returns:
+        List of SQL boolean expressions
+    """
+    clauses = [Comment.id == comment_id]
+    if task_id is not None:
+        clauses.append(Comment.task_id == task_id)
+    if user_id is not None:
+        clauses.append(Comment.user_id == user_id)
+        clauses.append(select(Task.id).where(Task.id == Comment.task_id, Task.assigned_to == user_id).exists())
+    return clauses
+
+
+def comment_insert_statement(content: str, task_id: int, user_id: int, assigned_only: bool = False):
+    """
+    Build the INSERT ... SELECT adding a comment to an existing task.
+    
+    No row is inserted if the task does not exist or, with assigned_only,
+    is not assigned to the author.
+    """
+    task_clauses = [Task.id == task_id]
+    if assigned_only:
+        task_clauses.append(Task.assigned_to == user_id)
+    return (
+        insert(Comment)
+        .from_select(
+            ["content", "task_id", "user_id"],
+            select(literal(content, Comment.content.type), Task.id, literal(user_id, Comment.user_id.type))
+            .where(*task_clauses)
+        )
+        .returning(*returning_columns(Comment))
+    )
+
+
+def comment_from_row(row: Row, author: Optional[User]) -> Comment:
+    """
+    Build the response object of a comment write from its RETURNING row.
+    
+    Args:
+        row: Comment columns returned by the write
+        author: Loaded author (copied, so committing does not expire it)
+        
+    Returns:
+        Detached Comment with its author
+    """
+    db_comment = detached(Comment, row._mapping)
+    if author is not None:
+        author = detached(User, user_snapshot(author))
+    set_committed_value(db_comment, "user", author)
+    return db_comment
+
+
 def create_comment(
     db: Session,
     comment: CommentCreate,
     task_id: int,
-    user_id: int
-) -> Comment:
+    user_id: int,
+    assigned_only: bool = False,
+    author: Optional[User] = None
+) -> Optional[Comment]:
     """
-    Create a new comment on a task.
+    Create a new comment on a task with one INSERT ... RETURNING.
     
     Args:
         db: Database session
         comment: Comment creation schema
         task_id: Task ID
         user_id: ID of the user creating the comment
+        assigned_only: Only comment if the task is assigned to the user
+        author: The loaded user, for the response (read by ID if not given)
         
     Returns:
-        Created Comment object
+        Created Comment object (detached), or None if the task did not qualify
     """
-    db_comment = Comment(
-        content=comment.content,
-        task_id=task_id,
-        user_id=user_id
-    )
-    db.add(db_comment)
+    row = db.execute(comment_insert_statement(comment.content, task_id, user_id, assigned_only)).first()
+    if row is None:
+        db.rollback()
+        return None
+    
+    db_comment = comment_from_row(row, author or db.get(User, user_id))
     db.commit()
-    db.refresh(db_comment)
     return db_comment
 
 
 def update_comment(
     db: Session,
     comment_id: int,
-    comment_update: CommentUpdate
+    comment_update: CommentUpdate,
+    task_id: Optional[int] = None,
+    user_id: Optional[int] = None,
+    author: Optional[User] = None
 ) -> Optional[Comment]:
     """
-    Update a comment.
+    Update a comment with one UPDATE ... RETURNING.
     
     Args:
         db: Database session
         comment_id: Comment ID
         comment_update: Comment update schema
+        task_id: Task the comment must belong to
+        user_id: Author, who must also be assigned the task
+        author: The loaded author, for the response (read by ID if not given)
         
     Returns:
-        Updated Comment object or None if not found
+        Updated Comment object (detached), or None if no comment matched
     """
-    db_comment = get_comment(db, comment_id)
-    if not db_comment:
-        return None
-    
     # Update only provided fields
     update_data = comment_update.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_comment, field, value)
+    row = db.execute(
+        update(Comment)
+        .where(*comment_write_clauses(comment_id, task_id, user_id))
+        .values(**update_data)
+        .returning(*returning_columns(Comment))
+        .execution_options(synchronize_session=False)
+    ).first()
+    if row is None:
+        db.rollback()
+        return None
     
+    db_comment = comment_from_row(row, author or db.get(User, row.user_id))
     db.commit()
-    db.refresh(db_comment)
     return db_comment
 
 
-def delete_comment(db: Session, comment_id: int) -> bool:
+def delete_comment(
+    db: Session,
+    comment_id: int,
+    task_id: Optional[int] = None,
+    user_id: Optional[int] = None
+) -> bool:
     """
-    Delete a comment.
+    Delete a comment with one DELETE.
     
     Args:
         db: Database session
         comment_id: Comment ID
+        task_id: Task the comment must belong to
+        user_id: Author, who must also be assigned the task
         
     Returns:
-        True if deleted, False if not found
+        True if deleted, False if no comment matched
     """
-    db_comment = get_comment(db, comment_id)
-    if not db_comment:
+    deleted_id = db.scalar(
+        delete(Comment)
+        .where(*comment_write_clauses(comment_id, task_id, user_id))
+        .returning(Comment.id)
+        .execution_options(synchronize_session="fetch")
+    )
+    if deleted_id is None:
+        db.rollback()
         return False
     
-    db.delete(db_comment)
     db.commit()
     return True
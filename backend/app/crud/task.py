@@ -1,44 +1,478 @@
 """
 CRUD operations for Task model.
 """
-from typing import Optional, List, Dict, Any
+import enum
+import re
+from typing import Optional, List, Dict, Any, Iterator, Sequence, Tuple
 from datetime import datetime, timezone
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import or_, func, and_
+from sqlalchemy.orm import Session, joinedload, load_only, raiseload, with_expression
+from sqlalchemy import select, insert, update, delete, or_, func, and_, tuple_, literal, case, false, DateTime, Enum as SQLEnum
+from sqlalchemy.engine import Row
+from sqlalchemy.sql.elements import ColumnElement
 
-from app.models.task import Task, TaskPriority
+from app.core.response_cache import response_cache
+from app.crud.user import user_is_live
+from app.db.returning import detached, returning_columns
+from app.models.comment import Comment
+from app.models.task import Task, TaskDeletion, TaskPriority
 from app.models.user import User
-from app.schemas.task import TaskCreate, TaskUpdate, TaskFilter
+from app.schemas.task import TaskCreate, TaskUpdate, TaskFilter, TaskSortField
+from app.utils.cursor import encode_cursor, decode_cursor
 
 
-def get_task(db: Session, task_id: int) -> Optional[Task]:
+# sort_by value ordering search results by rank
+RELEVANCE_SORT = TaskSortField.RELEVANCE.value
+
+
+class TaskLoad(str, enum.Enum):
+    """Relationship loading profiles for task reads."""
+    BARE = "bare"                    # task columns only
+    USERS = "users"                  # creator and assignee joined
+    COMMENT_COUNT = "comment_count"  # Task.comment_count populated
+
+
+def task_search_query(search: str) -> Optional[str]:
+    """
+    Turn search box input into a prefix-matching tsquery expression.
+    
+    Every word must match, and the last word may still be incomplete
+    while typing, so each word matches as a prefix ("urg ta" becomes
+    "urg:* & ta:*"). Operators in the input are dropped.
+    
+    Args:
+        search: Raw search term
+        
+    Returns:
+        tsquery text, or None if the term contains no words
+    """
+    words = re.findall(r"[^\W_]+", search)
+    if not words:
+        return None
+    return " & ".join(f"{word}:*" for word in words)
+
+
+def session_dialect(db) -> str:
+    """
+    Get the name of the database dialect a session's queries run on.
+    
+    Args:
+        db: Sync or async database session
+        
+    Returns:
+        Dialect name, e.g. "postgresql" or "sqlite"
+    """
+    return db.get_bind().dialect.name
+
+
+def task_search_clause(search: str, dialect: str) -> ColumnElement:
+    """
+    Build the WHERE clause matching a search term against title, description and comments.
+    
+    PostgreSQL searches the trigger-maintained tasks.search_vector; other
+    backends (SQLite in tests) fall back to case-insensitive substring matching.
+    
+    Args:
+        search: Raw search term
+        dialect: Dialect name of the session (see session_dialect)
+        
+    Returns:
+        SQL boolean expression
+    """
+    if dialect == "postgresql":
+        query = task_search_query(search)
+        if query is None:
+            return false()
+        return Task.search_vector.op("@@")(func.to_tsquery("english", query))
+    
+    search_term = f"%{search}%"
+    return or_(
+        Task.title.ilike(search_term),
+        Task.description.ilike(search_term),
+        Task.comments.any(and_(Comment.content.ilike(search_term), user_is_live(Comment.user_id)))
+    )
+
+
+def task_search_rank(search: str, dialect: str) -> ColumnElement:
+    """
+    Build the relevance score of a task for a search term (higher is better).
+    
+    Args:
+        search: Raw search term
+        dialect: Dialect name of the session (see session_dialect)
+        
+    Returns:
+        SQL numeric expression
+    """
+    if dialect == "postgresql":
+        query = task_search_query(search)
+        if query is None:
+            return literal(0)
+        return func.ts_rank(Task.search_vector, func.to_tsquery("english", query))
+    
+    search_term = f"%{search}%"
+    return case(
+        (Task.title.ilike(search_term), 2),
+        (Task.description.ilike(search_term), 1),
+        else_=0
+    )
+
+
+def task_filter_clauses(filters: Optional[TaskFilter], dialect: str) -> List[ColumnElement]:
+    """
+    Build the WHERE clauses for a task filter.
+    
+    Shared by the list and count queries of the sync and async CRUD paths.
+    
+    Args:
+        filters: Task filter schema
+        dialect: Dialect name of the session (see session_dialect)
+        
+    Returns:
+        List of SQL boolean expressions (empty when nothing is filtered)
+    """
+    clauses: List[ColumnElement] = []
+    if not filters:
+        return clauses
+    
+    if filters.completed is not None:
+        # Rendered as a literal so the partial "pending" indexes apply
+        clauses.append(Task.completed.is_(filters.completed))
+    if filters.priority:
+        clauses.append(Task.priority == filters.priority)
+    if filters.created_by:
+        clauses.append(Task.created_by == filters.created_by)
+    if filters.assigned_to:
+        clauses.append(Task.assigned_to == filters.assigned_to)
+    if filters.search:
+        clauses.append(task_search_clause(filters.search, dialect))
+    
+    return clauses
+
+
+# Sortable fields and the indexed column each one orders by; every column
+# has a (assigned_to, column, id) index and ties always break on id
+TASK_SORT_COLUMNS = {
+    TaskSortField.CREATED_AT.value: Task.created_at,
+    TaskSortField.UPDATED_AT.value: Task.updated_at,
+    TaskSortField.DUE_DATE.value: Task.due_date,
+    TaskSortField.PRIORITY.value: Task.priority_rank,
+    TaskSortField.TITLE.value: Task.title,
+}
+
+
+def task_sort_column(sort_by: str = "created_at"):
+    """
+    Get the Task column a list is sorted by.
+    
+    Args:
+        sort_by: Sortable field name (falls back to created_at)
+        
+    Returns:
+        Mapped column attribute
+    """
+    return TASK_SORT_COLUMNS.get(sort_by, Task.created_at)
+
+
+def task_order_by(
+    sort_by: str,
+    sort_order: str,
+    search: Optional[str],
+    dialect: str
+) -> List[ColumnElement]:
+    """
+    Build the ORDER BY expressions for a task list.
+    
+    NULLs always sort last and ties are broken by id in the same
+    direction, so the order is total and usable for keyset pagination.
+    Sorting by relevance puts the best matches for the search term first.
+    
+    Args:
+        sort_by: Field to sort by
+        sort_order: Sort order (asc/desc)
+        search: Search term, used by the relevance sort
+        dialect: Dialect name of the session (see session_dialect)
+        
+    Returns:
+        List of SQL ordering expressions
+    """
+    if sort_by == RELEVANCE_SORT and search:
+        return [task_search_rank(search, dialect).desc(), Task.id.desc()]
+    
+    sort_column = task_sort_column(sort_by)
+    ascending = sort_order.lower() == "asc"
+    
+    order = sort_column.asc() if ascending else sort_column.desc()
+    if sort_column.nullable:
+        # Only on nullable columns: NULLS LAST on a DESC sort would stop
+        # PostgreSQL from reading a NOT NULL column's index backwards
+        order = order.nulls_last()
+    return [order, Task.id.asc() if ascending else Task.id.desc()]
+
+
+def task_keyset_clause(
+    sort_by: str,
+    sort_order: str,
+    after: Tuple[Any, int]
+) -> ColumnElement:
+    """
+    Build the WHERE clause selecting rows after a keyset cursor position.
+    
+    Matches the ordering of task_order_by, including NULLs last.
+    
+    Args:
+        sort_by: Field to sort by
+        sort_order: Sort order (asc/desc)
+        after: (sort value, id) of the last row already returned
+        
+    Returns:
+        SQL boolean expression
+    """
+    sort_column = task_sort_column(sort_by)
+    value, last_id = after
+    ascending = sort_order.lower() == "asc"
+    
+    def beyond(column, bound):
+        return column > bound if ascending else column < bound
+    
+    if value is None:
+        # Only NULLs are left, ordered by id
+        return and_(sort_column.is_(None), beyond(Task.id, last_id))
+    
+    if not sort_column.nullable:
+        # Bind the cursor value with the column's type (enums, datetimes)
+        bound = tuple_(literal(value, sort_column.type), literal(last_id, Task.id.type))
+        return beyond(tuple_(sort_column, Task.id), bound)
+    
+    return or_(
+        beyond(sort_column, value),
+        and_(sort_column == value, beyond(Task.id, last_id)),
+        sort_column.is_(None)
+    )
+
+
+def task_total_column(filters: Optional[TaskFilter], dialect: str) -> ColumnElement:
+    """
+    Build a column carrying the filtered total alongside each page row.
+    
+    This is an uncorrelated scalar subquery, evaluated once per statement.
+    A COUNT(*) OVER () window would also work, but it has to materialize
+    and join every matching row before LIMIT applies, and under a keyset
+    cursor it would only count the remaining rows.
+    
+    Args:
+        filters: Task filter schema
+        dialect: Dialect name of the session (see session_dialect)
+        
+    Returns:
+        Labelled SQL expression named "total"
     """
-    Get task by ID with relationships loaded.
+    return (
+        select(func.count(Task.id))
+        .where(*task_filter_clauses(filters, dialect))
+        .scalar_subquery()
+        .label("total")
+    )
+
+
+def task_last_updated_column(filters: Optional[TaskFilter], dialect: str) -> ColumnElement:
+    """
+    Build a column carrying the filtered set's latest updated_at alongside each page row.
+    
+    With the total it forms the set's version (see task_version_statement),
+    so list responses get an ETag without a second query.
+    
+    Args:
+        filters: Task filter schema
+        dialect: Dialect name of the session (see session_dialect)
+        
+    Returns:
+        Labelled SQL expression named "last_updated"
+    """
+    return (
+        select(func.max(Task.updated_at))
+        .where(*task_filter_clauses(filters, dialect))
+        .scalar_subquery()
+        .label("last_updated")
+    )
+
+
+def encode_task_cursor(task: Task, sort_by: str, sort_order: str) -> Optional[str]:
+    """
+    Build the opaque cursor pointing just after a task.
+    
+    Args:
+        task: Last task of the current page
+        sort_by: Field the page is sorted by
+        sort_order: Sort order (asc/desc)
+        
+    Returns:
+        Cursor token, or None for the relevance sort (offset paging only)
+    """
+    if sort_by == RELEVANCE_SORT:
+        return None
+    sort_column = task_sort_column(sort_by)
+    value = getattr(task, sort_column.key)
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    elif isinstance(value, enum.Enum):
+        value = value.value
+    
+    return encode_cursor({
+        "s": sort_column.key,
+        "o": sort_order.lower(),
+        "v": value,
+        "id": task.id,
+    })
+
+
+def decode_task_cursor(token: str, sort_by: str, sort_order: str) -> Tuple[Any, int]:
+    """
+    Decode a task cursor for the given sort.
+    
+    Args:
+        token: Cursor token from a previous page
+        sort_by: Field the request sorts by
+        sort_order: Sort order (asc/desc)
+        
+    Returns:
+        Tuple of (sort value, id) for task_keyset_clause
+        
+    Raises:
+        ValueError: If the cursor is malformed or was issued for another sort
+    """
+    if sort_by == RELEVANCE_SORT:
+        raise ValueError("Relevance-sorted results cannot be paged by cursor")
+    data = decode_cursor(token)
+    sort_column = task_sort_column(sort_by)
+    if data.get("s") != sort_column.key or data.get("o") != sort_order.lower():
+        raise ValueError("Cursor does not match the requested sort")
+    if not isinstance(data.get("id"), int):
+        raise ValueError("Malformed cursor")
+    
+    value = data.get("v")
+    if value is not None:
+        column_type = sort_column.type
+        if isinstance(column_type, SQLEnum):
+            value = column_type.enum_class(value)
+        elif isinstance(column_type, DateTime):
+            value = datetime.fromisoformat(value)
+    
+    return value, data["id"]
+
+
+def task_load_only(columns: Sequence[str], *extra: str):
+    """
+    Build a loader option selecting only some Task columns.
+    
+    Args:
+        columns: Requested column names (a sparse fieldset)
+        extra: Columns the caller needs besides the requested ones
+        
+    Returns:
+        load_only option (the primary key is always loaded)
+    """
+    names = dict.fromkeys([*columns, *extra])
+    return load_only(*(getattr(Task, name) for name in names))
+
+
+def task_load_options(load: TaskLoad = TaskLoad.BARE, columns: Optional[Sequence[str]] = None, *extra: str) -> list:
+    """
+    Build loader options for a task read.
+    
+    Relationships the profile does not load raise instead of lazy loading,
+    so a caller touching one gets an error rather than a query per row.
+    
+    Args:
+        load: Loading profile
+        columns: Load only these columns (sparse fieldset)
+        extra: Columns the caller needs besides the requested ones
+        
+    Returns:
+        List of loader options
+    """
+    options = []
+    if columns is not None:
+        options.append(task_load_only(columns, *extra))
+    if load == TaskLoad.USERS:
+        options += [joinedload(Task.creator), joinedload(Task.assignee)]
+    elif load == TaskLoad.COMMENT_COUNT:
+        comment_count = (
+            select(func.count(Comment.id))
+            .where(Comment.task_id == Task.id, user_is_live(Comment.user_id))
+            .scalar_subquery()
+        )
+        options.append(with_expression(Task.comment_count, comment_count))
+    # sql_only: related objects already in the session are still returned
+    options.append(raiseload("*", sql_only=True))
+    return options
+
+
+def get_task(
+    db: Session,
+    task_id: int,
+    columns: Optional[Sequence[str]] = None,
+    load: TaskLoad = TaskLoad.BARE
+) -> Optional[Task]:
+    """
+    Get task by ID.
     
     Args:
         db: Database session
         task_id: Task ID
+        columns: Load only these columns
+        load: Loading profile (relationships are not loaded by default)
         
     Returns:
         Task object or None if not found
     """
     return db.query(Task).options(
-        joinedload(Task.creator),
-        joinedload(Task.assignee)
+        *task_load_options(load, columns)
     ).filter(Task.id == task_id).first()
 
 
+def _task_list_query(
+    db: Session,
+    entities: Tuple[Any, ...],
+    filters: Optional[TaskFilter],
+    sort_by: str,
+    sort_order: str,
+    after: Optional[Tuple[Any, int]],
+    columns: Optional[Sequence[str]] = None,
+    load: TaskLoad = TaskLoad.BARE
+):
+    """
+    Build the filtered, ordered task list query shared by get_tasks and get_tasks_page.
+    """
+    # The sort column is also needed to encode the next cursor
+    query = db.query(*entities).options(
+        *task_load_options(load, columns, task_sort_column(sort_by).key)
+    )
+    
+    dialect = session_dialect(db)
+    query = query.filter(*task_filter_clauses(filters, dialect))
+    if after is not None:
+        query = query.filter(task_keyset_clause(sort_by, sort_order, after))
+    search = filters.search if filters else None
+    return query.order_by(*task_order_by(sort_by, sort_order, search, dialect))
+
+
 def get_tasks(
     db: Session,
     skip: int = 0,
     limit: int = 100,
     filters: Optional[TaskFilter] = None,
     sort_by: str = "created_at",
-    sort_order: str = "desc"
+    sort_order: str = "desc",
+    after: Optional[Tuple[Any, int]] = None,
+    columns: Optional[Sequence[str]] = None,
+    load: TaskLoad = TaskLoad.BARE
 ) -> List[Task]:
     """
     Get list of tasks with filtering, sorting, and pagination.
     
+    Pages either by offset (skip) or, when ``after`` is given, by keyset,
+    which costs the same at any depth.
+    
     Args:
         db: Database session
         skip: Number of records to skip
@@ -46,42 +480,154 @@ def get_tasks(
         filters: Task filter schema
         sort_by: Field to sort by
         sort_order: Sort order (asc/desc)
+        after: Decoded cursor (sort value, id) to continue after
+        columns: Load only these columns (sparse fieldset)
+        load: Loading profile (relationships are not loaded by default)
         
     Returns:
         List of Task objects
     """
-    query = db.query(Task).options(
-        joinedload(Task.creator),
-        joinedload(Task.assignee)
+    query = _task_list_query(db, (Task,), filters, sort_by, sort_order, after, columns, load)
+    return query.offset(skip).limit(limit).all()
+
+
+def get_tasks_page(
+    db: Session,
+    skip: int = 0,
+    limit: int = 100,
+    filters: Optional[TaskFilter] = None,
+    sort_by: str = "created_at",
+    sort_order: str = "desc",
+    after: Optional[Tuple[Any, int]] = None,
+    columns: Optional[Sequence[str]] = None,
+    load: TaskLoad = TaskLoad.BARE
+) -> Tuple[List[Task], int, Optional[datetime]]:
+    """
+    Get a page of tasks together with the filtered total in one query.
+    
+    Same arguments as get_tasks. Only a page past the end (no rows to
+    carry the total) falls back to a separate count query.
+    
+    Returns:
+        Tuple of (list of Task objects, total count of matching tasks,
+        latest updated_at of matching tasks)
+    """
+    dialect = session_dialect(db)
+    entities = (Task, task_total_column(filters, dialect), task_last_updated_column(filters, dialect))
+    query = _task_list_query(db, entities, filters, sort_by, sort_order, after, columns, load)
+    rows = query.offset(skip).limit(limit).all()
+    
+    if rows:
+        return [row.Task for row in rows], rows[0].total, rows[0].last_updated
+    if skip == 0 and after is None:
+        return [], 0, None
+    return [], *get_tasks_version(db, filters=filters)
+
+
+def stream_tasks(
+    db: Session,
+    columns: Sequence[str],
+    filters: Optional[TaskFilter] = None,
+    sort_by: str = "created_at",
+    sort_order: str = "desc",
+    batch_size: int = 1000
+) -> Iterator[Sequence[Row]]:
+    """
+    Stream all matching tasks in batches of plain rows.
+    
+    yield_per fetches through a server-side cursor on PostgreSQL, and plain
+    rows skip the identity map, so only one batch is held in memory no
+    matter how many tasks match.
+    
+    Args:
+        db: Database session
+        columns: Task column names to select
+        filters: Task filter schema
+        sort_by: Field to sort by
+        sort_order: Sort order (asc/desc)
+        batch_size: Rows fetched per round trip
+        
+    Yields:
+        Batches of rows with the requested columns
+    """
+    dialect = session_dialect(db)
+    stmt = (
+        select(*(getattr(Task, name) for name in columns))
+        .where(*task_filter_clauses(filters, dialect))
+        .order_by(*task_order_by(sort_by, sort_order, filters.search if filters else None, dialect))
     )
+    result = db.execute(stmt, execution_options={"yield_per": batch_size})
+    try:
+        yield from result.partitions()
+    finally:
+        # Release the cursor if the client disconnects mid-export
+        result.close()
+
+
+def task_suggest_clause(q: str, dialect: str) -> ColumnElement:
+    """
+    Build the WHERE clause matching task titles for typeahead.
     
-    # Apply filters
-    if filters:
-        if filters.completed is not None:
-            query = query.filter(Task.completed == filters.completed)
-        if filters.priority:
-            query = query.filter(Task.priority == filters.priority)
-        if filters.created_by:
-            query = query.filter(Task.created_by == filters.created_by)
-        if filters.assigned_to:
-            query = query.filter(Task.assigned_to == filters.assigned_to)
-        if filters.search:
-            search_term = f"%{filters.search}%"
-            query = query.filter(
-                or_(
-                    Task.title.ilike(search_term),
-                    Task.description.ilike(search_term)
-                )
-            )
-    
-    # Apply sorting
-    sort_column = getattr(Task, sort_by, Task.created_at)
-    if sort_order.lower() == "asc":
-        query = query.order_by(sort_column.asc())
-    else:
-        query = query.order_by(sort_column.desc())
+    Matches titles containing the input and, on PostgreSQL, titles
+    similar to it (typos), both served by the ix_tasks_title_trgm index.
     
-    return query.offset(skip).limit(limit).all()
+    Args:
+        q: Text typed so far
+        dialect: Dialect name of the session (see session_dialect)
+        
+    Returns:
+        SQL boolean expression
+    """
+    escaped = q.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    contains = Task.title.ilike(f"%{escaped}%", escape="\\")
+    if dialect == "postgresql":
+        return or_(contains, Task.title.op("%")(q))
+    return contains
+
+
+def task_suggest_order_by(q: str, dialect: str) -> List[ColumnElement]:
+    """
+    Build the ORDER BY expressions ranking typeahead suggestions, best first.
+    
+    PostgreSQL ranks by trigram similarity; other backends put titles
+    starting with the input first, then shorter titles.
+    
+    Args:
+        q: Text typed so far
+        dialect: Dialect name of the session (see session_dialect)
+        
+    Returns:
+        List of SQL ordering expressions
+    """
+    if dialect == "postgresql":
+        return [func.similarity(Task.title, q).desc(), Task.id.desc()]
+    starts_with = case((func.lower(func.substr(Task.title, 1, len(q))) == q.lower(), 0), else_=1)
+    return [starts_with.asc(), func.length(Task.title).asc(), Task.id.desc()]
+
+
+def suggest_tasks(
+    db: Session,
+    q: str,
+    filters: Optional[TaskFilter] = None,
+    limit: int = 10
+) -> List[Task]:
+    """
+    Get the tasks whose titles best match a typeahead input.
+    
+    Args:
+        db: Database session
+        q: Text typed so far
+        filters: Task filter schema (visibility)
+        limit: Maximum number of suggestions
+        
+    Returns:
+        List of Task objects, best match first
+    """
+    dialect = session_dialect(db)
+    return db.query(Task).options(load_only(Task.id, Task.title)).filter(
+        *task_filter_clauses(filters, dialect),
+        task_suggest_clause(q, dialect)
+    ).order_by(*task_suggest_order_by(q, dialect)).limit(limit).all()
 
 
 def get_tasks_count(db: Session, filters: Optional[TaskFilter] = None) -> int:
@@ -95,33 +641,173 @@ def get_tasks_count(db: Session, filters: Optional[TaskFilter] = None) -> int:
     Returns:
         Count of tasks
     """
-    query = db.query(func.count(Task.id))
-    
-    if filters:
-        if filters.completed is not None:
-            query = query.filter(Task.completed == filters.completed)
-        if filters.priority:
-            query = query.filter(Task.priority == filters.priority)
-        if filters.created_by:
-            query = query.filter(Task.created_by == filters.created_by)
-        if filters.assigned_to:
-            query = query.filter(Task.assigned_to == filters.assigned_to)
-        if filters.search:
-            search_term = f"%{filters.search}%"
-            query = query.filter(
-                or_(
-                    Task.title.ilike(search_term),
-                    Task.description.ilike(search_term)
-                )
-            )
-    
+    query = db.query(func.count(Task.id)).filter(*task_filter_clauses(filters, session_dialect(db)))
     return query.scalar()
 
 
+def task_version_statement(filters: Optional[TaskFilter], dialect: str):
+    """
+    Build the query versioning a filtered task set: row count and latest updated_at.
+    
+    Every write either changes the count or bumps a row's updated_at past
+    all existing values, so the pair changes whenever the set does. Search
+    matches on comment text are not covered.
+    """
+    return select(func.count(Task.id), func.max(Task.updated_at)).where(*task_filter_clauses(filters, dialect))
+
+
+def get_tasks_version(db: Session, filters: Optional[TaskFilter] = None) -> Tuple[int, Optional[datetime]]:
+    """
+    Get the version of the tasks matching filters, for ETags.
+    
+    Args:
+        db: Database session
+        filters: Task filter schema
+        
+    Returns:
+        Tuple of (count, latest updated_at)
+    """
+    return tuple(db.execute(task_version_statement(filters, session_dialect(db))).one())
+
+
+def task_statistics_version_statement(user_id: Optional[int], now: datetime):
+    """
+    Build the query versioning a user's statistics.
+    
+    Like task_version_statement over the statistics scope, plus the overdue
+    count, which also changes as due dates pass.
+    """
+    overdue = func.count(case((and_(Task.completed.is_(False), Task.due_date < now), Task.id)))
+    return select(func.count(Task.id), func.max(Task.updated_at), overdue).where(*task_statistics_scope(user_id))
+
+
+def task_statistics_scope(user_id: Optional[int]) -> List[ColumnElement]:
+    """Build the WHERE clauses of the statistics: tasks a user created or is assigned."""
+    if not user_id:
+        return []
+    return [or_(Task.created_by == user_id, Task.assigned_to == user_id)]
+
+
+def task_statistics_statement(user_id: Optional[int], now: datetime):
+    """
+    Build the query computing every statistics counter in one pass.
+    
+    Conditional aggregation (COUNT(CASE WHEN ... THEN id END)) reads the
+    scope once instead of once per counter; the columns are labeled as
+    the arguments of build_task_statistics.
+    """
+    def count_where(*clauses: ColumnElement):
+        return func.count(case((and_(*clauses), Task.id)))
+    
+    return select(
+        func.count(Task.id).label("total_tasks"),
+        count_where(Task.completed.is_(True)).label("completed_tasks"),
+        count_where(Task.completed.is_(False)).label("pending_tasks"),
+        count_where(Task.priority == TaskPriority.HIGH).label("high_priority"),
+        count_where(Task.priority == TaskPriority.MEDIUM).label("medium_priority"),
+        count_where(Task.priority == TaskPriority.LOW).label("low_priority"),
+        count_where(Task.completed.is_(False), Task.due_date < now).label("overdue_tasks")
+    ).where(*task_statistics_scope(user_id))
+
+
+def get_task_statistics_version(db: Session, user_id: Optional[int] = None) -> Tuple[int, Optional[datetime], int]:
+    """
+    Get the version of the task statistics, for ETags.
+    
+    Args:
+        db: Database session
+        user_id: Optional user ID to filter statistics
+        
+    Returns:
+        Tuple of (count, latest updated_at, overdue count)
+    """
+    now = datetime.now(timezone.utc)
+    return tuple(db.execute(task_statistics_version_statement(user_id, now)).one())
+
+
+def encode_sync_token(after: Tuple[datetime, int], deleted_after: datetime) -> str:
+    """
+    Build the opaque token a delta sync continues from.
+    
+    Args:
+        after: (updated_at, id) of the last change already delivered
+        deleted_after: Deletions logged after this time are still to be delivered
+        
+    Returns:
+        Sync token
+    """
+    return encode_cursor({
+        "s": "sync",
+        "u": after[0].isoformat(),
+        "id": after[1],
+        "d": deleted_after.isoformat(),
+    })
+
+
+def decode_sync_token(token: str) -> Tuple[Tuple[datetime, int], datetime]:
+    """
+    Decode a token produced by encode_sync_token.
+    
+    Args:
+        token: Sync token from a previous delta sync
+        
+    Returns:
+        Tuple of ((updated_at, id) keyset position, deletions watermark)
+        
+    Raises:
+        ValueError: If the token is malformed
+    """
+    data = decode_cursor(token)
+    if data.get("s") != "sync" or not isinstance(data.get("id"), int):
+        raise ValueError("Malformed sync token")
+    try:
+        after = datetime.fromisoformat(data["u"])
+        deleted_after = datetime.fromisoformat(data["d"])
+    except (KeyError, TypeError) as exc:
+        raise ValueError("Malformed sync token") from exc
+    return (after, data["id"]), deleted_after
+
+
+def task_deletions_statement(deleted_after: datetime, filters: Optional[TaskFilter], dialect: str):
+    """
+    Build the query of task ids that left the filtered set after a time.
+    
+    A tombstone only counts if the task is not in the set now, so tasks
+    reassigned away and back again (or reassigned within an unfiltered
+    admin view) are delivered as changes rather than deletions.
+    """
+    still_visible = select(Task.id).where(Task.id == TaskDeletion.task_id, *task_filter_clauses(filters, dialect)).exists()
+    stmt = select(TaskDeletion.task_id).where(TaskDeletion.deleted_at > deleted_after, ~still_visible)
+    if filters and filters.assigned_to is not None:
+        stmt = stmt.where(TaskDeletion.assigned_to == filters.assigned_to)
+    return stmt.distinct().order_by(TaskDeletion.task_id)
+
+
+def get_deleted_task_ids(
+    db: Session,
+    deleted_after: datetime,
+    filters: Optional[TaskFilter] = None
+) -> List[int]:
+    """
+    Get the ids of tasks deleted from the filtered set after a time.
+    
+    Args:
+        db: Database session
+        deleted_after: Deletion log watermark from a sync token
+        filters: Task filter schema (assignee scope)
+        
+    Returns:
+        List of task ids
+    """
+    return list(db.scalars(task_deletions_statement(deleted_after, filters, session_dialect(db))))
+
+
 def create_task(db: Session, task: TaskCreate, creator_id: int) -> Task:
     """
     Create a new task.
     
+    A single INSERT ... RETURNING; the returned row is not read back.
+    
     Args:
         db: Database session
         task: Task creation schema
@@ -130,111 +816,327 @@ def create_task(db: Session, task: TaskCreate, creator_id: int) -> Task:
     Returns:
         Created Task object
     """
-    db_task = Task(
-        title=task.title,
-        description=task.description,
-        due_date=task.due_date,
-        priority=task.priority,
-        assigned_to=task.assigned_to,
-        created_by=creator_id,
-        completed=False
-    )
-    db.add(db_task)
+    return create_tasks(db, [task], creator_id)[0]
+
+
+def task_bulk_insert_statement(dialect: str):
+    """
+    Build the multi-row task INSERT returning the created rows.
+    
+    Multi-row INSERT ... RETURNING only comes back in parameter order through
+    SQLAlchemy's insert sentinel, which SQLite lacks (each row would be sent
+    alone). SQLite numbers rowids in VALUES order, so callers on SQLite sort
+    the returned rows by id instead.
+    
+    Args:
+        dialect: Dialect name of the session (see session_dialect)
+    """
+    return insert(Task).returning(Task, sort_by_parameter_order=dialect != "sqlite")
+
+
+def task_bulk_rows(tasks: Sequence[TaskCreate], creator_id: int) -> List[Dict[str, Any]]:
+    """Build the parameter sets of task_bulk_insert_statement."""
+    return [{**task.model_dump(), "created_by": creator_id, "completed": False} for task in tasks]
+
+
+def create_tasks(db: Session, tasks: Sequence[TaskCreate], creator_id: int) -> List[Task]:
+    """
+    Create many tasks in one transaction.
+    
+    The rows go out as multi-row INSERT ... RETURNING statements (up to
+    1000 rows each), so the database round trips do not grow with the
+    number of tasks the way repeated create_task calls do.
+    
+    Args:
+        db: Database session
+        tasks: Validated task creation schemas
+        creator_id: ID of the user creating the tasks
+        
+    Returns:
+        Created Task objects, in the order given
+    """
+    if not tasks:
+        return []
+    
+    dialect = session_dialect(db)
+    db_tasks = list(db.scalars(task_bulk_insert_statement(dialect), task_bulk_rows(tasks, creator_id)))
+    if dialect == "sqlite":
+        db_tasks.sort(key=lambda db_task: db_task.id)
+    # Detach before committing, so the returned rows are not expired and
+    # reloaded one by one when serialized
+    for db_task in db_tasks:
+        db.expunge(db_task)
     db.commit()
-    db.refresh(db_task)
-    return db_task
+    response_cache.invalidate([creator_id, *(task.assigned_to for task in tasks)])
+    return db_tasks
+
+
+def task_write_clauses(task_id: int, owner_id: Optional[int] = None) -> List[ColumnElement]:
+    """
+    Build the WHERE clauses of a single-task update or delete.
+    
+    With an owner, the permission check (only the assignee may change a
+    task) is part of the statement rather than a read before it.
+    
+    Args:
+        task_id: Task ID
+        owner_id: Required assignee, or None for no ownership check
+        
+    Returns:
+        List of SQL boolean expressions
+    """
+    clauses = [Task.id == task_id]
+    if owner_id is not None:
+        clauses.append(Task.assigned_to == owner_id)
+    return clauses
+
+
+def task_reassign_statement(clauses: List[ColumnElement], assigned_to: Optional[int]):
+    """
+    Build the INSERT ... SELECT logging a tombstone for a task changing assignee.
+    
+    Runs before the UPDATE and returns the previous assignee, which the
+    UPDATE's RETURNING clause cannot.
+    """
+    return (
+        insert(TaskDeletion)
+        .from_select(
+            ["task_id", "assigned_to"],
+            select(Task.id, Task.assigned_to).where(*clauses, Task.assigned_to.is_distinct_from(assigned_to))
+        )
+        .returning(TaskDeletion.assigned_to)
+    )
+
+
+def task_update_statement(clauses: List[ColumnElement], values: Dict[str, Any]):
+    """Build the single-task UPDATE returning the updated row's columns."""
+    return (
+        update(Task)
+        .where(*clauses)
+        .values(**values, updated_at=datetime.now(timezone.utc))
+        .returning(*returning_columns(Task))
+        .execution_options(synchronize_session=False)
+    )
 
 
 def update_task(
     db: Session,
     task_id: int,
-    task_update: TaskUpdate
+    task_update: TaskUpdate,
+    owner_id: Optional[int] = None
 ) -> Optional[Task]:
     """
-    Update task information.
+    Update task information with one UPDATE ... RETURNING.
+    
+    Reassignments also log a tombstone for the previous assignee's delta
+    syncs (one more statement). The task is never loaded beforehand.
     
     Args:
         db: Database session
         task_id: Task ID
         task_update: Task update schema
+        owner_id: Only update the task if it is assigned to this user
         
     Returns:
-        Updated Task object or None if not found
+        Updated Task object (detached), or None if no task matched
     """
-    db_task = get_task(db, task_id)
-    if not db_task:
-        return None
-    
     update_data = task_update.model_dump(exclude_unset=True)
+    clauses = task_write_clauses(task_id, owner_id)
     
-    for field, value in update_data.items():
-        setattr(db_task, field, value)
+    previous_assignee = None
+    if "assigned_to" in update_data:
+        previous_assignee = db.scalar(task_reassign_statement(clauses, update_data["assigned_to"]))
     
-    # Update timestamp
-    db_task.updated_at = datetime.now(timezone.utc)
+    row = db.execute(task_update_statement(clauses, update_data)).first()
+    if row is None:
+        db.rollback()
+        return None
     
     db.commit()
-    db.refresh(db_task)
+    db_task = detached(Task, row._mapping)
+    # Cached lists of the previous assignee go stale too
+    response_cache.invalidate([db_task.created_by, db_task.assigned_to, previous_assignee])
     return db_task
 
 
-def delete_task(db: Session, task_id: int) -> bool:
+def delete_task(db: Session, task_id: int, owner_id: Optional[int] = None) -> bool:
     """
-    Delete a task.
+    Delete a task and its comments without loading them.
     
     Args:
         db: Database session
         task_id: Task ID
+        owner_id: Only delete the task if it is assigned to this user
         
     Returns:
-        True if deleted, False if not found
+        True if deleted, False if no task matched
     """
-    db_task = get_task(db, task_id)
-    if not db_task:
+    row = db.execute(task_delete_statement(task_write_clauses(task_id, owner_id))).first()
+    if row is None:
+        db.rollback()
         return False
     
-    db.delete(db_task)
+    # Tombstone for delta syncs of the assignee
+    db.execute(insert(TaskDeletion).values(task_id=row.id, assigned_to=row.assigned_to))
     db.commit()
+    response_cache.invalidate([row.created_by, row.assigned_to])
     return True
 
 
-def get_task_statistics(db: Session, user_id: Optional[int] = None) -> Dict[str, Any]:
+def task_bulk_clauses(
+    owner_id: int,
+    ids: Optional[Sequence[int]],
+    filters: Optional[TaskFilter],
+    dialect: str
+) -> List[ColumnElement]:
     """
-    Get task statistics.
+    Build the WHERE clauses of a bulk update or delete.
+    
+    The ownership rule (only the assignee may change a task) is part of
+    the statement, so tasks of other users are never touched.
     
     Args:
-        db: Database session
-        user_id: Optional user ID to filter statistics
+        owner_id: Current user ID
+        ids: Explicit task IDs
+        filters: Task filter schema, used when no IDs are given
+        dialect: Dialect name of the session (see session_dialect)
         
     Returns:
-        Dictionary with statistics
+        List of SQL boolean expressions
     """
-    query = db.query(Task)
+    clauses = [Task.assigned_to == owner_id]
+    if ids is not None:
+        clauses.append(Task.id.in_(ids))
+    else:
+        clauses.extend(task_filter_clauses(filters, dialect))
+    return clauses
+
+
+def task_bulk_update_statement(clauses: List[ColumnElement], values: Dict[str, Any]):
+    """
+    Build the set-based task UPDATE returning (id, created_by) of changed rows.
     
-    # Filter by user if provided
-    if user_id:
-        query = query.filter(
-            or_(Task.created_by == user_id, Task.assigned_to == user_id)
-        )
+    Objects already in the session are not synchronized: the callers
+    commit right away, which expires them anyway.
+    """
+    return (
+        update(Task)
+        .where(*clauses)
+        .values(**values, updated_at=datetime.now(timezone.utc))
+        .returning(Task.id, Task.created_by)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def task_delete_statement(clauses: List[ColumnElement]):
+    """
+    Build the set-based task DELETE returning (id, created_by, assigned_to).
     
-    total_tasks = query.count()
-    completed_tasks = query.filter(Task.completed == True).count()
-    pending_tasks = query.filter(Task.completed == False).count()
+    Comments go with their tasks through ON DELETE CASCADE. Deleted tasks
+    still in the session are marked deleted; the primary keys come from
+    the RETURNING clause, not from a separate SELECT.
+    """
+    return (
+        delete(Task)
+        .where(*clauses)
+        .returning(Task.id, Task.created_by, Task.assigned_to)
+        .execution_options(synchronize_session="fetch")
+    )
+
+
+def update_tasks(
+    db: Session,
+    owner_id: int,
+    task_update: TaskUpdate,
+    ids: Optional[Sequence[int]] = None,
+    filters: Optional[TaskFilter] = None
+) -> List[int]:
+    """
+    Update every selected task assigned to a user with one UPDATE ... RETURNING.
     
-    # Priority statistics
-    high_priority = query.filter(Task.priority == TaskPriority.HIGH).count()
-    medium_priority = query.filter(Task.priority == TaskPriority.MEDIUM).count()
-    low_priority = query.filter(Task.priority == TaskPriority.LOW).count()
+    Args:
+        db: Database session
+        owner_id: Current user ID (only their tasks are updated)
+        task_update: Task update schema
+        ids: Explicit task IDs
+        filters: Task filter schema, used when no IDs are given
+        
+    Returns:
+        IDs of the updated tasks
+    """
+    values = task_update.model_dump(exclude_unset=True)
+    rows = db.execute(task_bulk_update_statement(task_bulk_clauses(owner_id, ids, filters, session_dialect(db)), values)).all()
+    updated_ids = [row.id for row in rows]
+    # Tombstones for delta syncs when the tasks leave the owner's list
+    if updated_ids and values.get("assigned_to", owner_id) != owner_id:
+        db.execute(insert(TaskDeletion), [{"task_id": task_id, "assigned_to": owner_id} for task_id in updated_ids])
+    db.commit()
+    if updated_ids:
+        response_cache.invalidate({owner_id, values.get("assigned_to"), *(row.created_by for row in rows)})
+    return updated_ids
+
+
+def delete_tasks(
+    db: Session,
+    owner_id: int,
+    ids: Optional[Sequence[int]] = None,
+    filters: Optional[TaskFilter] = None
+) -> List[int]:
+    """
+    Delete every selected task assigned to a user, with its comments.
     
-    # Overdue tasks (pending and past due date)
-    now = datetime.now(timezone.utc)
-    overdue_tasks = query.filter(
-        and_(
-            Task.completed == False,
-            Task.due_date < now
-        )
-    ).count()
+    Set-based: one DELETE ... RETURNING whatever the number of tasks; the
+    database deletes their comments.
     
+    Args:
+        db: Database session
+        owner_id: Current user ID (only their tasks are deleted)
+        ids: Explicit task IDs
+        filters: Task filter schema, used when no IDs are given
+        
+    Returns:
+        IDs of the deleted tasks
+    """
+    rows = db.execute(task_delete_statement(task_bulk_clauses(owner_id, ids, filters, session_dialect(db)))).all()
+    deleted_ids = [row.id for row in rows]
+    if deleted_ids:
+        db.execute(insert(TaskDeletion), [{"task_id": task_id, "assigned_to": owner_id} for task_id in deleted_ids])
+    db.commit()
+    if deleted_ids:
+        response_cache.invalidate({owner_id, *(row.created_by for row in rows)})
+    return deleted_ids
+
+
+def get_task_statistics(db: Session, user_id: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Get task statistics with one aggregate query.
+    
+    Args:
+        db: Database session
+        user_id: Optional user ID to filter statistics
+        
+    Returns:
+        Dictionary with statistics
+    """
+    row = db.execute(task_statistics_statement(user_id, datetime.now(timezone.utc))).one()
+    return build_task_statistics(**row._mapping)
+
+
+def build_task_statistics(
+    total_tasks: int,
+    completed_tasks: int,
+    pending_tasks: int,
+    high_priority: int,
+    medium_priority: int,
+    low_priority: int,
+    overdue_tasks: int
+) -> Dict[str, Any]:
+    """
+    Assemble the statistics payload from raw counters.
+    
+    Returns:
+        Dictionary matching the TaskStatistics schema
+    """
     # Calculate completion rate
     completion_rate = (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0.0
     
@@ -1,12 +1,28 @@
 """
 CRUD operations for User model.
 """
-from typing import Optional
-from sqlalchemy.orm import Session
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Dict, Any, List, Tuple, Union
+from sqlalchemy import select, insert, update, delete, inspect, func, case, or_, and_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, make_transient_to_detached
+from sqlalchemy.sql.elements import ColumnElement
 
+from app.models.comment import Comment
+from app.models.purge_job import PurgeJob, PurgeJobStatus
+from app.models.task import Task
 from app.models.user import User, UserRole
+from app.core.cache import principal_cache, token_version_cache
+from app.core.response_cache import response_cache
 from app.core.security import get_password_hash, verify_password
-from app.schemas.user import UserCreate, UserUpdate
+from app.db.returning import detached, returning_columns
+from app.schemas.user import UserCreate, UserUpdate, TokenData
+
+logger = logging.getLogger(__name__)
+
+# User fields whose change invalidates all outstanding tokens
+REVOKING_FIELDS = {"email", "hashed_password", "role", "is_active"}
 
 
 def get_user(db: Session, user_id: int) -> Optional[User]:
@@ -20,7 +36,7 @@ def get_user(db: Session, user_id: int) -> Optional[User]:
     Returns:
         User object or None if not found
     """
-    return db.query(User).filter(User.id == user_id).first()
+    return db.query(User).filter(User.id == user_id, User.deleted_at.is_(None)).first()
 
 
 def get_user_by_email(db: Session, email: str) -> Optional[User]:
@@ -34,7 +50,80 @@ def get_user_by_email(db: Session, email: str) -> Optional[User]:
     Returns:
         User object or None if not found
     """
-    return db.query(User).filter(User.email == email).first()
+    return db.query(User).filter(User.email == email, User.deleted_at.is_(None)).first()
+
+
+def user_snapshot(user: User) -> Dict[str, Any]:
+    """Column values of a user, safe to keep outside any session."""
+    return {
+        attr.key: getattr(user, attr.key)
+        for attr in inspect(User).column_attrs
+    }
+
+
+def user_is_live(user_id: ColumnElement) -> ColumnElement:
+    """
+    Build the condition that a referenced user is not deleted.
+    
+    Rows of a deleted user in other tables (their comments) are hidden
+    with it until the purge removes them.
+    
+    Args:
+        user_id: Column referencing users.id, e.g. Comment.user_id
+        
+    Returns:
+        SQL boolean expression (an EXISTS on the users primary key)
+    """
+    return select(User.id).where(User.id == user_id, User.deleted_at.is_(None)).exists()
+
+
+def get_principal_by_email(db: Session, email: str) -> Optional[User]:
+    """
+    Get the user behind a token subject, served from the principal cache.
+    
+    On a cache hit the user is rebuilt from the cached column values and
+    attached to the session without emitting any SQL.
+    
+    Args:
+        db: Database session
+        email: User email (token subject)
+        
+    Returns:
+        User object or None if not found
+    """
+    snapshot = principal_cache.get(email)
+    if snapshot is not None:
+        user = User(**snapshot)
+        make_transient_to_detached(user)
+        return db.merge(user, load=False)
+    
+    user = get_user_by_email(db, email)
+    if user is not None:
+        principal_cache.set(email, user_snapshot(user))
+    return user
+
+
+def load_token_state(db: Session, user_id: int) -> Optional[Tuple[int, bool]]:
+    """
+    Load the revocation state checked against self-contained token claims.
+    
+    The result is stored in the token version cache, which callers on the
+    request path consult before calling this.
+    
+    Args:
+        db: Database session
+        user_id: User ID
+        
+    Returns:
+        Tuple of (token_version, is_active) or None if user not found
+    """
+    row = db.query(User.token_version, User.is_active).filter(User.id == user_id, User.deleted_at.is_(None)).first()
+    if row is None:
+        return None
+    
+    state = (row.token_version, row.is_active)
+    token_version_cache.set(user_id, state)
+    return state
 
 
 def get_users(db: Session, skip: int = 0, limit: int = 100):
@@ -49,82 +138,407 @@ def get_users(db: Session, skip: int = 0, limit: int = 100):
     Returns:
         List of User objects
     """
-    return db.query(User).offset(skip).limit(limit).all()
+    return db.query(User).filter(User.deleted_at.is_(None)).offset(skip).limit(limit).all()
 
 
-def create_user(db: Session, user: UserCreate) -> User:
+def get_users_version(db: Session) -> Tuple[int, Optional[datetime]]:
     """
-    Create a new user.
+    Get the version of the user list, for ETags.
+    
+    Args:
+        db: Database session
+        
+    Returns:
+        Tuple of (count, latest updated_at)
+    """
+    return tuple(db.query(func.count(User.id), func.max(User.updated_at)).filter(User.deleted_at.is_(None)).one())
+
+
+def create_user(db: Session, user: UserCreate) -> Optional[User]:
+    """
+    Create a new user with one INSERT ... RETURNING.
+    
+    A taken email is detected by the unique index rather than a lookup
+    beforehand.
     
     Args:
         db: Database session
         user: User creation schema
         
     Returns:
-        Created User object
+        Created User object (detached), or None if the email is already registered
     """
-    hashed_password = get_password_hash(user.password)
-    db_user = User(
-        email=user.email,
-        hashed_password=hashed_password,
-        full_name=user.full_name,
-        role=user.role,
-        is_active=True
-    )
-    db.add(db_user)
+    return insert_user(db, user, get_password_hash(user.password))
+
+
+def insert_user(db: Session, user: UserCreate, hashed_password: str) -> Optional[User]:
+    """
+    Insert a user whose password is already hashed.
+    
+    Lets async callers hash through the password pool without holding a
+    thread, then run only the INSERT in one.
+    
+    Args:
+        db: Database session
+        user: User creation schema
+        hashed_password: bcrypt hash of user.password
+        
+    Returns:
+        Created User object (detached), or None if the email is already registered
+    """
+    try:
+        row = db.execute(
+            insert(User)
+            .values(
+                email=user.email,
+                hashed_password=hashed_password,
+                full_name=user.full_name,
+                role=user.role,
+                is_active=True
+            )
+            .returning(*returning_columns(User))
+        ).one()
+    except IntegrityError:
+        db.rollback()
+        return None
+    
     db.commit()
-    db.refresh(db_user)
-    return db_user
+    return detached(User, row._mapping)
 
 
-def update_user(db: Session, user_id: int, user_update: UserUpdate) -> Optional[User]:
+def user_update_values(update_data: Dict[str, Any]) -> Dict[str, Any]:
     """
-    Update user information.
+    Turn validated user update fields into column values.
+    
+    The password must already be hashed into hashed_password. Changes to
+    identity or privileges revoke previously issued tokens, by bumping the
+    token version in the UPDATE itself.
+    """
+    values = dict(update_data)
+    if REVOKING_FIELDS.intersection(values):
+        values["token_version"] = User.token_version + 1
+    return values
+
+
+def user_update_statement(user_id: int, values: Dict[str, Any]):
+    """Build the user UPDATE returning the updated row's columns."""
+    return (
+        update(User)
+        .where(User.id == user_id, User.deleted_at.is_(None))
+        .values(**values)
+        .returning(*returning_columns(User))
+        .execution_options(synchronize_session=False)
+    )
+
+
+def update_user(
+    db: Session,
+    user_id: int,
+    user_update: UserUpdate,
+    hashed_password: Optional[str] = None
+) -> Optional[User]:
+    """
+    Update user information with one UPDATE ... RETURNING.
+    
+    Email changes first read the previous email, whose principal cache
+    entry must be dropped. Async callers pass the password already hashed
+    (see insert_user), so that only the UPDATE holds a thread.
     
     Args:
         db: Database session
         user_id: User ID
         user_update: User update schema
+        hashed_password: bcrypt hash of user_update.password, if already hashed
         
     Returns:
-        Updated User object or None if not found
+        Updated User object (detached), or None if not found
     """
-    db_user = get_user(db, user_id)
-    if not db_user:
-        return None
-    
     update_data = user_update.model_dump(exclude_unset=True)
     
     # Hash password if provided
     if "password" in update_data:
-        update_data["hashed_password"] = get_password_hash(update_data.pop("password"))
+        password = update_data.pop("password")
+        update_data["hashed_password"] = hashed_password or get_password_hash(password)
     
-    for field, value in update_data.items():
-        setattr(db_user, field, value)
+    previous_email = None
+    if "email" in update_data:
+        previous_email = db.scalar(select(User.email).where(User.id == user_id, User.deleted_at.is_(None)))
+    
+    row = db.execute(user_update_statement(user_id, user_update_values(update_data))).first()
+    if row is None:
+        db.rollback()
+        return None
     
     db.commit()
-    db.refresh(db_user)
-    return db_user
+    if previous_email is not None:
+        principal_cache.invalidate(previous_email)
+    principal_cache.invalidate(row.email)
+    token_version_cache.invalidate(user_id)
+    return detached(User, row._mapping)
 
 
-def delete_user(db: Session, user_id: int) -> bool:
+def user_soft_delete_statement(user_id: int):
+    """Build the UPDATE marking a user deleted (and revoking their tokens), returning the email."""
+    return (
+        update(User)
+        .where(User.id == user_id, User.deleted_at.is_(None))
+        .values(deleted_at=datetime.now(timezone.utc), token_version=User.token_version + 1)
+        .returning(User.email)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def purge_job_insert_statement(user_id: int, requested_by: Optional[int] = None):
+    """Build the INSERT of a pending purge job, returning its columns."""
+    return (
+        insert(PurgeJob)
+        .values(user_id=user_id, requested_by=requested_by, status=PurgeJobStatus.PENDING)
+        .returning(*returning_columns(PurgeJob))
+    )
+
+
+def soft_delete_user(db: Session, user_id: int, requested_by: Optional[int] = None) -> Optional[PurgeJob]:
+    """
+    Mark a user deleted and queue the removal of their data.
+    
+    One UPDATE hides the user and their comments from every read and
+    revokes their tokens; the rows are removed later, in chunks, by the
+    purge worker (app.core.purge).
+    
+    Args:
+        db: Database session
+        user_id: User ID
+        requested_by: ID of the principal requesting the deletion
+        
+    Returns:
+        Created PurgeJob object (detached), or None if not found
+    """
+    email = db.execute(user_soft_delete_statement(user_id)).scalar()
+    if email is None:
+        db.rollback()
+        return None
+    
+    row = db.execute(purge_job_insert_statement(user_id, requested_by)).one()
+    db.commit()
+    principal_cache.invalidate(email)
+    token_version_cache.invalidate(user_id)
+    # Comment counts in cached task lists
+    response_cache.invalidate([user_id])
+    return detached(PurgeJob, row._mapping)
+
+
+def get_purge_job(db: Session, job_id: int) -> Optional[PurgeJob]:
+    """
+    Get purge job by ID.
+    
+    Args:
+        db: Database session
+        job_id: Purge job ID
+        
+    Returns:
+        PurgeJob object or None if not found
+    """
+    return db.get(PurgeJob, job_id)
+
+
+def get_resumable_purge_jobs(db: Session, stale_before: datetime) -> List[Tuple[int, Optional[datetime]]]:
+    """
+    Get the purge jobs left pending, running without a recent heartbeat, or failed and due a retry.
+    
+    Args:
+        db: Database session
+        stale_before: Running jobs last touched before this are resumed
+        
+    Returns:
+        List of (purge job ID, retry_at) tuples; retry_at is None unless
+        the job failed, and may lie in the future
+    """
+    rows = db.execute(
+        select(PurgeJob.id, PurgeJob.retry_at)
+        .where(or_(
+            purge_job_claimable(stale_before),
+            and_(PurgeJob.status == PurgeJobStatus.FAILED, PurgeJob.retry_at.is_not(None))
+        ))
+        .order_by(PurgeJob.id)
+    )
+    return [(row.id, as_utc(row.retry_at)) for row in rows]
+
+
+def purge_job_claimable(stale_before: datetime) -> ColumnElement:
+    """Build the condition that a job may be (re)started by a worker now."""
+    return or_(
+        PurgeJob.status == PurgeJobStatus.PENDING,
+        and_(PurgeJob.status == PurgeJobStatus.RUNNING, PurgeJob.updated_at < stale_before),
+        and_(PurgeJob.status == PurgeJobStatus.FAILED, PurgeJob.retry_at <= datetime.now(timezone.utc))
+    )
+
+
+def fail_purge_job(
+    db: Session,
+    job_id: int,
+    error: str,
+    retry_seconds: float,
+    max_attempts: int
+) -> Optional[datetime]:
     """
-    Delete a user.
+    Record a failed purge run and schedule its retry with exponential backoff.
     
     Args:
         db: Database session
+        job_id: Purge job ID
+        error: Error message to record
+        retry_seconds: Delay before the first retry, doubled on every further failure
+        max_attempts: Failed runs after which the job is no longer retried
+        
+    Returns:
+        When the job is due to be retried, or None if it has run out of
+        attempts or no longer exists
+    """
+    attempts = db.scalar(select(PurgeJob.attempts).where(PurgeJob.id == job_id))
+    if attempts is None:
+        # Removed while its run or retry timer was pending; nothing to retry
+        logger.warning("Purge job %s no longer exists, not retrying", job_id)
+        return None
+    attempts += 1
+    now = datetime.now(timezone.utc)
+    retry_at = now + timedelta(seconds=retry_seconds * 2 ** (attempts - 1)) if attempts < max_attempts else None
+    db.execute(purge_job_update_statement(
+        job_id, status=PurgeJobStatus.FAILED, attempts=attempts, retry_at=retry_at, error=error, finished_at=now
+    ))
+    db.commit()
+    return retry_at
+
+
+def as_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Attach UTC to a datetime read back naive (SQLite drops the offset)."""
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def purge_job_update_statement(job_id: int, **values: Any):
+    """Build the purge job UPDATE, which also refreshes its heartbeat."""
+    return (
+        update(PurgeJob)
+        .where(PurgeJob.id == job_id)
+        .values(**values)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def user_tasks_release_statement(user_id: int, limit: Optional[int] = None):
+    """
+    Build the UPDATE detaching a deleted user's tasks.
+    
+    Tasks outlive their users: created_by and assigned_to are cleared, as
+    ON DELETE SET NULL would, but updated_at is bumped too so that delta
+    syncs (GET /tasks/changes) pick the change up. Returns the remaining
+    (created_by, assigned_to) of each task, whose cached lists go stale.
+    
+    Args:
         user_id: User ID
+        limit: Detach at most this many tasks
+    """
+    clause = or_(Task.created_by == user_id, Task.assigned_to == user_id)
+    if limit is not None:
+        clause = Task.id.in_(select(Task.id).where(clause).limit(limit))
+    return (
+        update(Task)
+        .where(clause)
+        .values(
+            created_by=case((Task.created_by == user_id, None), else_=Task.created_by),
+            assigned_to=case((Task.assigned_to == user_id, None), else_=Task.assigned_to),
+            updated_at=datetime.now(timezone.utc)
+        )
+        .returning(Task.created_by, Task.assigned_to)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def user_comments_delete_statement(user_id: int, limit: int):
+    """Build the DELETE of at most limit comments of a user."""
+    return (
+        delete(Comment)
+        .where(Comment.id.in_(select(Comment.id).where(Comment.user_id == user_id).limit(limit)))
+        .execution_options(synchronize_session=False)
+    )
+
+
+def purge_user(db: Session, job_id: int, chunk_size: int, stale_before: datetime) -> Optional[PurgeJob]:
+    """
+    Run a purge job: remove a deleted user's comments, tasks references and row.
+    
+    Each chunk of at most chunk_size rows is its own transaction, which
+    also records the job's progress, so locks are held briefly and an
+    interrupted job resumes where it stopped. Tasks are kept, detached
+    from the user.
+    
+    Token versions are cached per process, so other workers may accept the
+    user's token for a while after the soft delete and write new comments
+    or tasks meanwhile. The final transaction locks the user row, sweeps
+    whatever was written since the chunks ran and only then deletes it.
+    
+    Args:
+        db: Database session
+        job_id: Purge job ID
+        chunk_size: Maximum rows deleted or updated per transaction
+        stale_before: A running job last touched before this is taken over
         
     Returns:
-        True if deleted, False if not found
+        Finished PurgeJob object, or None if the job is done or run by another worker
     """
-    db_user = get_user(db, user_id)
-    if not db_user:
-        return False
+    user_id = db.execute(
+        update(PurgeJob)
+        .where(PurgeJob.id == job_id, purge_job_claimable(stale_before))
+        .values(status=PurgeJobStatus.RUNNING, retry_at=None, finished_at=None)
+        .returning(PurgeJob.user_id)
+        .execution_options(synchronize_session=False)
+    ).scalar()
+    db.commit()
+    if user_id is None:
+        return None
+    
+    while True:
+        deleted = db.execute(user_comments_delete_statement(user_id, chunk_size)).rowcount
+        db.execute(purge_job_update_statement(job_id, comments_deleted=PurgeJob.comments_deleted + deleted))
+        db.commit()
+        if deleted < chunk_size:
+            break
     
-    db.delete(db_user)
+    while True:
+        task_owners = db.execute(user_tasks_release_statement(user_id, limit=chunk_size)).all()
+        db.execute(purge_job_update_statement(job_id, tasks_released=PurgeJob.tasks_released + len(task_owners)))
+        db.commit()
+        response_cache.invalidate({user_id, *(owner for row in task_owners for owner in row)})
+        if len(task_owners) < chunk_size:
+            break
+    
+    # The lock makes writes referencing the user wait for the delete (and
+    # then fail), so the sweep leaves nothing to cascade to
+    db.execute(select(User.id).where(User.id == user_id).with_for_update())
+    late_comments = db.execute(
+        delete(Comment)
+        .where(Comment.user_id == user_id)
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    late_task_owners = db.execute(user_tasks_release_statement(user_id)).all()
+    db.execute(
+        delete(User)
+        .where(User.id == user_id, User.deleted_at.is_not(None))
+        .execution_options(synchronize_session=False)
+    )
+    db.execute(purge_job_update_statement(
+        job_id,
+        status=PurgeJobStatus.DONE,
+        comments_deleted=PurgeJob.comments_deleted + late_comments,
+        tasks_released=PurgeJob.tasks_released + len(late_task_owners),
+        error=None,
+        finished_at=datetime.now(timezone.utc)
+    ))
     db.commit()
-    return True
+    if late_comments or late_task_owners:
+        response_cache.invalidate({user_id, *(owner for row in late_task_owners for owner in row)})
+    return db.get(PurgeJob, job_id)
 
 
 def authenticate_user(db: Session, email: str, password: str) -> Optional[User]:
@@ -149,12 +563,12 @@ def authenticate_user(db: Session, email: str, password: str) -> Optional[User]:
     return user
 
 
-def is_admin(user: User) -> bool:
+def is_admin(user: Union[User, TokenData]) -> bool:
     """
     Check if user is an admin.
     
     Args:
-        user: User object
+        user: User object or token principal
         
     Returns:
         True if user is admin, False otherwise
@@ -1,6 +1,19 @@
 """
 SQLAlchemy declarative base.
 """
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
 from sqlalchemy.ext.declarative import declarative_base
 
 Base = declarative_base()
+
+
+@event.listens_for(Engine, "connect")
+def _enable_sqlite_foreign_keys(dbapi_connection, connection_record):
+    """Enforce foreign keys and their ON DELETE actions on SQLite, where they are off by default."""
+    # sqlite3 connections, or the adapted connections of aiosqlite
+    if not type(dbapi_connection).__module__.startswith(("sqlite3", "sqlalchemy.dialects.sqlite")):
+        return
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
@@ -0,0 +1,174 @@
+"""
+Connection pool sizing and instrumentation.
+"""
+import threading
+import time
+from typing import Any, Dict, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+from app.config import Settings
+
+
+def pool_limits(settings: Settings) -> Tuple[int, int]:
+    """
+    Get (pool_size, max_overflow) for one engine in one worker process.
+    
+    With db_pool_auto_size, the connection budget (db_max_connections) is
+    split across web_concurrency worker processes. Each process keeps
+    enough persistent connections for its expected concurrent DB users
+    (db_pool_concurrency, the AnyIO thread pool size by default) and may
+    overflow up to its share of the budget. A pool smaller than the thread
+    pool lets requests stall waiting for a connection while holding the
+    threads other requests need to release theirs.
+    
+    Args:
+        settings: Application settings
+        
+    Returns:
+        Tuple of (pool_size, max_overflow)
+    """
+    if not settings.db_pool_auto_size:
+        return settings.db_pool_size, settings.db_max_overflow
+    
+    per_process = max(1, settings.db_max_connections // max(1, settings.web_concurrency))
+    pool_size = min(settings.db_pool_concurrency, per_process)
+    return pool_size, per_process - pool_size
+
+
+class PoolMetrics:
+    """Counters for one connection pool, fed by pool events."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.connects = 0
+        self.checkouts = 0
+        self.checked_out = 0
+        self.peak_checked_out = 0
+        self.peak_overflow = 0
+        self.checkout_wait_total = 0.0
+        self.checkout_wait_max = 0.0
+        self.timeouts = 0
+        self.preping_failures = 0
+        self.invalidations = 0
+
+    def record_wait(self, waited: float) -> None:
+        with self._lock:
+            self.checkout_wait_total += waited
+            self.checkout_wait_max = max(self.checkout_wait_max, waited)
+        # Invalidations until the checkout event are pre-ping failures
+        self._local.in_checkout = True
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self.timeouts += 1
+
+    def on_connect(self, dbapi_connection, connection_record) -> None:
+        with self._lock:
+            self.connects += 1
+
+    def on_checkout(self, overflow: int) -> None:
+        self._local.in_checkout = False
+        with self._lock:
+            self.checkouts += 1
+            self.checked_out += 1
+            self.peak_checked_out = max(self.peak_checked_out, self.checked_out)
+            self.peak_overflow = max(self.peak_overflow, overflow)
+
+    def on_checkin(self, dbapi_connection, connection_record) -> None:
+        with self._lock:
+            self.checked_out = max(0, self.checked_out - 1)
+
+    def on_invalidate(self, dbapi_connection, connection_record, exception) -> None:
+        with self._lock:
+            self.invalidations += 1
+            if getattr(self._local, "in_checkout", False):
+                self.preping_failures += 1
+
+    def stats(self, pool: Any = None) -> Dict[str, Any]:
+        """
+        Get the pool counters.
+        
+        Args:
+            pool: Optional live pool, to include its size and overflow
+            
+        Returns:
+            Dictionary of counters and checkout latencies
+        """
+        with self._lock:
+            data = {
+                "connects": self.connects,
+                "checkouts": self.checkouts,
+                "checked_out": self.checked_out,
+                "peak_checked_out": self.peak_checked_out,
+                "peak_overflow": self.peak_overflow,
+                "checkout_wait_avg": round(self.checkout_wait_total / self.checkouts, 6) if self.checkouts else 0.0,
+                "checkout_wait_max": round(self.checkout_wait_max, 6),
+                "timeouts": self.timeouts,
+                "preping_failures": self.preping_failures,
+                "invalidations": self.invalidations,
+                # Persistent connections that would have covered the observed peak
+                "recommended_pool_size": self.peak_checked_out,
+            }
+        if isinstance(pool, QueuePool):
+            data.update({
+                "pool_size": pool.size(),
+                "max_overflow": pool._max_overflow,
+                "overflow": max(0, pool.overflow()),
+            })
+        return data
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that times how long each checkout waits for a connection."""
+
+    metrics: PoolMetrics = None
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            if self.metrics is not None:
+                self.metrics.record_timeout()
+            raise
+        if self.metrics is not None:
+            self.metrics.record_wait(time.perf_counter() - start)
+        return connection
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+def instrument_engine(engine: Engine, name: str) -> PoolMetrics:
+    """
+    Attach pool metrics to an engine.
+    
+    Args:
+        engine: Engine to instrument (created with InstrumentedQueuePool
+            for checkout latency; other pools still get the event counters)
+        name: Label for the metrics
+        
+    Returns:
+        PoolMetrics fed by the engine's pool events
+    """
+    metrics = PoolMetrics(name)
+    if isinstance(engine.pool, InstrumentedQueuePool):
+        engine.pool.metrics = metrics
+    
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        pool = engine.pool
+        metrics.on_checkout(pool.overflow() if isinstance(pool, QueuePool) else 0)
+    
+    event.listen(engine, "connect", metrics.on_connect)
+    event.listen(engine, "checkout", on_checkout)
+    event.listen(engine, "checkin", metrics.on_checkin)
+    event.listen(engine, "invalidate", metrics.on_invalidate)
+    return metrics
@@ -0,0 +1,45 @@
+"""
+Model instances built from the rows of INSERT/UPDATE ... RETURNING statements.
+
+Writes return their rows as plain columns and the response is built from
+them, so committing (which expires everything in the session) never
+triggers a reload, and objects the caller already holds are left alone.
+"""
+from typing import Any, List, Mapping, Type, TypeVar
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import make_transient_to_detached
+
+ModelT = TypeVar("ModelT")
+
+
+def returning_columns(model: Type[Any]) -> List[Any]:
+    """
+    Get the columns a write should return: all but deferred ones.
+    
+    Args:
+        model: Mapped class
+    
+    Returns:
+        List of table columns
+    """
+    return [attr.columns[0] for attr in inspect(model).column_attrs if not attr.deferred]
+
+
+def detached(model: Type[ModelT], values: Mapping[str, Any]) -> ModelT:
+    """
+    Build a detached instance from column values.
+    
+    The instance has an identity but belongs to no session; unloaded
+    attributes (deferred columns, relationships) cannot be read.
+    
+    Args:
+        model: Mapped class
+        values: Column values, e.g. a RETURNING row's _mapping
+    
+    Returns:
+        Detached instance
+    """
+    instance = model(**values)
+    make_transient_to_detached(instance)
+    return instance
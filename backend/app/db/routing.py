@@ -0,0 +1,187 @@
+"""
+Read-replica routing for SQLAlchemy sessions.
+"""
+import itertools
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine, Result
+from sqlalchemy.exc import OperationalError, SQLAlchemyError
+from sqlalchemy.orm import ORMExecuteState, Session
+from sqlalchemy.sql.dml import UpdateBase
+
+logger = logging.getLogger(__name__)
+
+
+class ReplicaSet:
+    """
+    Round-robin pool of read replicas with background health checks.
+
+    ``start`` runs a daemon thread pinging every replica with ``SELECT 1``
+    once per ``health_check_seconds``; ``choose`` only reads the last
+    results, so a request never waits on a connect to a dead replica.
+    Replicas not checked yet, failing their check, or marked down after
+    an error are skipped until their next check succeeds.
+    """
+
+    def __init__(
+        self,
+        urls: List[str],
+        engine_factory: Callable[[str], Engine],
+        health_check_seconds: float = 10.0
+    ):
+        self.urls = list(urls)
+        self.engines = [engine_factory(url) for url in self.urls]
+        self.health_check_seconds = health_check_seconds
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+        # index -> (checked_at, healthy)
+        self._health: Dict[int, tuple] = {}
+        self.reads = [0] * len(self.engines)
+        self._stopped = threading.Event()
+        self._checker: Optional[threading.Thread] = None
+
+    def __len__(self) -> int:
+        return len(self.engines)
+
+    def choose(self) -> Optional[Engine]:
+        """
+        Pick the next healthy replica, without connecting to any.
+        
+        Returns:
+            Engine of a healthy replica, or None if none is available
+        """
+        if not self.engines:
+            return None
+        
+        with self._lock:
+            start = next(self._counter)
+            for offset in range(len(self.engines)):
+                index = (start + offset) % len(self.engines)
+                if self._health.get(index, (None, False))[1]:
+                    self.reads[index] += 1
+                    return self.engines[index]
+        return None
+
+    def check(self) -> None:
+        """Ping every replica now and record which ones answer."""
+        for index, engine in enumerate(self.engines):
+            try:
+                with engine.connect() as connection:
+                    connection.execute(text("SELECT 1"))
+                healthy = True
+            except SQLAlchemyError:
+                healthy = False
+            
+            with self._lock:
+                self._health[index] = (time.monotonic(), healthy)
+
+    def start(self) -> None:
+        """Start the background health checks (no-op without replicas)."""
+        if not self.engines or self._checker is not None:
+            return
+        self._stopped.clear()
+        self._checker = threading.Thread(target=self._run_checks, name="replica-health", daemon=True)
+        self._checker.start()
+
+    def stop(self) -> None:
+        """Stop the background health checks after the current round."""
+        self._stopped.set()
+        self._checker = None
+
+    def _run_checks(self) -> None:
+        while True:
+            self.check()
+            if self._stopped.wait(self.health_check_seconds):
+                return
+
+    def mark_down(self, engine: Engine) -> None:
+        """Take a replica out of rotation until its next health check."""
+        with self._lock:
+            index = self.engines.index(engine)
+            self._health[index] = (time.monotonic(), False)
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """
+        Get per-replica counters.
+        
+        Returns:
+            List with url (password hidden), health and read count per replica
+        """
+        with self._lock:
+            return [
+                {
+                    "url": engine.url.render_as_string(hide_password=True),
+                    "healthy": self._health.get(index, (None, None))[1],
+                    "reads": self.reads[index],
+                }
+                for index, engine in enumerate(self.engines)
+            ]
+
+
+class RoutingSession(Session):
+    """
+    Session that sends reads to a replica when ``use_replicas`` is set.
+
+    Flushes, and anything after the session has written, always go to
+    the primary bind so a request reads its own writes. A statement
+    failing on the replica with an OperationalError marks the replica
+    down and is retried on the primary, which serves the rest of the
+    session.
+    """
+
+    def __init__(self, *args: Any, replicas: Optional[ReplicaSet] = None, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.replicas = replicas
+        self.use_replicas = False
+        self._replica: Optional[Engine] = None
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if isinstance(clause, UpdateBase):
+            # INSERT/UPDATE/DELETE statements executed directly
+            self.info["wrote"] = True
+        
+        if (
+            self.use_replicas
+            and self.replicas
+            and not self._flushing
+            and not self.info.get("wrote")
+        ):
+            # Keep one replica for the whole session so reads are consistent
+            if self._replica is None:
+                self._replica = self.replicas.choose()
+            if self._replica is not None:
+                return self._replica
+        return super().get_bind(mapper=mapper, clause=clause, **kwargs)
+
+
+    def fall_back_to_primary(self) -> None:
+        """Mark the pinned replica down and read from the primary from now on."""
+        if self._replica is not None:
+            self.replicas.mark_down(self._replica)
+        self._replica = None
+        self.use_replicas = False
+
+
+@event.listens_for(RoutingSession, "after_flush")
+def _mark_written(session: Session, flush_context) -> None:
+    session.info["wrote"] = True
+
+
+@event.listens_for(RoutingSession, "do_orm_execute")
+def _retry_on_primary(orm_execute_state: ORMExecuteState) -> Optional[Result]:
+    session = orm_execute_state.session
+    if not session.use_replicas or session.info.get("wrote"):
+        return None
+    
+    try:
+        return orm_execute_state.invoke_statement()
+    except OperationalError:
+        if session._replica is None:
+            raise
+        logger.warning("Read replica %s failed, retrying on the primary", session._replica.url, exc_info=True)
+        session.fall_back_to_primary()
+        return orm_execute_state.invoke_statement()
@@ -1,38 +1,194 @@
 """
 Database session configuration and dependency.
 """
+import hashlib
+from fastapi import Request
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
-from typing import Generator
+from typing import AsyncGenerator, Generator, Optional
 
 from app.config import settings
+from app.core.cache import TTLCache
+from app.db.pool import InstrumentedQueuePool, instrument_engine, pool_limits
+from app.db.routing import ReplicaSet, RoutingSession
+
+POOL_SIZE, MAX_OVERFLOW = pool_limits(settings)
+
+
+def _pool_args() -> dict:
+    return {
+        "pool_size": POOL_SIZE,
+        "max_overflow": MAX_OVERFLOW,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+    }
+
 
 # Create SQLAlchemy engine
 engine = create_engine(
     settings.database_url,
+    poolclass=InstrumentedQueuePool,
     pool_pre_ping=True,  # Enable connection health checks
-    pool_size=10,
-    max_overflow=20,
     echo=settings.debug,  # Log SQL queries in debug mode
+    **_pool_args()
 )
+pool_metrics = instrument_engine(engine, "primary")
+
+# Pool metrics per replica URL, filled as replica engines are created
+replica_pool_metrics = {}
+
+
+def _create_replica_engine(url: str):
+    replica_engine = create_engine(
+        url,
+        poolclass=InstrumentedQueuePool,
+        pool_pre_ping=True,
+        echo=settings.debug,
+        **_pool_args()
+    )
+    replica_pool_metrics[url] = instrument_engine(replica_engine, "replica")
+    return replica_engine
+
+
+# Read replicas, used for GET requests by RoutingSession
+replicas = ReplicaSet(
+    settings.database_replica_urls,
+    engine_factory=_create_replica_engine,
+    health_check_seconds=settings.replica_health_check_seconds
+)
+
+# Clients that wrote recently, pinned to the primary to read their own writes
+recent_writers = TTLCache(max_size=10000, ttl_seconds=settings.replica_sticky_seconds)
+
+# Request methods whose sessions may read from a replica
+READ_METHODS = {"GET", "HEAD"}
 
 # Create SessionLocal class
 SessionLocal = sessionmaker(
+    class_=RoutingSession,
     autocommit=False,
     autoflush=False,
-    bind=engine
+    bind=engine,
+    replicas=replicas
 )
 
 
-def get_db() -> Generator[Session, None, None]:
+def _client_key(request: Request) -> str:
+    """Identify the caller for the sticky-primary window."""
+    credentials = request.headers.get("authorization")
+    if credentials:
+        return hashlib.sha256(credentials.encode("utf-8")).hexdigest()
+    return request.client.host if request.client else "anonymous"
+
+
+def get_db(request: Request) -> Generator[Session, None, None]:
     """
     Dependency that provides a database session.
     
+    GET/HEAD requests read from a replica when replicas are configured,
+    unless the same client wrote within the sticky window.
+    
+    Args:
+        request: Incoming request
+        
     Yields:
         Session: SQLAlchemy database session
     """
     db = SessionLocal()
+    client_key = _client_key(request) if len(replicas) else None
+    if client_key is not None:
+        db.use_replicas = (
+            request.method in READ_METHODS
+            and recent_writers.get(client_key) is None
+        )
     try:
         yield db
     finally:
+        if client_key is not None and db.info.get("wrote"):
+            recent_writers.set(client_key, True)
         db.close()
+
+# Async drivers for the sync URLs accepted in settings.database_url
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+_async_engine: Optional[AsyncEngine] = None
+_async_sessionmaker: Optional[async_sessionmaker] = None
+
+
+def get_async_database_url() -> str:
+    """
+    Get the database URL for the async engine.
+    
+    Returns:
+        str: settings.async_database_url, or database_url with its driver
+        swapped for the async equivalent (asyncpg / aiosqlite)
+    """
+    if settings.async_database_url:
+        return settings.async_database_url
+    
+    url = make_url(settings.database_url)
+    backend = url.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No async driver configured for '{backend}' databases")
+    return url.set(drivername=ASYNC_DRIVERS[backend]).render_as_string(hide_password=False)
+
+
+def get_async_engine() -> AsyncEngine:
+    """
+    Get the shared async engine, creating it on first use.
+    
+    Created lazily so the async drivers are only needed when
+    settings.database_async is enabled.
+    
+    Returns:
+        AsyncEngine: SQLAlchemy async engine
+    """
+    global _async_engine, _async_sessionmaker
+    if _async_engine is None:
+        url = get_async_database_url()
+        pool_args = {} if url.startswith("sqlite") else _pool_args()
+        _async_engine = create_async_engine(
+            url,
+            pool_pre_ping=True,
+            echo=settings.debug,
+            **pool_args
+        )
+        _async_sessionmaker = async_sessionmaker(
+            bind=_async_engine,
+            autoflush=False,
+            expire_on_commit=False
+        )
+    return _async_engine
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency that provides an async database session.
+    
+    Yields:
+        AsyncSession: SQLAlchemy async database session
+    """
+    get_async_engine()
+    async with _async_sessionmaker() as db:
+        yield db
+
+
+def get_pool_stats() -> dict:
+    """
+    Get connection pool counters for the primary and replica engines.
+    
+    Returns:
+        Dictionary with primary and per-replica pool statistics
+    """
+    return {
+        "primary": pool_metrics.stats(engine.pool),
+        "replicas": [
+            replica_pool_metrics[url].stats(replica_engine.pool)
+            for url, replica_engine in zip(replicas.urls, replicas.engines)
+        ],
+    }
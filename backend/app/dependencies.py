@@ -1,16 +1,21 @@
 """
 Common dependencies for the application.
 """
-from typing import Optional
-from fastapi import Depends, HTTPException, status
+from typing import Callable, List, Optional, Type
+from fastapi import Depends, HTTPException, Query, status
 from fastapi.security import OAuth2PasswordBearer
+from pydantic import BaseModel
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
 from app.db.session import get_db
 from app.core.security import decode_access_token
-from app.core.exceptions import CredentialsException, ForbiddenException
-from app.crud.user import get_user_by_email, is_admin
-from app.models.user import User
+from app.core.exceptions import CredentialsException, ForbiddenException, BadRequestException
+from app.core.cache import token_version_cache
+from app.crud.user import get_principal_by_email, load_token_state, is_admin
+from app.models.user import User, UserRole
+from app.schemas.user import TokenData
+from app.utils.fieldsets import parse_fields
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
@@ -41,7 +46,8 @@ async def get_current_user(
     if email is None:
         raise CredentialsException()
     
-    user = get_user_by_email(db, email=email)
+    # Sync session work must stay off the event loop
+    user = await run_in_threadpool(get_principal_by_email, db, email)
     if user is None:
         raise CredentialsException()
     
@@ -54,17 +60,87 @@ async def get_current_user(
     return user
 
 
+async def get_current_principal(
+    token: str = Depends(oauth2_scheme),
+    db: Session = Depends(get_db)
+) -> TokenData:
+    """
+    Dependency to get the current principal from self-contained token claims.
+    
+    The id and role come straight from the token; only the user's token
+    version and active flag are checked, through a small cache, so most
+    requests never read the users table. Tokens issued before claims were
+    added fall back to a full user lookup.
+    
+    Args:
+        token: JWT token from request header
+        db: Database session
+        
+    Returns:
+        TokenData: Current authenticated principal
+        
+    Raises:
+        CredentialsException: If token is invalid, revoked or user not found
+    """
+    payload = decode_access_token(token)
+    
+    if payload is None:
+        raise CredentialsException()
+    
+    email: Optional[str] = payload.get("sub")
+    if email is None:
+        raise CredentialsException()
+    
+    user_id = payload.get("uid")
+    if user_id is None:
+        user = await get_current_user(token, db)
+        return TokenData(
+            email=user.email,
+            id=user.id,
+            role=user.role,
+            token_version=user.token_version or 0
+        )
+    
+    state = token_version_cache.get(user_id)
+    if state is None:
+        state = await run_in_threadpool(load_token_state, db, user_id)
+    if state is None:
+        raise CredentialsException()
+    
+    token_version, is_active = state
+    if payload.get("tv", 0) != token_version:
+        raise CredentialsException()
+    
+    if not is_active:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Inactive user"
+        )
+    
+    try:
+        role = UserRole(payload.get("role"))
+    except ValueError:
+        raise CredentialsException()
+    
+    return TokenData(
+        email=email,
+        id=user_id,
+        role=role,
+        token_version=token_version
+    )
+
+
 async def get_current_active_admin(
-    current_user: User = Depends(get_current_user)
-) -> User:
+    current_user: TokenData = Depends(get_current_principal)
+) -> TokenData:
     """
     Dependency to ensure the current user is an admin.
     
     Args:
-        current_user: Current authenticated user
+        current_user: Current authenticated principal
         
     Returns:
-        User: Current admin user
+        TokenData: Current admin principal
         
     Raises:
         ForbiddenException: If user is not an admin
@@ -73,3 +149,27 @@ async def get_current_active_admin(
         raise ForbiddenException(detail="Admin privileges required")
     
     return current_user
+
+
+def sparse_fields(schema: Type[BaseModel]) -> Callable[..., Optional[List[str]]]:
+    """
+    Build a dependency reading the ``fields`` sparse fieldset parameter.
+    
+    Args:
+        schema: Response schema the requested fields must belong to
+        
+    Returns:
+        Dependency returning the requested field names, or None for all fields
+    """
+    def dependency(
+        fields: Optional[str] = Query(
+            None,
+            description=f"Comma-separated subset of {schema.__name__} fields to return"
+        )
+    ) -> Optional[List[str]]:
+        try:
+            return parse_fields(fields, schema)
+        except ValueError as exc:
+            raise BadRequestException(detail=str(exc))
+    
+    return dependency
@@ -4,12 +4,15 @@ Main FastAPI application entry point.
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from starlette.concurrency import run_in_threadpool
 from fastapi_limiter import FastAPILimiter
 import redis.asyncio as redis
 import os
 
 from app.config import settings
 from app.api.v1.api import api_router
+from app.core.purge import purge_worker
+from app.db.session import replicas
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -18,8 +21,14 @@ async def lifespan(app: FastAPI):
     REDIS_PORT = os.getenv("REDIS_PORT", "6379")
     redis_instance = redis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}", encoding="utf-8", decode_responses=True)
     await FastAPILimiter.init(redis_instance)
+    # Purges of deleted users interrupted by a previous shutdown
+    await run_in_threadpool(purge_worker.resume)
+    # Replica health is checked in the background, never on a request
+    replicas.start()
     yield
-    # Shutdown logic (if any)
+    # Shutdown logic
+    replicas.stop()
+    purge_worker.shutdown()
 
 app = FastAPI(
     title=settings.project_name,
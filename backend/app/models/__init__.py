@@ -3,8 +3,11 @@ SQLAlchemy models for the application.
 """
 from app.db.base import Base
 from app.models.user import User, UserRole
-from app.models.task import Task, TaskPriority
+from app.models.task import Task, TaskDeletion, TaskPriority
 from app.models.comment import Comment
+from app.models.purge_job import PurgeJob, PurgeJobStatus
 
-__all__ = ["Base", "User", "UserRole", "Task", "TaskPriority", "Comment"]
+__all__ = [
+    "Base", "User", "UserRole", "Task", "TaskDeletion", "TaskPriority", "Comment", "PurgeJob", "PurgeJobStatus"
+]
 
@@ -0,0 +1,69 @@
+"""
+Purge job model for background removal of deleted users.
+"""
+from sqlalchemy import Column, Integer, Text, DateTime, Index, Enum as SQLEnum
+from datetime import datetime, timezone
+import enum
+
+from app.db.base import Base
+
+
+class PurgeJobStatus(str, enum.Enum):
+    """Purge job states."""
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+
+class PurgeJob(Base):
+    """
+    Background removal of a soft-deleted user and their data.
+    
+    Created by DELETE /users/{id}; the purge worker deletes the user's
+    comments and detaches their tasks in bounded chunks, then deletes
+    the user row.
+    """
+    
+    __tablename__ = "purge_jobs"
+    
+    id = Column(Integer, primary_key=True)
+    # Not foreign keys: the user is gone once the job is done, and the
+    # requester may be deleted too
+    user_id = Column(Integer, nullable=False)
+    # Principal who requested the deletion; with admins, the only one
+    # allowed to read the job
+    requested_by = Column(Integer, nullable=True)
+    status = Column(
+        SQLEnum(PurgeJobStatus),
+        default=PurgeJobStatus.PENDING,
+        nullable=False
+    )
+    comments_deleted = Column(Integer, default=0, nullable=False)
+    tasks_released = Column(Integer, default=0, nullable=False)
+    # Failed runs so far; a failed job is retried at retry_at until
+    # settings.purge_max_attempts is reached (retry_at is then null)
+    attempts = Column(Integer, default=0, nullable=False)
+    retry_at = Column(DateTime(timezone=True), nullable=True)
+    error = Column(Text, nullable=True)
+    created_at = Column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False
+    )
+    # Heartbeat: touched after every chunk while the job runs
+    updated_at = Column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+        nullable=False
+    )
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+    
+    __table_args__ = (
+        # Jobs to resume at startup and failed jobs to retry
+        Index("ix_purge_jobs_status", "status"),
+    )
+    
+    def __repr__(self):
+        return f"<PurgeJob(id={self.id}, user_id={self.user_id}, status='{self.status}')>"
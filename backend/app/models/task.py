@@ -1,8 +1,12 @@
 """
 Task model for task management.
 """
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Text, Enum as SQLEnum
-from sqlalchemy.orm import relationship
+from sqlalchemy import (
+    Column, Integer, SmallInteger, String, Boolean, DateTime, ForeignKey, Text,
+    Index, Computed, DDL, event, text, Enum as SQLEnum
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import relationship, deferred, query_expression
 from datetime import datetime, timezone
 import enum
 
@@ -32,8 +36,17 @@ class Task(Base):
         nullable=False,
         index=True
     )
-    created_by = Column(Integer, ForeignKey("users.id"), nullable=False)
-    assigned_to = Column(Integer, ForeignKey("users.id"), nullable=True)
+    # Severity as a number (high > medium > low), so priority sorts and
+    # pages by an indexed column instead of by enum name
+    priority_rank = Column(
+        SmallInteger,
+        Computed("CASE priority WHEN 'HIGH' THEN 3 WHEN 'MEDIUM' THEN 2 WHEN 'LOW' THEN 1 END"),
+        nullable=False
+    )
+    # Tasks outlive their users: deleting a user clears these instead
+    # (NULL created_by reads as "deleted user", NULL assigned_to as unassigned)
+    created_by = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
+    assigned_to = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
     created_at = Column(
         DateTime(timezone=True),
         default=lambda: datetime.now(timezone.utc),
@@ -45,6 +58,49 @@ class Task(Base):
         onupdate=lambda: datetime.now(timezone.utc),
         nullable=False
     )
+    # Weighted title/description/comments document, maintained by database
+    # triggers on PostgreSQL (see migrations 7c2d9e4f1a08, d6a9f2c4e817);
+    # comments of deleted users are left out. Unused elsewhere
+    search_vector = deferred(Column(
+        TSVECTOR().with_variant(Text(), "sqlite"),
+        nullable=True
+    ))
+    
+    __table_args__ = (
+        # List queries: visibility filter, then created_at with the id tie-breaker
+        Index("ix_tasks_assigned_to_created_at", "assigned_to", "created_at", "id"),
+        Index("ix_tasks_created_at", "created_at", "id"),
+        Index("ix_tasks_created_by", "created_by"),
+        # One per sortable field (app.crud.task.TASK_SORT_COLUMNS)
+        Index("ix_tasks_assigned_to_updated_at", "assigned_to", "updated_at", "id"),
+        # Unfiltered delta syncs (GET /tasks/changes, app.api.v1.tasks.get_task_changes)
+        Index("ix_tasks_updated_at", "updated_at", "id"),
+        Index("ix_tasks_assigned_to_due_date", "assigned_to", "due_date", "id"),
+        Index("ix_tasks_assigned_to_priority_rank", "assigned_to", "priority_rank", "id"),
+        Index("ix_tasks_assigned_to_title", "assigned_to", "title", "id"),
+        # Pending tasks are the hot subset; queries must spell the predicate
+        # as "completed IS false" (Task.completed.is_(False)) to match
+        Index(
+            "ix_tasks_pending_assigned_to_created_at",
+            "assigned_to", "created_at", "id",
+            postgresql_where=text("completed IS false"),
+            sqlite_where=text("completed IS 0")
+        ),
+        Index(
+            "ix_tasks_pending_assigned_to_due_date",
+            "assigned_to", "due_date",
+            postgresql_where=text("completed IS false"),
+            sqlite_where=text("completed IS 0")
+        ),
+        Index("ix_tasks_search_vector", "search_vector", postgresql_using="gin").ddl_if(dialect="postgresql"),
+        # Trigram index serving substring and similarity title lookups
+        Index(
+            "ix_tasks_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"}
+        ).ddl_if(dialect="postgresql"),
+    )
     
     # Relationships
     creator = relationship(
@@ -57,11 +113,53 @@ class Task(Base):
         back_populates="assigned_tasks",
         foreign_keys=[assigned_to]
     )
+    # Deleted by ON DELETE CASCADE, never loaded for a delete
     comments = relationship(
         "Comment",
         back_populates="task",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        passive_deletes=True
     )
+    # Populated only by the comment_count loading profile (app.crud.task.TaskLoad)
+    comment_count = query_expression()
     
     def __repr__(self):
         return f"<Task(id={self.id}, title='{self.title}', completed={self.completed})>"
+
+
+class TaskDeletion(Base):
+    """
+    Tombstone of a task that left an assignee's task list.
+    
+    Written when a task is deleted or reassigned to someone else, so that
+    delta syncs (GET /tasks/changes) can tell clients to drop it.
+    """
+    
+    __tablename__ = "task_deletions"
+    
+    id = Column(Integer, primary_key=True)
+    # Not a foreign key: the task is usually gone
+    task_id = Column(Integer, nullable=False)
+    # Assignee whose list the task left (NULL for unassigned tasks)
+    assigned_to = Column(Integer, nullable=True)
+    deleted_at = Column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False
+    )
+    
+    __table_args__ = (
+        Index("ix_task_deletions_assigned_to_deleted_at", "assigned_to", "deleted_at"),
+        Index("ix_task_deletions_deleted_at", "deleted_at"),
+    )
+    
+    def __repr__(self):
+        return f"<TaskDeletion(task_id={self.task_id}, assigned_to={self.assigned_to})>"
+
+
+# The trigram operator class comes from the pg_trgm extension
+event.listen(
+    Task.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql")
+)
@@ -1,8 +1,9 @@
 """
 User model for authentication and authorization.
 """
-from sqlalchemy import Column, Integer, String, Boolean, Enum as SQLEnum
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Enum as SQLEnum
 from sqlalchemy.orm import relationship
+from datetime import datetime, timezone
 import enum
 
 from app.db.base import Base
@@ -29,22 +30,39 @@ class User(Base):
         nullable=False
     )
     is_active = Column(Boolean, default=True, nullable=False)
+    # Bumped whenever previously issued tokens must stop being accepted
+    token_version = Column(Integer, default=0, server_default="0", nullable=False)
+    # Row version for conditional GETs (ETags of user and comment reads)
+    updated_at = Column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+        nullable=False
+    )
+    # Set when the user is deleted; the row and its data are then removed
+    # in the background (app.core.purge) and hidden from reads until then
+    deleted_at = Column(DateTime(timezone=True), nullable=True)
     
     # Relationships
+    # The database clears or deletes the rows of a deleted user (ON DELETE
+    # SET NULL / CASCADE); passive_deletes keeps the ORM from loading them
     created_tasks = relationship(
         "Task",
         back_populates="creator",
-        foreign_keys="Task.created_by"
+        foreign_keys="Task.created_by",
+        passive_deletes=True
     )
     assigned_tasks = relationship(
         "Task",
         back_populates="assignee",
-        foreign_keys="Task.assigned_to"
+        foreign_keys="Task.assigned_to",
+        passive_deletes=True
     )
     comments = relationship(
         "Comment",
         back_populates="user",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        passive_deletes=True
     )
     
     def __repr__(self):
@@ -6,7 +6,7 @@ from app.schemas.user import (
 )
 from app.schemas.task import (
     TaskCreate, TaskUpdate, TaskOut, TaskWithDetails, 
-    TaskFilter, TaskSort, TaskStatistics
+    TaskFilter, TaskSort, TaskSortField, TaskStatistics, TaskSuggestion
 )
 from app.schemas.comment import CommentCreate, CommentOut, CommentWithUser
 from app.schemas.common import PaginationParams, PaginatedResponse, MessageResponse
@@ -16,7 +16,7 @@ __all__ = [
     "UserCreate", "UserLogin", "UserUpdate", "UserOut", "UserInDB", "Token", "TokenData",
     # Task schemas
     "TaskCreate", "TaskUpdate", "TaskOut", "TaskWithDetails", 
-    "TaskFilter", "TaskSort", "TaskStatistics",
+    "TaskFilter", "TaskSort", "TaskSortField", "TaskStatistics", "TaskSuggestion",
     # Comment schemas
     "CommentCreate", "CommentOut", "CommentWithUser",
     # Common schemas
@@ -21,16 +21,26 @@ class PaginatedResponse(BaseModel, Generic[T]):
     skip: int
     limit: int
     has_more: bool
+    next_cursor: Optional[str] = Field(None, description="Opaque cursor for the next page")
     
     @classmethod
-    def create(cls, items: List[T], total: int, skip: int, limit: int):
+    def create(
+        cls,
+        items: List[T],
+        total: int,
+        skip: int,
+        limit: int,
+        next_cursor: Optional[str] = None,
+        has_more: Optional[bool] = None
+    ):
         """Factory method to create paginated response."""
         return cls(
             items=items,
             total=total,
             skip=skip,
             limit=limit,
-            has_more=(skip + limit) < total
+            has_more=(skip + limit) < total if has_more is None else has_more,
+            next_cursor=next_cursor
         )
 
 
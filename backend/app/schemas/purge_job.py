@@ -0,0 +1,27 @@
+"""
+Pydantic schemas for PurgeJob model.
+"""
+from datetime import datetime
+from typing import Optional
+from pydantic import BaseModel, Field
+
+from app.models.purge_job import PurgeJobStatus
+
+
+class PurgeJobOut(BaseModel):
+    """Schema for purge job response."""
+    id: int
+    user_id: int
+    requested_by: Optional[int] = None
+    status: PurgeJobStatus
+    comments_deleted: int = Field(..., description="Comments of the user deleted so far")
+    tasks_released: int = Field(..., description="Tasks detached from the user so far")
+    attempts: int = Field(..., description="Failed runs so far")
+    retry_at: Optional[datetime] = Field(None, description="When a failed job is retried, if it still is")
+    error: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+    finished_at: Optional[datetime] = None
+    
+    class Config:
+        from_attributes = True
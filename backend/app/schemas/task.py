@@ -1,9 +1,10 @@
 """
 Pydantic schemas for Task model.
 """
-from typing import Optional
+from enum import Enum
+from typing import List, Optional
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 from app.models.task import TaskPriority
 
 
@@ -22,6 +23,15 @@ class TaskCreate(TaskBase):
     pass
 
 
+# Largest batch POST /tasks/bulk accepts
+TASK_BULK_MAX_ITEMS = 1000
+
+
+class TaskBulkCreate(BaseModel):
+    """Schema for creating many tasks at once."""
+    tasks: List[TaskCreate] = Field(..., min_length=1, max_length=TASK_BULK_MAX_ITEMS)
+
+
 class TaskUpdate(BaseModel):
     """Schema for updating a task."""
     title: Optional[str] = Field(None, min_length=1, max_length=200)
@@ -36,7 +46,7 @@ class TaskOut(TaskBase):
     """Schema for task response."""
     id: int
     completed: bool
-    created_by: int
+    created_by: Optional[int] = Field(None, description="Creator ID, null once the creator is deleted")
     created_at: datetime
     updated_at: datetime
     
@@ -44,6 +54,21 @@ class TaskOut(TaskBase):
         from_attributes = True
 
 
+class TaskBulkCreated(BaseModel):
+    """Schema for a bulk creation response."""
+    created: int
+    tasks: List[TaskOut] = Field(..., description="Created tasks, in request order")
+
+
+class TaskSuggestion(BaseModel):
+    """Schema for a title typeahead suggestion."""
+    id: int
+    title: str
+    
+    class Config:
+        from_attributes = True
+
+
 class TaskWithDetails(TaskOut):
     """Schema for task with creator/assignee details."""
     creator_email: Optional[str] = None
@@ -57,15 +82,66 @@ class TaskFilter(BaseModel):
     priority: Optional[TaskPriority] = None
     created_by: Optional[int] = None
     assigned_to: Optional[int] = None
-    search: Optional[str] = Field(None, description="Search in title and description")
+    search: Optional[str] = Field(None, description="Search in title, description and comments")
     
 
+class TaskSortField(str, Enum):
+    """Fields a task list can be sorted by, each backed by an index."""
+    CREATED_AT = "created_at"
+    UPDATED_AT = "updated_at"
+    DUE_DATE = "due_date"
+    PRIORITY = "priority"
+    TITLE = "title"
+    RELEVANCE = "relevance"
+
+
+class TaskChanges(BaseModel):
+    """Schema for a delta sync response."""
+    changed: List[TaskOut] = Field(..., description="Tasks created or updated since the token, oldest change first")
+    deleted: List[int] = Field(..., description="IDs of tasks deleted or moved out of the caller's view")
+    sync_token: str = Field(..., description="Token to pass as since on the next sync")
+    has_more: bool = Field(..., description="More changes are pending; sync again right away")
+
+
 class TaskSort(BaseModel):
     """Schema for sorting tasks."""
-    field: str = Field("created_at", description="Field to sort by")
+    field: TaskSortField = Field(TaskSortField.CREATED_AT, description="Field to sort by")
     order: str = Field("desc", description="Sort order: asc or desc")
 
 
+class TaskBulkSelection(BaseModel):
+    """Tasks a bulk update or delete applies to: explicit ids or a filter."""
+    ids: Optional[List[int]] = Field(None, min_length=1, max_length=TASK_BULK_MAX_ITEMS)
+    filter: Optional[TaskFilter] = Field(None, description="Applies to every matching task")
+    
+    @model_validator(mode="after")
+    def check_selection(self):
+        if (self.ids is None) == (self.filter is None):
+            raise ValueError("Give either ids or filter")
+        return self
+
+
+class TaskBulkUpdate(TaskBulkSelection):
+    """Schema for updating many tasks at once."""
+    update: TaskUpdate
+    
+    @model_validator(mode="after")
+    def check_update(self):
+        if not self.update.model_fields_set:
+            raise ValueError("No fields to update")
+        return self
+
+
+class TaskBulkResult(BaseModel):
+    """Schema for a bulk update or delete response."""
+    affected: int
+    ids: List[int] = Field(..., description="IDs of the updated or deleted tasks")
+    skipped: List[int] = Field(
+        default_factory=list,
+        description="Requested IDs that do not exist or are not assigned to the caller"
+    )
+
+
 # Statistics schema
 class TaskStatistics(BaseModel):
     """Schema for task statistics."""
@@ -58,5 +58,8 @@ class Token(BaseModel):
 
 
 class TokenData(BaseModel):
-    """Schema for token payload data."""
+    """Schema for token payload data (the authenticated principal)."""
     email: Optional[str] = None
+    id: Optional[int] = None
+    role: Optional[UserRole] = None
+    token_version: int = 0
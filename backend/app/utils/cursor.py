@@ -0,0 +1,44 @@
+"""
+Opaque pagination cursors.
+"""
+import base64
+import json
+from typing import Any, Dict
+
+
+def encode_cursor(data: Dict[str, Any]) -> str:
+    """
+    Encode cursor data as an opaque URL-safe token.
+    
+    Args:
+        data: JSON-serializable cursor fields
+        
+    Returns:
+        str: URL-safe base64 token
+    """
+    raw = json.dumps(data, separators=(",", ":"), sort_keys=True).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(token: str) -> Dict[str, Any]:
+    """
+    Decode a token produced by encode_cursor.
+    
+    Args:
+        token: Cursor token
+        
+    Returns:
+        dict: Cursor fields
+        
+    Raises:
+        ValueError: If the token is malformed
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, UnicodeError) as exc:
+        raise ValueError("Malformed cursor") from exc
+    
+    if not isinstance(data, dict):
+        raise ValueError("Malformed cursor")
+    return data
@@ -0,0 +1,101 @@
+"""
+Strong ETags and If-None-Match handling for conditional GETs.
+"""
+import hashlib
+import json
+from typing import Any, Dict, Optional
+
+from fastapi import Request, Response
+
+from app.schemas.user import TokenData
+
+# Responses depend on the caller, and clients must revalidate every time
+CACHE_CONTROL = "private, no-cache"
+
+
+def compute_etag(*parts: Any) -> str:
+    """
+    Hash the values that determine a response into a strong ETag.
+    
+    Args:
+        parts: JSON-serializable values (datetimes are stringified)
+    
+    Returns:
+        Quoted entity tag
+    """
+    raw = json.dumps(parts, default=str, separators=(",", ":"))
+    return '"' + hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32] + '"'
+
+
+def request_etag(request: Request, principal: TokenData, *version: Any) -> str:
+    """
+    Build the ETag of a read from its URL, its caller and a data version.
+    
+    The version only has to change when the data behind the response
+    does, e.g. a row count plus max(updated_at) over the filtered rows.
+    
+    Args:
+        request: Incoming request (path and query parameters)
+        principal: Current authenticated principal
+        version: Values identifying the state of the data read
+    
+    Returns:
+        Quoted entity tag
+    """
+    query = sorted(request.query_params.multi_items())
+    return compute_etag(request.url.path, query, principal.id, principal.role, *version)
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check an If-None-Match header against an ETag (weak comparison).
+    
+    Args:
+        if_none_match: Header value, possibly a list or "*"
+        etag: Current entity tag
+    
+    Returns:
+        True if the client's copy is current
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+def etag_headers(etag: Optional[str]) -> Dict[str, str]:
+    """
+    Get the response headers advertising an ETag.
+    
+    Args:
+        etag: Entity tag, or None for responses without one
+    
+    Returns:
+        ETag and Cache-Control headers (empty without an ETag)
+    """
+    if etag is None:
+        return {}
+    return {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+
+
+def check_etag(request: Request, response: Response, etag: Optional[str]) -> Optional[Response]:
+    """
+    Answer a conditional GET.
+    
+    Call before loading and serializing the response body. Routes that
+    return their own Response must add etag_headers(etag) to it.
+    
+    Args:
+        request: Incoming request
+        response: Route's response, which receives the ETag headers
+        etag: Current entity tag, or None to skip the check
+    
+    Returns:
+        A 304 Not Modified response if the client's copy is current, else None
+    """
+    headers = etag_headers(etag)
+    if etag is not None and etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
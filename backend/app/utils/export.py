@@ -0,0 +1,75 @@
+"""
+Streaming export formats: NDJSON and CSV chunks built from row batches.
+"""
+import csv
+import enum
+import io
+import json
+from datetime import date
+from typing import Any, Iterable, Iterator, Sequence
+
+# Media type per export format
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+def export_value(value: Any) -> Any:
+    """
+    Convert a column value to its JSON/CSV representation.
+    
+    Args:
+        value: Column value from a result row
+        
+    Returns:
+        ISO 8601 string for dates, the value of an enum, otherwise the value
+    """
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, enum.Enum):
+        return value.value
+    return value
+
+
+# str enums already encode as their value; only dates need the hook
+_json_encoder = json.JSONEncoder(separators=(",", ":"), default=export_value)
+
+
+def ndjson_chunks(batches: Iterable[Sequence[Any]], fields: Sequence[str]) -> Iterator[str]:
+    """
+    Render row batches as newline-delimited JSON, one chunk per batch.
+    
+    Args:
+        batches: Iterable of row batches, columns in the order of fields
+        fields: Field names used as object keys
+        
+    Yields:
+        Chunks of JSON lines
+    """
+    encode = _json_encoder.encode
+    for batch in batches:
+        yield "".join([encode(dict(zip(fields, row))) + "\n" for row in batch])
+
+
+def csv_chunks(batches: Iterable[Sequence[Any]], fields: Sequence[str]) -> Iterator[str]:
+    """
+    Render row batches as CSV with a header row, one chunk per batch.
+    
+    Args:
+        batches: Iterable of row batches, columns in the order of fields
+        fields: Field names for the header row
+        
+    Yields:
+        Chunks of CSV text
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(fields)
+    yield buffer.getvalue()
+    
+    for batch in batches:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows([export_value(value) for value in row] for row in batch)
+        yield buffer.getvalue()
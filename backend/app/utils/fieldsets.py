@@ -0,0 +1,81 @@
+"""
+Sparse fieldsets: parsing the ``fields`` query parameter and dumping only those fields.
+"""
+from typing import Any, Dict, List, Mapping, Optional, Type
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+
+def parse_fields(fields: Optional[str], schema: Type[BaseModel]) -> Optional[List[str]]:
+    """
+    Parse a comma-separated field list against a response schema.
+    
+    Args:
+        fields: Raw parameter value, e.g. "id,title,completed"
+        schema: Response schema the fields must belong to
+    
+    Returns:
+        Requested field names in request order, or None when not given
+    
+    Raises:
+        ValueError: If the list is empty or names fields the schema lacks
+    """
+    if fields is None:
+        return None
+    
+    requested = list(dict.fromkeys(name.strip() for name in fields.split(",") if name.strip()))
+    if not requested:
+        raise ValueError("No fields requested")
+    unknown = [name for name in requested if name not in schema.model_fields]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+    return requested
+
+
+def dump_fields(obj: Any, schema: Type[BaseModel], fields: List[str]) -> Dict[str, Any]:
+    """
+    Serialize only the requested fields of an ORM object.
+    
+    Only those attributes are read, so columns left unloaded are never
+    lazy-loaded. Nested schema fields are serialized with their schema.
+    
+    Args:
+        obj: ORM object loaded with at least the requested attributes
+        schema: Response schema the fields belong to
+        fields: Field names from parse_fields
+    
+    Returns:
+        JSON-compatible dictionary
+    """
+    data = {}
+    for name in fields:
+        value = getattr(obj, name)
+        annotation = schema.model_fields[name].annotation
+        if value is not None and isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            value = annotation.model_validate(value)
+        data[name] = value
+    return jsonable_encoder(data)
+
+
+def sparse_page(
+    page: BaseModel,
+    schema: Type[BaseModel],
+    fields: List[str],
+    headers: Optional[Mapping[str, str]] = None
+) -> JSONResponse:
+    """
+    Render a paginated response whose items carry only the requested fields.
+    
+    Args:
+        page: PaginatedResponse holding ORM objects
+        schema: Item response schema
+        fields: Field names from parse_fields
+        headers: Extra response headers
+        
+    Returns:
+        JSONResponse bypassing the route's full response model
+    """
+    page.items = [dump_fields(item, schema, fields) for item in page.items]
+    return JSONResponse(content=jsonable_encoder(page), headers=headers)
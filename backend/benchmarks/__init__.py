@@ -0,0 +1,5 @@
+"""
+Micro- and load benchmarks for the backend.
+
+Run from the backend directory, e.g. ``python -m benchmarks.auth_claims``.
+"""
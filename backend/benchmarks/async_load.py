@@ -0,0 +1,117 @@
+"""
+p99 latency of GET /tasks with the sync and async database paths.
+
+Starts uvicorn once per mode (``DATABASE_ASYNC`` false/true) against the
+same database and fires requests from a fixed number of concurrent
+clients. Point DATABASE_URL at Postgres for meaningful numbers; the
+default SQLite file only checks that both modes work.
+
+    python -m benchmarks.async_load [concurrency] [requests_per_client]
+"""
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+import httpx
+
+from benchmarks.common import make_client
+from app.config import settings
+from app.core.security import build_token_claims, create_access_token, get_password_hash
+from app.models.task import Task
+from app.models.user import User, UserRole
+
+PORT = 8765
+
+
+def seed(task_count: int = 1000) -> str:
+    """Create a user with tasks and return a bearer token for it."""
+    _, session_factory = make_client(settings.database_url)
+    db = session_factory()
+    user = User(
+        email="load@example.com",
+        hashed_password=get_password_hash("loadpassword"),
+        role=UserRole.REGULAR,
+        is_active=True
+    )
+    db.add(user)
+    db.commit()
+    db.add_all(
+        Task(title=f"Task {i}", created_by=user.id, assigned_to=user.id)
+        for i in range(task_count)
+    )
+    db.commit()
+    token = create_access_token(data=build_token_claims(user))
+    db.close()
+    return token
+
+
+async def run_clients(token: str, concurrency: int, per_client: int) -> list:
+    """Fire requests from concurrent clients and collect latencies in ms."""
+    latencies = []
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{PORT}", limits=limits, timeout=60) as client:
+        async def worker():
+            for _ in range(per_client):
+                start = time.perf_counter()
+                response = await client.get(
+                    "/api/v1/tasks/?limit=20",
+                    headers={"Authorization": f"Bearer {token}"}
+                )
+                response.raise_for_status()
+                latencies.append((time.perf_counter() - start) * 1000)
+        
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies
+
+
+def measure(async_mode: bool, token: str, concurrency: int, per_client: int) -> dict:
+    """Run one server in the given mode and return latency percentiles."""
+    env = dict(os.environ, DATABASE_ASYNC=str(async_mode).lower())
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(PORT), "--lifespan", "off", "--log-level", "warning"],
+        env=env
+    )
+    try:
+        for _ in range(100):
+            try:
+                httpx.get(f"http://127.0.0.1:{PORT}/")
+                break
+            except httpx.TransportError:
+                time.sleep(0.1)
+        
+        # Warm the token caches so the run measures the steady state
+        httpx.get(
+            f"http://127.0.0.1:{PORT}/api/v1/tasks/?limit=1",
+            headers={"Authorization": f"Bearer {token}"}
+        ).raise_for_status()
+        
+        latencies = asyncio.run(run_clients(token, concurrency, per_client))
+    finally:
+        server.terminate()
+        server.wait()
+    
+    latencies.sort()
+    return {
+        "p50": statistics.median(latencies),
+        "p99": latencies[int(len(latencies) * 0.99) - 1],
+        "max": latencies[-1],
+    }
+
+
+def main(concurrency: int = 500, per_client: int = 4) -> None:
+    token = seed()
+    for async_mode in (False, True):
+        result = measure(async_mode, token, concurrency, per_client)
+        label = "async" if async_mode else "sync "
+        print(
+            f"{label}: p50 {result['p50']:8.1f} ms   p99 {result['p99']:8.1f} ms   "
+            f"max {result['max']:8.1f} ms   ({concurrency} clients)"
+        )
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:3]]
+    main(*args)
@@ -0,0 +1,55 @@
+"""
+Requests per second with self-contained token claims vs a per-request user lookup.
+
+    python -m benchmarks.auth_claims [iterations]
+"""
+import sys
+
+from benchmarks.common import make_client, rate
+from app.core.cache import principal_cache, token_version_cache
+from app.core.security import create_access_token, build_token_claims, get_password_hash
+from app.models.user import User, UserRole
+
+
+def main(iterations: int = 2000) -> None:
+    client, session_factory = make_client()
+    
+    db = session_factory()
+    user = User(
+        email="bench@example.com",
+        hashed_password=get_password_hash("benchpassword"),
+        full_name="Bench User",
+        role=UserRole.REGULAR,
+        is_active=True
+    )
+    db.add(user)
+    db.commit()
+    db.refresh(user)
+    
+    legacy_token = create_access_token(data={"sub": user.email})
+    claims_token = create_access_token(data=build_token_claims(user))
+    db.close()
+    
+    def request(token):
+        return lambda: client.get(
+            "/api/v1/tasks/?limit=1",
+            headers={"Authorization": f"Bearer {token}"}
+        )
+    
+    # Baseline: subject-only token with the principal cache disabled,
+    # i.e. one users query per request
+    principal_cache.max_size = 0
+    lookup_rps = rate(iterations, request(legacy_token))
+    
+    principal_cache.max_size = 1024
+    token_version_cache.clear()
+    claims_rps = rate(iterations, request(claims_token))
+    
+    print(f"per-request user lookup : {lookup_rps:8.1f} req/s")
+    print(f"self-contained claims   : {claims_rps:8.1f} req/s")
+    print(f"speedup                 : {claims_rps / lookup_rps:8.2f}x")
+    print(f"token version cache     : {token_version_cache.stats()}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
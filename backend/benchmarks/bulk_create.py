@@ -0,0 +1,68 @@
+"""
+Task import throughput: one POST /tasks per task vs POST /tasks/bulk.
+
+    python -m benchmarks.bulk_create [tasks]
+
+Set DATABASE_URL to a PostgreSQL database to measure real network round
+trips; there each bulk request inserts its batch with a single statement.
+"""
+import os
+import sys
+import time
+
+from sqlalchemy import event
+
+from benchmarks.common import make_client
+from app.core.security import build_token_claims, create_access_token
+from app.models.user import User, UserRole
+from app.schemas.task import TASK_BULK_MAX_ITEMS
+
+
+def main(tasks: int = 2000) -> None:
+    client, session_factory = make_client(os.environ.get("DATABASE_URL"))
+    
+    db = session_factory()
+    user = User(
+        email="bench@example.com",
+        hashed_password="not-a-real-hash",
+        full_name="Bench User",
+        role=UserRole.REGULAR,
+        is_active=True
+    )
+    db.add(user)
+    db.commit()
+    db.refresh(user)
+    headers = {"Authorization": f"Bearer {create_access_token(data=build_token_claims(user))}"}
+    statements = []
+    event.listen(db.get_bind(), "before_cursor_execute", lambda *args: statements.append(1))
+    db.close()
+    
+    payload = [{"title": f"Imported task {i}", "priority": "high" if i % 3 == 0 else "medium"} for i in range(tasks)]
+    
+    def single():
+        for item in payload:
+            response = client.post("/api/v1/tasks/", json=item, headers=headers)
+            assert response.status_code == 201, response.text
+    
+    def bulk():
+        for start in range(0, tasks, TASK_BULK_MAX_ITEMS):
+            batch = payload[start:start + TASK_BULK_MAX_ITEMS]
+            response = client.post("/api/v1/tasks/bulk", json={"tasks": batch}, headers=headers)
+            assert response.status_code == 201, response.text
+    
+    results = {}
+    for name, fn in (("POST /tasks", single), ("POST /tasks/bulk", bulk)):
+        statements.clear()
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        results[name] = (len(statements) / tasks, tasks / elapsed)
+    
+    for name, (round_trips, tasks_per_second) in results.items():
+        print(f"{name:17}: {round_trips:6.3f} round trips/task, {tasks_per_second:9.1f} tasks/s")
+    single_rate, bulk_rate = results["POST /tasks"][1], results["POST /tasks/bulk"][1]
+    print(f"speedup          : {bulk_rate / single_rate:9.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,71 @@
+"""
+Shared helpers for benchmarks.
+"""
+import os
+import tempfile
+import time
+from typing import Callable, Tuple
+
+# Settings are read at import time, so provide defaults before importing the app
+os.environ.setdefault("DATABASE_URL", "sqlite:///" + os.path.join(tempfile.gettempdir(), "avocado_bench.db"))
+os.environ.setdefault("SECRET_KEY", "benchmark-secret-key")
+# No Redis server is needed: the response cache runs in process
+os.environ.setdefault("RESPONSE_CACHE_FAKE_REDIS", "true")
+# Purge deleted users inline, after the response, so no thread competes for SQLite
+os.environ.setdefault("PURGE_WORKER_THREADS", "0")
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from app.main import app  # noqa: E402
+from app.db.base import Base  # noqa: E402
+from app.db.session import get_db  # noqa: E402
+
+
+def make_client(database_url: str = None) -> Tuple[TestClient, sessionmaker]:
+    """
+    Build a test client bound to a fresh benchmark database.
+    
+    The client is not entered as a context manager, so the application
+    lifespan (and its Redis connection) is skipped.
+    
+    Args:
+        database_url: Optional database URL, defaults to a temporary SQLite file
+        
+    Returns:
+        Tuple of (TestClient, session factory)
+    """
+    url = database_url or "sqlite:///" + os.path.join(tempfile.gettempdir(), "avocado_bench.db")
+    connect_args = {"check_same_thread": False} if url.startswith("sqlite") else {}
+    engine = create_engine(url, connect_args=connect_args)
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    
+    def override_get_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+    
+    app.dependency_overrides[get_db] = override_get_db
+    return TestClient(app), session_factory
+
+
+def rate(iterations: int, fn: Callable[[], object]) -> float:
+    """
+    Run fn repeatedly and return calls per second.
+    
+    Args:
+        iterations: Number of calls
+        fn: Callable to benchmark
+        
+    Returns:
+        Calls per second
+    """
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return iterations / (time.perf_counter() - start)
@@ -0,0 +1,142 @@
+"""
+EXPLAIN the hot task and comment queries and flag full table scans.
+
+    DATABASE_URL=postgresql://... python -m benchmarks.explain_tasks [tasks] [users]
+
+Seeds the given number of tasks spread over users, runs ANALYZE, then
+captures the SQL of each crud call and prints its plan. Exits with status 1
+when any of them reads tasks or comments with a sequential scan.
+"""
+import json
+import os
+import random
+import sys
+from datetime import datetime, timedelta, timezone
+from typing import List, Tuple
+
+from sqlalchemy import event, insert, text
+
+from benchmarks.common import make_client
+from app.crud import comment as crud_comment
+from app.crud import task as crud_task
+from app.models.comment import Comment
+from app.models.task import Task, TaskPriority
+from app.models.user import User, UserRole
+from app.schemas.task import TaskFilter
+
+
+def seed(session_factory, tasks: int, users: int, batch: int = 10000) -> None:
+    """Insert users, tasks spread over them and comments on the first task."""
+    db = session_factory()
+    db.execute(insert(User), [
+        {
+            "email": f"bench{i}@example.com",
+            "hashed_password": "not-a-real-hash",
+            "role": UserRole.REGULAR,
+            "is_active": True,
+        }
+        for i in range(users)
+    ])
+    rng = random.Random(42)
+    now = datetime.now(timezone.utc)
+    for start in range(0, tasks, batch):
+        db.execute(insert(Task), [
+            {
+                "title": f"Task {i}",
+                "priority": rng.choice(list(TaskPriority)),
+                "completed": rng.random() < 0.6,
+                "created_by": rng.randint(1, users),
+                "assigned_to": rng.randint(1, users),
+                "due_date": now + timedelta(days=rng.randint(-30, 30)),
+                "created_at": now - timedelta(minutes=i),
+                "updated_at": now - timedelta(minutes=i),
+            }
+            for i in range(start, min(start + batch, tasks))
+        ])
+    db.execute(insert(Comment), [
+        {"content": f"Comment {i}", "task_id": 1 + i % 100, "user_id": 1}
+        for i in range(min(tasks, 10000))
+    ])
+    db.commit()
+    db.execute(text("ANALYZE"))
+    db.commit()
+    db.close()
+
+
+def explain(db, statement: str, parameters) -> Tuple[List[str], List[str]]:
+    """Return (plan lines, full-scan lines) for a captured statement."""
+    connection = db.connection()
+    if connection.dialect.name == "postgresql":
+        plan = connection.exec_driver_sql("EXPLAIN (FORMAT JSON) " + statement, parameters).scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        lines, stack = [], [(plan[0]["Plan"], 0)]
+        while stack:
+            node, depth = stack.pop()
+            relation = node.get("Relation Name", "")
+            index = node.get("Index Name", "")
+            lines.append("  " * depth + " ".join(filter(None, [node["Node Type"], relation, index])))
+            stack.extend((child, depth + 1) for child in reversed(node.get("Plans", [])))
+        scans = [line for line in lines if line.strip() in ("Seq Scan tasks", "Seq Scan comments")]
+        return lines, scans
+    
+    rows = connection.exec_driver_sql("EXPLAIN QUERY PLAN " + statement, parameters).fetchall()
+    lines = [row[-1] for row in rows]
+    scans = [line for line in lines if line in ("SCAN tasks", "SCAN comments")]
+    return lines, scans
+
+
+def main(tasks: int = 200000, users: int = 200) -> None:
+    _, session_factory = make_client(os.environ.get("DATABASE_URL"))
+    seed(session_factory, tasks, users)
+    db = session_factory()
+    user_id = 7
+    
+    hot_queries = {
+        "user list": lambda: crud_task.get_tasks_page(db, limit=21, filters=TaskFilter(assigned_to=user_id)),
+        "user pending list": lambda: crud_task.get_tasks_page(
+            db, limit=21, filters=TaskFilter(assigned_to=user_id, completed=False)
+        ),
+        "admin list": lambda: crud_task.get_tasks_page(db, limit=21),
+        "pending count": lambda: crud_task.get_tasks_count(
+            db, filters=TaskFilter(assigned_to=user_id, completed=False)
+        ),
+        "statistics": lambda: crud_task.get_task_statistics(db, user_id=user_id),
+        "user delta sync": lambda: crud_task.get_tasks(
+            db, limit=501, filters=TaskFilter(assigned_to=user_id), sort_by="updated_at", sort_order="asc",
+            after=(datetime.now(timezone.utc) - timedelta(hours=1), 0)
+        ),
+        "user deletions": lambda: crud_task.get_deleted_task_ids(
+            db, datetime.now(timezone.utc) - timedelta(hours=1), filters=TaskFilter(assigned_to=user_id)
+        ),
+        "comment list": lambda: crud_comment.get_task_comments(db, task_id=1),
+    }
+    
+    captured = []
+    event.listen(
+        db.get_bind(), "before_cursor_execute",
+        lambda conn, cursor, statement, parameters, context, executemany: captured.append((statement, parameters))
+    )
+    
+    failures = 0
+    for name, run in hot_queries.items():
+        captured.clear()
+        run()
+        statements = list(captured)
+        print(f"== {name} ({len(statements)} statements)")
+        for statement, parameters in statements:
+            lines, scans = explain(db, statement, parameters)
+            for line in lines:
+                print(f"   {line}")
+            if scans:
+                failures += 1
+                print("   !! full table scan")
+    db.close()
+    
+    print(f"{failures} statements with full table scans")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:3]]
+    main(*args)
@@ -0,0 +1,79 @@
+"""
+Round trips and latency of a task list page: rows + separate COUNT vs one query.
+
+    python -m benchmarks.list_total [tasks] [iterations]
+
+Set DATABASE_URL to a PostgreSQL database to measure real network round trips.
+"""
+import os
+import sys
+
+from sqlalchemy import event, insert
+
+from benchmarks.common import make_client, rate
+from app.crud import task as crud_task
+from app.models.task import Task, TaskPriority
+from app.models.user import User, UserRole
+from app.schemas.task import TaskFilter
+
+
+def seed(session_factory, tasks: int) -> int:
+    """Insert one user owning the given number of tasks and return the user id."""
+    db = session_factory()
+    user = User(
+        email="bench@example.com",
+        hashed_password="not-a-real-hash",
+        full_name="Bench User",
+        role=UserRole.REGULAR,
+        is_active=True
+    )
+    db.add(user)
+    db.commit()
+    priorities = list(TaskPriority)
+    db.execute(insert(Task), [
+        {
+            "title": f"Task {i}",
+            "priority": priorities[i % 3],
+            "completed": i % 4 == 0,
+            "created_by": user.id,
+            "assigned_to": user.id,
+        }
+        for i in range(tasks)
+    ])
+    db.commit()
+    user_id = user.id
+    db.close()
+    return user_id
+
+
+def main(tasks: int = 20000, iterations: int = 500) -> None:
+    _, session_factory = make_client(os.environ.get("DATABASE_URL"))
+    user_id = seed(session_factory, tasks)
+    filters = TaskFilter(assigned_to=user_id, completed=False)
+    
+    db = session_factory()
+    statements = []
+    event.listen(db.get_bind(), "before_cursor_execute", lambda *args: statements.append(1))
+    
+    def two_queries():
+        crud_task.get_tasks(db, skip=100, limit=21, filters=filters)
+        crud_task.get_tasks_count(db, filters=filters)
+    
+    def one_query():
+        crud_task.get_tasks_page(db, skip=100, limit=21, filters=filters)
+    
+    results = {}
+    for name, fn in (("rows + COUNT", two_queries), ("one query", one_query)):
+        fn()
+        statements.clear()
+        pages_per_second = rate(iterations, fn)
+        results[name] = (len(statements) / iterations, pages_per_second)
+    db.close()
+    
+    for name, (round_trips, pages_per_second) in results.items():
+        print(f"{name:13}: {round_trips:.1f} round trips/page, {pages_per_second:8.1f} pages/s")
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:3]]
+    main(*args)
@@ -0,0 +1,120 @@
+"""
+Latency of a task search: substring ILIKE scan vs the full-text GIN index.
+
+    DATABASE_URL=postgresql://... python -m benchmarks.search [tasks] [iterations]
+
+Both sides run the same list page (rows plus total); the baseline swaps
+in the previous title/description ILIKE filter. Seeded words are common
+(each matches about a quarter to a half of the tasks) except RARE_WORD,
+in one task per thousand. Full-text search only runs on PostgreSQL; on
+SQLite this measures the LIKE fallback alone. Seeding one million tasks
+takes a few minutes.
+"""
+import os
+import random
+import statistics
+import sys
+import time
+from contextlib import contextmanager
+
+from sqlalchemy import insert, or_, text
+
+from benchmarks.common import make_client
+from app.crud import task as crud_task
+from app.models.task import Task, TaskPriority
+from app.models.user import User, UserRole
+from app.schemas.task import TaskFilter
+
+WORDS = (
+    "invoice report deploy review meeting budget client server backup design "
+    "release migrate schedule audit refactor onboarding contract payroll survey"
+).split()
+RARE_WORD = "escalation"
+
+
+def seed(session_factory, tasks: int, batch: int = 10000) -> int:
+    """Insert one user owning the given number of tasks and return the user id."""
+    db = session_factory()
+    user = User(
+        email="bench@example.com",
+        hashed_password="not-a-real-hash",
+        full_name="Bench User",
+        role=UserRole.REGULAR,
+        is_active=True
+    )
+    db.add(user)
+    db.commit()
+    rng = random.Random(42)
+    priorities = list(TaskPriority)
+    for start in range(0, tasks, batch):
+        db.execute(insert(Task), [
+            {
+                "title": " ".join(rng.sample(WORDS, 3)) + f" {i}",
+                "description": " ".join(rng.choices(WORDS, k=12) + ([RARE_WORD] if i % 1000 == 0 else [])),
+                "priority": priorities[i % 3],
+                "completed": False,
+                "created_by": user.id,
+                "assigned_to": user.id,
+            }
+            for i in range(start, min(start + batch, tasks))
+        ])
+        db.commit()
+    if crud_task.session_dialect(db) == "postgresql":
+        # The migration's triggers are not installed by create_all
+        db.execute(text(
+            "UPDATE tasks SET search_vector = "
+            "setweight(to_tsvector('english', title), 'A') || "
+            "setweight(to_tsvector('english', coalesce(description, '')), 'B')"
+        ))
+        db.execute(text("ANALYZE tasks"))
+        db.commit()
+    user_id = user.id
+    db.close()
+    return user_id
+
+
+def percentiles(fn, iterations: int) -> str:
+    """Run fn and format p50/p95 latency in milliseconds."""
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return f"p50 {statistics.median(samples):8.1f} ms   p95 {samples[int(len(samples) * 0.95) - 1]:8.1f} ms"
+
+
+@contextmanager
+def ilike_search():
+    """Search with the filter used before full-text search, a title/description ILIKE."""
+    clause = crud_task.task_search_clause
+    crud_task.task_search_clause = lambda search, dialect: or_(
+        Task.title.ilike(f"%{search}%"), Task.description.ilike(f"%{search}%")
+    )
+    try:
+        yield
+    finally:
+        crud_task.task_search_clause = clause
+
+
+def main(tasks: int = 1_000_000, iterations: int = 20) -> None:
+    _, session_factory = make_client(os.environ.get("DATABASE_URL"))
+    user_id = seed(session_factory, tasks)
+    db = session_factory()
+    
+    def page(term, sort_by="created_at"):
+        filters = TaskFilter(assigned_to=user_id, search=term)
+        return lambda: crud_task.get_tasks_page(db, limit=20, filters=filters, sort_by=sort_by)
+    
+    print(f"{tasks} tasks, full-text search: {crud_task.session_dialect(db) == 'postgresql'}")
+    for term in ("payroll", "audit contract", RARE_WORD):
+        with ilike_search():
+            print(f"  {term!r:18} ILIKE, newest   : {percentiles(page(term), iterations)}")
+        print(f"  {term!r:18} search, newest  : {percentiles(page(term), iterations)}")
+        print(f"  {term!r:18} search, relevant: {percentiles(page(term, crud_task.RELEVANCE_SORT), iterations)}")
+    db.close()
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:3]]
+    main(*args)
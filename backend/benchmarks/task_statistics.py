@@ -0,0 +1,108 @@
+"""
+Task statistics of a heavy user: seven COUNT queries vs one aggregate query.
+
+    python -m benchmarks.task_statistics [tasks] [iterations]
+
+Seeds one user with the given number of tasks (created or assigned) among
+tasks of other users. Set DATABASE_URL to a PostgreSQL database to measure
+real scans and network round trips.
+"""
+import os
+import random
+import sys
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import and_, event, func, insert, or_, select, text
+
+from benchmarks.common import make_client, rate
+from app.crud import task as crud_task
+from app.models.task import Task, TaskPriority
+from app.models.user import User, UserRole
+
+
+def seed(session_factory, tasks: int, batch: int = 10000) -> int:
+    """Insert a user with the given number of tasks, plus as many of others, and return the user id."""
+    db = session_factory()
+    db.execute(insert(User), [
+        {
+            "email": f"bench{i}@example.com",
+            "hashed_password": "not-a-real-hash",
+            "role": UserRole.REGULAR,
+            "is_active": True,
+        }
+        for i in range(10)
+    ])
+    user_id = db.scalar(select(User.id).where(User.email == "bench0@example.com"))
+    rng = random.Random(42)
+    now = datetime.now(timezone.utc)
+    for start in range(0, tasks * 2, batch):
+        rows = []
+        for i in range(start, min(start + batch, tasks * 2)):
+            # Even tasks are the user's, as creator, assignee or both
+            owner = user_id if i % 2 == 0 else user_id + 1 + i % 9
+            other = user_id + 1 + rng.randrange(9)
+            created_by, assigned_to = rng.choice([(owner, owner), (owner, other), (other, owner)])
+            rows.append({
+                "title": f"Task {i}",
+                "priority": rng.choice(list(TaskPriority)),
+                "completed": rng.random() < 0.6,
+                "created_by": created_by,
+                "assigned_to": assigned_to,
+                "due_date": now + timedelta(days=rng.randint(-30, 30)) if rng.random() < 0.8 else None,
+                "created_at": now - timedelta(minutes=i),
+                "updated_at": now - timedelta(minutes=i),
+            })
+        db.execute(insert(Task), rows)
+    db.commit()
+    db.execute(text("ANALYZE"))
+    db.commit()
+    db.close()
+    return user_id
+
+
+def seven_counts(db, user_id: int) -> dict:
+    """The previous implementation: one COUNT per counter over the same scope."""
+    scope = or_(Task.created_by == user_id, Task.assigned_to == user_id)
+    
+    def count(*clauses) -> int:
+        return db.scalar(select(func.count(Task.id)).where(scope, *clauses))
+    
+    return crud_task.build_task_statistics(
+        total_tasks=count(),
+        completed_tasks=count(Task.completed.is_(True)),
+        pending_tasks=count(Task.completed.is_(False)),
+        high_priority=count(Task.priority == TaskPriority.HIGH),
+        medium_priority=count(Task.priority == TaskPriority.MEDIUM),
+        low_priority=count(Task.priority == TaskPriority.LOW),
+        overdue_tasks=count(and_(Task.completed.is_(False), Task.due_date < datetime.now(timezone.utc)))
+    )
+
+
+def main(tasks: int = 100000, iterations: int = 20) -> None:
+    _, session_factory = make_client(os.environ.get("DATABASE_URL"))
+    user_id = seed(session_factory, tasks)
+    
+    db = session_factory()
+    statements = []
+    event.listen(db.get_bind(), "before_cursor_execute", lambda *args: statements.append(1))
+    
+    results = {}
+    for name, fn in (
+        ("7 COUNTs", lambda: seven_counts(db, user_id)),
+        ("one query", lambda: crud_task.get_task_statistics(db, user_id=user_id)),
+    ):
+        stats = fn()
+        statements.clear()
+        calls_per_second = rate(iterations, fn)
+        results[name] = (len(statements) / iterations, 1000 / calls_per_second, stats)
+    db.close()
+    
+    assert results["7 COUNTs"][2] == results["one query"][2], "counters differ"
+    print(f"user {user_id}: {results['one query'][2]['total_tasks']} tasks in scope")
+    for name, (round_trips, milliseconds, _) in results.items():
+        print(f"{name:9}: {round_trips:.1f} round trips, {milliseconds:8.2f} ms/call")
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:3]]
+    main(*args)
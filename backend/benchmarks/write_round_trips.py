@@ -0,0 +1,107 @@
+"""
+Database round trips per request of the write endpoints.
+
+    python -m benchmarks.write_round_trips [requests]
+
+Counts the statements and COMMITs each write sends (the implicit BEGIN is
+not counted). The principal's token state is cached before measuring, so
+the numbers are those of the handler alone.
+"""
+import os
+import sys
+from collections import Counter
+from typing import Callable, Dict, List
+
+from sqlalchemy import event
+
+from benchmarks.common import make_client
+from app.core.security import build_token_claims, create_access_token
+from app.models.comment import Comment
+from app.models.task import Task
+from app.models.user import User, UserRole
+
+
+def main(requests: int = 20) -> None:
+    client, session_factory = make_client(os.environ.get("DATABASE_URL"))
+    
+    db = session_factory()
+    users = [
+        User(
+            email=f"bench{i}@example.com",
+            hashed_password="not-a-real-hash",
+            full_name=f"Bench User {i}",
+            role=UserRole.REGULAR,
+            is_active=True
+        )
+        for i in range(2 + requests * 2)
+    ]
+    db.add_all(users)
+    db.commit()
+    user, other = users[0], users[1]
+    spare_ids = [spare.id for spare in users[2:]]
+    headers = {"Authorization": f"Bearer {create_access_token(data=build_token_claims(user))}"}
+    
+    def seed_tasks(count: int) -> List[int]:
+        tasks = [Task(title=f"Task {i}", created_by=user.id, assigned_to=user.id) for i in range(count)]
+        db.add_all(tasks)
+        db.commit()
+        return [task.id for task in tasks]
+    
+    def seed_comments(task_id: int, count: int) -> List[int]:
+        comments = [Comment(content=f"Comment {i}", task_id=task_id, user_id=user.id) for i in range(count)]
+        db.add_all(comments)
+        db.commit()
+        return [comment.id for comment in comments]
+    
+    task_ids = seed_tasks(requests * 3)
+    updated, reassigned, deleted = (task_ids[i::3] for i in range(3))
+    comment_ids = seed_comments(updated[0], requests * 2)
+    edited, removed = comment_ids[::2], comment_ids[1::2]
+    renamed, removed_users = spare_ids[::2], spare_ids[1::2]
+    other_id = other.id
+    db.close()
+    
+    endpoints: Dict[str, Callable[[int], object]] = {
+        "POST /tasks": lambda i: client.post("/api/v1/tasks/", json={"title": f"New {i}"}, headers=headers),
+        "PUT /tasks/{id}": lambda i: client.put(
+            f"/api/v1/tasks/{updated[i]}", json={"completed": True}, headers=headers
+        ),
+        "PUT /tasks/{id} (reassign)": lambda i: client.put(
+            f"/api/v1/tasks/{reassigned[i]}", json={"assigned_to": other_id}, headers=headers
+        ),
+        "DELETE /tasks/{id}": lambda i: client.delete(f"/api/v1/tasks/{deleted[i]}", headers=headers),
+        "POST /tasks/{id}/comments": lambda i: client.post(
+            f"/api/v1/tasks/{updated[0]}/comments", json={"content": f"New {i}"}, headers=headers
+        ),
+        "PUT /tasks/{id}/comments/{id}": lambda i: client.put(
+            f"/api/v1/tasks/{updated[0]}/comments/{edited[i]}", json={"content": "Edited"}, headers=headers
+        ),
+        "DELETE /tasks/{id}/comments/{id}": lambda i: client.delete(
+            f"/api/v1/tasks/{updated[0]}/comments/{removed[i]}", headers=headers
+        ),
+        "PUT /users/{id}": lambda i: client.put(
+            f"/api/v1/users/{renamed[i]}", json={"full_name": "Renamed"}, headers=headers
+        ),
+        "DELETE /users/{id}": lambda i: client.delete(f"/api/v1/users/{removed_users[i]}", headers=headers),
+    }
+    
+    counts = Counter()
+    engine = session_factory.kw["bind"]
+    event.listen(engine, "before_cursor_execute", lambda *args: counts.update(["statements"]))
+    event.listen(engine, "commit", lambda conn: counts.update(["commits"]))
+    
+    # Caches the principal's token state
+    client.get("/api/v1/tasks/?limit=1", headers=headers)
+    
+    print(f"{'endpoint':34} {'statements':>10} {'commits':>8} {'round trips':>12}")
+    for name, request in endpoints.items():
+        counts.clear()
+        for i in range(requests):
+            response = request(i)
+            assert response.status_code < 300, f"{name}: {response.status_code} {response.text}"
+        statements, commits = counts["statements"] / requests, counts["commits"] / requests
+        print(f"{name:34} {statements:10.1f} {commits:8.1f} {statements + commits:12.1f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
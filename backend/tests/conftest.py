@@ -10,9 +10,13 @@ from sqlalchemy.orm import sessionmaker, Session
 from app.main import app
 from app.db.base import Base
 from app.db.session import get_db
-from app.dependencies import get_current_user
+from app.dependencies import get_current_user, get_current_principal
 from app.models.user import User, UserRole
 from app.core.security import get_password_hash
+from app.schemas.user import TokenData
+from app.core.cache import principal_cache, token_cache, token_version_cache
+from app.core.response_cache import FakeRedis, response_cache
+from app.core.purge import purge_worker
 
 
 # Test database URL (using in-memory SQLite for tests)
@@ -24,6 +28,9 @@ engine = create_engine(
     connect_args={"check_same_thread": False}
 )
 
+# Cache responses in process instead of on a Redis server
+response_cache.client = FakeRedis()
+
 # Create test session
 TestingSessionLocal = sessionmaker(
     autocommit=False,
@@ -31,6 +38,10 @@ TestingSessionLocal = sessionmaker(
     bind=engine
 )
 
+# Purge deleted users inline (after the response) in the test database
+purge_worker.session_factory = TestingSessionLocal
+purge_worker.max_workers = 0
+
 
 @pytest.fixture(scope="function")
 def db() -> Generator[Session, None, None]:
@@ -40,6 +51,12 @@ def db() -> Generator[Session, None, None]:
     # Create all tables
     Base.metadata.create_all(bind=engine)
     
+    # Cached principals must not leak between test databases
+    principal_cache.clear()
+    token_version_cache.clear()
+    token_cache.clear()
+    response_cache.clear()
+    
     # Create session
     db_session = TestingSessionLocal()
     
@@ -146,6 +163,15 @@ def override_get_current_user(test_user: User):
     async def _override():
         return test_user
     
+    async def _override_principal():
+        return TokenData(
+            email=test_user.email,
+            id=test_user.id,
+            role=test_user.role,
+            token_version=test_user.token_version
+        )
+    
     app.dependency_overrides[get_current_user] = _override
+    app.dependency_overrides[get_current_principal] = _override_principal
     yield
     app.dependency_overrides.clear()
@@ -0,0 +1,176 @@
+"""
+Unit tests for the async database path.
+"""
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
+
+from app.api.v1 import tasks_async, comments_async
+from app.crud.aio import task as crud_task
+from app.crud.aio import comment as crud_comment
+from app.db.session import get_async_db
+from app.dependencies import get_current_principal
+from app.models.user import User
+from app.schemas.comment import CommentCreate
+from app.schemas.task import TaskCreate, TaskUpdate, TaskFilter
+from app.schemas.user import TokenData
+from tests.conftest import SQLALCHEMY_TEST_DATABASE_URL
+
+
+ASYNC_TEST_DATABASE_URL = SQLALCHEMY_TEST_DATABASE_URL.replace("sqlite://", "sqlite+aiosqlite://")
+
+
+@pytest.fixture
+async def async_db(db: Session):
+    """Async session on the same test database as the sync fixtures."""
+    engine = create_async_engine(ASYNC_TEST_DATABASE_URL)
+    session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+    async with session_factory() as session:
+        yield session
+    await engine.dispose()
+
+
+@pytest.fixture
+def async_client(db: Session, test_user: User):
+    """Client for an app serving only the async task and comment routes."""
+    engine = create_async_engine(ASYNC_TEST_DATABASE_URL)
+    session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+    
+    async def override_get_async_db():
+        async with session_factory() as session:
+            yield session
+    
+    async def override_principal():
+        return TokenData(email=test_user.email, id=test_user.id, role=test_user.role)
+    
+    app = FastAPI()
+    app.include_router(tasks_async.router, prefix="/tasks")
+    app.include_router(comments_async.router)
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    app.dependency_overrides[get_current_principal] = override_principal
+    
+    with TestClient(app) as client:
+        yield client
+
+
+class TestAsyncCrud:
+    """Tests for the async CRUD functions."""
+    
+    async def test_task_lifecycle(self, async_db, test_user: User):
+        """Test creating, listing, updating and deleting a task."""
+        task = await crud_task.create_task(
+            async_db,
+            TaskCreate(title="Async Task", assigned_to=test_user.id),
+            creator_id=test_user.id
+        )
+        assert task.id is not None
+        
+        filters = TaskFilter(assigned_to=test_user.id)
+        tasks = await crud_task.get_tasks(async_db, filters=filters)
+        assert [t.id for t in tasks] == [task.id]
+        assert await crud_task.get_tasks_count(async_db, filters=filters) == 1
+        
+        updated = await crud_task.update_task(async_db, task.id, TaskUpdate(completed=True))
+        assert updated.completed is True
+        
+        stats = await crud_task.get_task_statistics(async_db, user_id=test_user.id)
+        assert stats["completed_tasks"] == 1
+        assert stats["completion_rate"] == 100.0
+        
+        assert await crud_task.delete_task(async_db, task.id) is True
+        assert await crud_task.get_task(async_db, task.id) is None
+    
+    async def test_comment_author_is_loaded(self, async_db, test_user: User):
+        """Test that created comments come back with their author."""
+        task = await crud_task.create_task(
+            async_db,
+            TaskCreate(title="Commented", assigned_to=test_user.id),
+            creator_id=test_user.id
+        )
+        
+        comment = await crud_comment.create_comment(
+            async_db,
+            CommentCreate(content="Hello"),
+            task_id=task.id,
+            user_id=test_user.id
+        )
+        
+        assert comment.user.email == test_user.email
+        comments, total = await crud_comment.get_task_comments(async_db, task.id)
+        assert total == 1
+        assert comments[0].content == "Hello"
+
+
+class TestAsyncRoutes:
+    """Tests for the async task and comment routes."""
+    
+    def test_create_and_list_tasks(self, async_client: TestClient, test_user: User):
+        """Test the async task routes end to end."""
+        response = async_client.post("/tasks/", json={"title": "Async Route Task"})
+        assert response.status_code == 201
+        task_id = response.json()["id"]
+        
+        response = async_client.get("/tasks/")
+        assert response.status_code == 200
+        assert response.json()["total"] == 1
+        
+        response = async_client.get(f"/tasks/{task_id}")
+        assert response.json()["assigned_to"] == test_user.id
+    
+    def test_comment_routes(self, async_client: TestClient):
+        """Test creating and listing comments on the async path."""
+        task_id = async_client.post("/tasks/", json={"title": "Discuss"}).json()["id"]
+        
+        response = async_client.post(f"/tasks/{task_id}/comments", json={"content": "First"})
+        assert response.status_code == 201
+        assert response.json()["user"]["email"] == "test@example.com"
+        
+        response = async_client.get(f"/tasks/{task_id}/comments")
+        assert response.json()["total"] == 1
+    
+    def test_task_list_cache_invalidated(self, async_client: TestClient):
+        """Test that async writes refresh cached lists and statistics."""
+        async_client.post("/tasks/", json={"title": "Cached"})
+        assert async_client.get("/tasks/").json()["total"] == 1
+        assert async_client.get("/tasks/statistics").json()["total_tasks"] == 1
+        
+        task_id = async_client.post("/tasks/", json={"title": "Second"}).json()["id"]
+        assert async_client.get("/tasks/").json()["total"] == 2
+        
+        async_client.delete(f"/tasks/{task_id}")
+        assert async_client.get("/tasks/").json()["total"] == 1
+        assert async_client.get("/tasks/statistics").json()["total_tasks"] == 1
+    
+    def test_task_changes(self, async_client: TestClient):
+        """Test a delta sync on the async path."""
+        task_id = async_client.post("/tasks/", json={"title": "Synced"}).json()["id"]
+        data = async_client.get("/tasks/changes").json()
+        assert [task["id"] for task in data["changed"]] == [task_id]
+        
+        async_client.delete(f"/tasks/{task_id}")
+        data = async_client.get(f"/tasks/changes?since={data['sync_token']}").json()
+        assert data["changed"] == []
+        assert data["deleted"] == [task_id]
+    
+    def test_bulk_create(self, async_client: TestClient, test_user: User):
+        """Test bulk creation on the async path."""
+        response = async_client.post("/tasks/bulk", json={"tasks": [{"title": "One"}, {"title": "Two"}]})
+        
+        assert response.status_code == 201
+        assert [task["title"] for task in response.json()["tasks"]] == ["One", "Two"]
+        assert async_client.get("/tasks/").json()["total"] == 2
+    
+    def test_bulk_update_and_delete(self, async_client: TestClient):
+        """Test set-based bulk updates and deletes on the async path."""
+        tasks = async_client.post("/tasks/bulk", json={"tasks": [{"title": "A"}, {"title": "B"}]}).json()["tasks"]
+        ids = [task["id"] for task in tasks]
+        
+        response = async_client.patch("/tasks/bulk", json={"ids": ids, "update": {"completed": True}})
+        assert response.json()["affected"] == 2
+        assert async_client.get("/tasks/?completed=true").json()["total"] == 2
+        
+        response = async_client.request("DELETE", "/tasks/bulk", json={"filter": {"completed": True}})
+        assert sorted(response.json()["ids"]) == ids
+        assert async_client.get("/tasks/").json()["total"] == 0
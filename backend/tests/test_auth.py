@@ -1,12 +1,29 @@
 """
 Unit tests for authentication endpoints.
 """
+import asyncio
+import threading
+import time
+from datetime import datetime, timedelta, timezone
 import pytest
+from anyio import to_thread
 from fastapi.testclient import TestClient
+from sqlalchemy import delete, event, or_
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import Session
 
+from app.models.comment import Comment
+from app.models.purge_job import PurgeJob, PurgeJobStatus
+from app.models.task import Task
 from app.models.user import User, UserRole
 from app.core.security import verify_password
+from app.core.cache import principal_cache, token_cache, token_version_cache
+from app.core.security import build_token_claims, create_access_token, decode_access_token
+from app.core.exceptions import ServiceUnavailableException
+from app.core.password_pool import PasswordHashingPool
+from app.core.purge import purge_worker
+from app.crud import user as crud_user
+from tests.conftest import engine as test_engine
 
 
 class TestUserRegistration:
@@ -201,3 +218,563 @@ class TestUserLogin:
         )
         
         assert response.status_code == 401
+
+
+class TestPrincipalCache:
+    """Tests for the authenticated principal cache."""
+    
+    def test_repeated_requests_hit_cache(self, client: TestClient, auth_headers: dict, test_user: User):
+        """Test that only the first authenticated request looks up the user."""
+        client.get("/api/v1/auth/me", headers=auth_headers)
+        client.get("/api/v1/auth/me", headers=auth_headers)
+        response = client.get("/api/v1/auth/me", headers=auth_headers)
+        
+        assert response.status_code == 200
+        assert response.json()["id"] == test_user.id
+        stats = principal_cache.stats()
+        assert stats["misses"] == 1
+        assert stats["hits"] == 2
+    
+    def test_update_user_invalidates_cache(self, client: TestClient, auth_headers: dict, test_user: User):
+        """Test that updating a user drops the cached principal."""
+        client.get("/api/v1/auth/me", headers=auth_headers)
+        
+        response = client.put(
+            f"/api/v1/users/{test_user.id}",
+            json={"full_name": "Renamed User"},
+            headers=auth_headers
+        )
+        assert response.status_code == 200
+        
+        response = client.get("/api/v1/auth/me", headers=auth_headers)
+        assert response.json()["full_name"] == "Renamed User"
+    
+    def test_deactivated_user_is_rejected(self, client: TestClient, auth_headers: dict, test_user: User):
+        """Test that deactivating a user takes effect despite the cache."""
+        client.get("/api/v1/auth/me", headers=auth_headers)
+        
+        client.put(
+            f"/api/v1/users/{test_user.id}",
+            json={"is_active": False},
+            headers=auth_headers
+        )
+        
+        response = client.get("/api/v1/auth/me", headers=auth_headers)
+        assert response.status_code == 400
+    
+    def test_metrics_require_admin(self, client: TestClient, auth_headers: dict, admin_auth_headers: dict):
+        """Test that cache counters are exposed to admins only."""
+        response = client.get("/api/v1/metrics/", headers=auth_headers)
+        assert response.status_code == 403
+        
+        response = client.get("/api/v1/metrics/", headers=admin_auth_headers)
+        assert response.status_code == 200
+        assert "hits" in response.json()["principal_cache"]
+
+
+class TestPasswordHashingPool:
+    """Tests for the bounded password hashing pool."""
+    
+    def test_pool_runs_and_records_wait(self):
+        """Test that work runs in the pool and wait time is recorded."""
+        pool = PasswordHashingPool(max_workers=2, max_queue=2)
+        
+        assert pool.run(lambda a, b: a + b, 2, 3) == 5
+        stats = pool.stats()
+        assert stats["completed"] == 1
+        assert stats["rejected"] == 0
+        assert stats["wait_seconds_max"] >= 0
+    
+    def test_pool_rejects_when_saturated(self):
+        """Test that a full pool fails fast instead of queueing."""
+        pool = PasswordHashingPool(max_workers=1, max_queue=0)
+        started = threading.Event()
+        release = threading.Event()
+        
+        def _block():
+            started.set()
+            release.wait(5)
+        
+        worker = threading.Thread(target=pool.run, args=(_block,))
+        worker.start()
+        started.wait(5)
+        try:
+            with pytest.raises(ServiceUnavailableException):
+                pool.run(lambda: None)
+        finally:
+            release.set()
+            worker.join()
+        
+        assert pool.stats()["rejected"] == 1
+    
+    async def test_arun_holds_no_request_thread(self):
+        """Test that callers awaiting the pool do not hold AnyIO worker threads."""
+        pool = PasswordHashingPool(max_workers=1, max_queue=4)
+        started = threading.Event()
+        release = threading.Event()
+        
+        def _block():
+            started.set()
+            release.wait(5)
+            return "hashed"
+        
+        waiters = [asyncio.create_task(pool.arun(_block)) for _ in range(3)]
+        await asyncio.sleep(0)
+        await asyncio.to_thread(started.wait, 5)
+        try:
+            assert to_thread.current_default_thread_limiter().borrowed_tokens == 0
+        finally:
+            release.set()
+        
+        assert await asyncio.gather(*waiters) == ["hashed"] * 3
+        assert pool.stats()["completed"] == 3
+    
+    def test_login_returns_503_when_pool_saturated(self, client: TestClient, test_user: User, monkeypatch):
+        """Test that login answers 503 while password work is saturated."""
+        pool = PasswordHashingPool(max_workers=1, max_queue=0)
+        monkeypatch.setattr("app.core.security.password_pool", pool)
+        started = threading.Event()
+        release = threading.Event()
+        
+        def _block():
+            started.set()
+            release.wait(5)
+        
+        worker = threading.Thread(target=pool.run, args=(_block,))
+        worker.start()
+        started.wait(5)
+        try:
+            response = client.post(
+                "/api/v1/auth/login",
+                data={
+                    "username": test_user.email,
+                    "password": "testpassword123"
+                }
+            )
+        finally:
+            release.set()
+            worker.join()
+        
+        assert response.status_code == 503
+        assert "Retry-After" in response.headers
+
+
+class TestSelfContainedTokens:
+    """Tests for tokens carrying id, role and token version claims."""
+    
+    def test_login_token_carries_claims(self, client: TestClient, auth_headers: dict, test_user: User):
+        """Test that issued tokens include id, role and version claims."""
+        token = auth_headers["Authorization"].split(" ", 1)[1]
+        payload = decode_access_token(token)
+        
+        assert payload["sub"] == test_user.email
+        assert payload["uid"] == test_user.id
+        assert payload["role"] == "regular"
+        assert payload["tv"] == 0
+    
+    def test_task_requests_use_cached_token_state(self, client: TestClient, auth_headers: dict):
+        """Test that repeated requests are authorized from the version cache."""
+        client.get("/api/v1/tasks/", headers=auth_headers)
+        client.get("/api/v1/tasks/", headers=auth_headers)
+        
+        stats = token_version_cache.stats()
+        assert stats["misses"] == 1
+        assert stats["hits"] == 1
+        assert principal_cache.stats()["misses"] == 0
+    
+    def test_role_change_revokes_token(self, client: TestClient, auth_headers: dict, test_user: User):
+        """Test that bumping the token version rejects older tokens."""
+        assert client.get("/api/v1/tasks/", headers=auth_headers).status_code == 200
+        
+        response = client.put(
+            f"/api/v1/users/{test_user.id}",
+            json={"role": "admin"},
+            headers=auth_headers
+        )
+        assert response.status_code == 200
+        
+        response = client.get("/api/v1/tasks/", headers=auth_headers)
+        assert response.status_code == 401
+    
+    def test_legacy_subject_only_token_still_accepted(self, client: TestClient, test_user: User):
+        """Test that tokens without claims fall back to a user lookup."""
+        token = create_access_token(data={"sub": test_user.email})
+        
+        response = client.get(
+            "/api/v1/tasks/",
+            headers={"Authorization": f"Bearer {token}"}
+        )
+        
+        assert response.status_code == 200
+
+
+class TestDecodedTokenCache:
+    """Tests for the decoded token cache in decode_access_token."""
+    
+    @pytest.fixture(autouse=True)
+    def _clear_token_cache(self):
+        token_cache.clear()
+        yield
+        token_cache.clear()
+    
+    def test_repeated_decode_hits_cache(self):
+        """Test that decoding the same token twice verifies it once."""
+        token = create_access_token(data={"sub": "cache@example.com"})
+        
+        first = decode_access_token(token)
+        second = decode_access_token(token)
+        
+        assert first == second
+        assert token_cache.stats()["hits"] == 1
+    
+    def test_expired_payload_is_never_served(self, monkeypatch):
+        """Test that a cached payload is dropped once its exp has passed."""
+        token = create_access_token(
+            data={"sub": "cache@example.com"},
+            expires_delta=timedelta(seconds=30)
+        )
+        assert decode_access_token(token) is not None
+        
+        future = time.time() + 60
+        monkeypatch.setattr("app.core.security.time.time", lambda: future)
+        decode_access_token(token)
+        
+        # The stale entry is dropped and not re-cached past its expiry
+        assert token_cache.stats()["size"] == 0
+    
+    def test_tampered_token_with_cached_signature_is_rejected(self):
+        """Test that only the exact cached token is served from the cache."""
+        token = create_access_token(data={"sub": "cache@example.com"})
+        other = create_access_token(data={"sub": "other@example.com"})
+        assert decode_access_token(token) is not None
+        
+        forged = other.rsplit(".", 1)[0] + "." + token.rsplit(".", 1)[1]
+        
+        assert decode_access_token(forged) is None
+    
+    def test_cache_can_be_disabled(self, monkeypatch):
+        """Test that a zero-sized cache stores nothing."""
+        monkeypatch.setattr(token_cache, "max_size", 0)
+        token = create_access_token(data={"sub": "cache@example.com"})
+        
+        decode_access_token(token)
+        decode_access_token(token)
+        
+        assert token_cache.stats()["size"] == 0
+        assert token_cache.stats()["hits"] == 0
+
+
+class TestUserConditionalGet:
+    """Tests for ETags on user reads."""
+    
+    def test_user_not_modified_until_updated(self, client: TestClient, auth_headers: dict, test_user: User):
+        """Test that a user revalidates with 304 until it changes."""
+        url = f"/api/v1/users/{test_user.id}"
+        etag = client.get(url, headers=auth_headers).headers["etag"]
+        
+        response = client.get(url, headers={**auth_headers, "If-None-Match": etag})
+        assert response.status_code == 304
+        
+        client.put(url, json={"full_name": "Renamed User"}, headers=auth_headers)
+        response = client.get(url, headers={**auth_headers, "If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.json()["full_name"] == "Renamed User"
+    
+    def test_user_list_not_modified_until_registration(self, client: TestClient, auth_headers: dict):
+        """Test that the user list changes when a user registers."""
+        etag = client.get("/api/v1/users/", headers=auth_headers).headers["etag"]
+        
+        response = client.get("/api/v1/users/", headers={**auth_headers, "If-None-Match": etag})
+        assert response.status_code == 304
+        
+        client.post("/api/v1/auth/register", json={"email": "new@example.com", "password": "password123"})
+        response = client.get("/api/v1/users/", headers={**auth_headers, "If-None-Match": etag})
+        assert response.status_code == 200
+
+
+class TestUserWrites:
+    """Tests for user writes without a read beforehand."""
+    
+    def test_update_missing_user(self, client: TestClient, auth_headers: dict):
+        """Test that updating an unknown user returns 404."""
+        response = client.put("/api/v1/users/99999", json={"full_name": "Nobody"}, headers=auth_headers)
+        
+        assert response.status_code == 404
+    
+    def test_delete_missing_user(self, client: TestClient, auth_headers: dict):
+        """Test that deleting an unknown user returns 404."""
+        response = client.delete("/api/v1/users/99999", headers=auth_headers)
+        
+        assert response.status_code == 404
+    
+    def test_email_change_drops_previous_principal(self, client: TestClient, auth_headers: dict, test_user: User):
+        """Test that the principal cached under the old email is dropped."""
+        old_email = test_user.email
+        principal_cache.set(old_email, {"id": test_user.id})
+        
+        response = client.put(
+            f"/api/v1/users/{test_user.id}",
+            json={"email": "renamed@example.com"},
+            headers=auth_headers
+        )
+        
+        assert response.json()["email"] == "renamed@example.com"
+        assert principal_cache.get(old_email) is None
+    
+    def test_password_change_hashed_off_request_thread(
+        self, client: TestClient, auth_headers: dict, test_user: User, db: Session, monkeypatch
+    ):
+        """Test that a new password is hashed by the async pool path, not in the UPDATE's thread."""
+        def _sync_hash(password):
+            raise AssertionError("hashed in a request thread")
+        
+        monkeypatch.setattr(crud_user, "get_password_hash", _sync_hash)
+        
+        response = client.put(
+            f"/api/v1/users/{test_user.id}",
+            json={"password": "newpassword123"},
+            headers=auth_headers
+        )
+        
+        assert response.status_code == 200
+        db.refresh(test_user)
+        assert verify_password("newpassword123", test_user.hashed_password)
+    
+    def test_role_change_bumps_token_version(self, client: TestClient, auth_headers: dict, test_user: User, db: Session):
+        """Test that the token version is bumped by the UPDATE itself."""
+        previous = test_user.token_version
+        
+        client.put(f"/api/v1/users/{test_user.id}", json={"role": "admin"}, headers=auth_headers)
+        
+        db.refresh(test_user)
+        assert test_user.token_version == previous + 1
+    
+    def test_delete_user_keeps_tasks(self, client: TestClient, auth_headers: dict, test_user: User, test_admin: User, db: Session):
+        """Test that a deleted user's tasks are kept without them and their comments are deleted."""
+        created = Task(title="Created by admin", created_by=test_admin.id, assigned_to=test_user.id)
+        assigned = Task(title="Assigned to admin", created_by=test_user.id, assigned_to=test_admin.id)
+        db.add_all([created, assigned])
+        db.commit()
+        db.add_all([
+            Comment(content="By admin", task_id=assigned.id, user_id=test_admin.id),
+            Comment(content="By user", task_id=assigned.id, user_id=test_user.id),
+        ])
+        db.commit()
+        created_id, assigned_id, admin_id, user_id = created.id, assigned.id, test_admin.id, test_user.id
+        
+        response = client.delete(f"/api/v1/users/{admin_id}", headers=auth_headers)
+        
+        assert response.status_code == 202
+        db.expire_all()
+        assert db.get(User, admin_id) is None
+        assert db.get(Task, created_id).created_by is None
+        assert db.get(Task, created_id).assigned_to == user_id
+        assert db.get(Task, assigned_id).assigned_to is None
+        assert [comment.content for comment in db.query(Comment)] == ["By user"]
+
+
+class TestUserPurge:
+    """Tests for soft deletes of users and their background purge."""
+    
+    @pytest.fixture
+    def heavy_user(self, db: Session, test_user: User, test_admin: User) -> User:
+        """Give the admin five comments and three tasks."""
+        tasks = [Task(title=f"Task {i}", created_by=test_admin.id, assigned_to=test_user.id) for i in range(3)]
+        db.add_all(tasks)
+        db.commit()
+        db.add_all([Comment(content=f"Comment {i}", task_id=tasks[0].id, user_id=test_admin.id) for i in range(5)])
+        db.add(Comment(content="Kept", task_id=tasks[0].id, user_id=test_user.id))
+        db.commit()
+        return test_admin
+    
+    def test_delete_user_accepted(self, client: TestClient, auth_headers: dict, heavy_user: User):
+        """Test that a delete returns 202 with a job whose status is readable."""
+        user_id = heavy_user.id
+        
+        response = client.delete(f"/api/v1/users/{user_id}", headers=auth_headers)
+        
+        assert response.status_code == 202
+        job = response.json()
+        assert job["user_id"] == user_id
+        assert job["status"] == "pending"
+        assert response.headers["location"] == f"/api/v1/jobs/{job['id']}"
+        
+        # The purge ran after the response was sent
+        status = client.get(response.headers["location"], headers=auth_headers).json()
+        assert status["status"] == "done"
+        assert status["comments_deleted"] == 5
+        assert status["tasks_released"] == 3
+        assert status["finished_at"] is not None
+    
+    def test_job_visible_to_requester_and_admins(
+        self, client: TestClient, auth_headers: dict, admin_auth_headers: dict, db: Session
+    ):
+        """Test that only the requester and admins can read a purge job."""
+        other = User(email="other@example.com", hashed_password="x", role=UserRole.REGULAR, is_active=True)
+        bystander = User(email="bystander@example.com", hashed_password="x", role=UserRole.REGULAR, is_active=True)
+        db.add_all([other, bystander])
+        db.commit()
+        bystander_headers = {"Authorization": f"Bearer {create_access_token(build_token_claims(bystander))}"}
+        
+        response = client.delete(f"/api/v1/users/{other.id}", headers=auth_headers)
+        location = response.headers["location"]
+        
+        assert client.get(location, headers=auth_headers).status_code == 200
+        assert client.get(location, headers=admin_auth_headers).status_code == 200
+        assert client.get(location, headers=bystander_headers).status_code == 403
+    
+    def test_missing_job(self, client: TestClient, auth_headers: dict):
+        """Test that an unknown job returns 404."""
+        response = client.get("/api/v1/jobs/99999", headers=auth_headers)
+        
+        assert response.status_code == 404
+    
+    def test_soft_deleted_user_hidden(self, client: TestClient, auth_headers: dict, heavy_user: User, db: Session):
+        """Test that reads hide the user and their comments before the purge runs."""
+        task_id = db.query(Comment.task_id).filter(Comment.user_id == heavy_user.id).first().task_id
+        email, user_id = heavy_user.email, heavy_user.id
+        
+        job = crud_user.soft_delete_user(db, user_id)
+        
+        assert job.status == PurgeJobStatus.PENDING
+        assert crud_user.get_user(db, user_id) is None
+        assert crud_user.get_user_by_email(db, email) is None
+        assert crud_user.authenticate_user(db, email, "adminpassword123") is None
+        assert client.get(f"/api/v1/users/{user_id}", headers=auth_headers).status_code == 404
+        assert user_id not in [user["id"] for user in client.get("/api/v1/users/", headers=auth_headers).json()]
+        comments = client.get(f"/api/v1/tasks/{task_id}/comments", headers=auth_headers).json()
+        assert [comment["content"] for comment in comments["items"]] == ["Kept"]
+        assert client.delete(f"/api/v1/users/{user_id}", headers=auth_headers).status_code == 404
+        # The rows themselves are still there
+        assert db.query(Comment).count() == 6
+    
+    def test_purge_in_chunks(self, db: Session, heavy_user: User, test_user: User):
+        """Test that a purge commits after every chunk and keeps the tasks."""
+        user_id = heavy_user.id
+        job = crud_user.soft_delete_user(db, user_id)
+        commits = []
+        record = commits.append
+        event.listen(test_engine, "commit", record)
+        try:
+            finished = crud_user.purge_user(db, job.id, chunk_size=2, stale_before=datetime.now(timezone.utc))
+        finally:
+            event.remove(test_engine, "commit", record)
+        
+        assert finished.status == PurgeJobStatus.DONE
+        assert (finished.comments_deleted, finished.tasks_released) == (5, 3)
+        # Claim, 3 comment chunks, 2 task chunks, final delete
+        assert len(commits) == 7
+        db.expire_all()
+        assert db.get(User, user_id) is None
+        assert [comment.content for comment in db.query(Comment)] == ["Kept"]
+        assert {(task.created_by, task.assigned_to) for task in db.query(Task)} == {(None, test_user.id)}
+    
+    def test_purge_sweeps_late_writes(self, db: Session, heavy_user: User, test_user: User, monkeypatch):
+        """Test that rows written by the deleted user while the purge runs are removed too."""
+        user_id = heavy_user.id
+        task_id = db.query(Task.id).first().id
+        job = crud_user.soft_delete_user(db, user_id)
+        release = crud_user.user_tasks_release_statement
+        
+        def _release_after_late_writes(*args, **kwargs):
+            # A worker still accepting the user's cached token writes after
+            # the comment chunks have run
+            if not db.query(Task).filter(Task.title == "Late").count():
+                db.add(Task(title="Late", created_by=user_id, assigned_to=user_id))
+                db.add(Comment(content="Late", task_id=task_id, user_id=user_id))
+                db.commit()
+            return release(*args, **kwargs)
+        
+        monkeypatch.setattr(crud_user, "user_tasks_release_statement", _release_after_late_writes)
+        finished = crud_user.purge_user(db, job.id, chunk_size=100, stale_before=datetime.now(timezone.utc))
+        
+        assert (finished.comments_deleted, finished.tasks_released) == (6, 4)
+        db.expire_all()
+        assert db.get(User, user_id) is None
+        assert [comment.content for comment in db.query(Comment)] == ["Kept"]
+        assert db.query(Task).filter(or_(Task.created_by == user_id, Task.assigned_to == user_id)).count() == 0
+    
+    def test_finished_job_not_run_again(self, db: Session, heavy_user: User):
+        """Test that a job is claimed once."""
+        job = crud_user.soft_delete_user(db, heavy_user.id)
+        stale_before = datetime.now(timezone.utc) - timedelta(minutes=5)
+        
+        assert crud_user.purge_user(db, job.id, chunk_size=100, stale_before=stale_before) is not None
+        assert crud_user.purge_user(db, job.id, chunk_size=100, stale_before=stale_before) is None
+    
+    def test_resume_pending_jobs(self, db: Session, heavy_user: User):
+        """Test that jobs left pending by a stopped process are resumed."""
+        job = crud_user.soft_delete_user(db, heavy_user.id)
+        
+        assert purge_worker.resume() == 1
+        
+        db.expire_all()
+        assert db.get(PurgeJob, job.id).status == PurgeJobStatus.DONE
+        assert purge_worker.resume() == 0
+    
+    def test_failed_job_retried(self, db: Session, heavy_user: User, test_user: User, monkeypatch):
+        """Test that a job failing mid-purge is retried later and resumes from its last chunk."""
+        user_id = heavy_user.id
+        release = crud_user.user_tasks_release_statement
+        failures = []
+        
+        def _release_once_failing(*args, **kwargs):
+            if not failures:
+                failures.append(True)
+                raise OperationalError("UPDATE tasks", {}, Exception("database is locked"))
+            return release(*args, **kwargs)
+        
+        monkeypatch.setattr(crud_user, "user_tasks_release_statement", _release_once_failing)
+        monkeypatch.setattr(purge_worker, "retry_seconds", 3600)
+        job = crud_user.soft_delete_user(db, user_id)
+        purge_worker.run(job.id)
+        
+        db.expire_all()
+        failed = db.get(PurgeJob, job.id)
+        assert failed.status == PurgeJobStatus.FAILED
+        assert failed.attempts == 1
+        assert "database is locked" in failed.error
+        # Committed chunks are kept; the retry is scheduled an hour ahead
+        assert failed.comments_deleted == 5
+        assert crud_user.as_utc(failed.retry_at) > datetime.now(timezone.utc) + timedelta(minutes=59)
+        assert crud_user.purge_user(db, job.id, chunk_size=100, stale_before=datetime.now(timezone.utc)) is None
+        
+        # Once the retry is due, a resume (or the scheduled timer) runs the job again
+        purge_worker.shutdown()
+        db.execute(crud_user.purge_job_update_statement(job.id, retry_at=datetime.now(timezone.utc)))
+        db.commit()
+        assert purge_worker.resume() == 1
+        
+        db.expire_all()
+        done = db.get(PurgeJob, job.id)
+        assert done.status == PurgeJobStatus.DONE
+        assert (done.comments_deleted, done.tasks_released, done.attempts) == (5, 3, 1)
+        assert done.error is None
+        assert db.get(User, user_id) is None
+        assert {(task.created_by, task.assigned_to) for task in db.query(Task)} == {(None, test_user.id)}
+    
+    def test_failed_job_gives_up_after_max_attempts(self, db: Session, heavy_user: User, monkeypatch):
+        """Test that a job stops being retried after settings.purge_max_attempts failures."""
+        def _always_failing(*args, **kwargs):
+            raise OperationalError("UPDATE tasks", {}, Exception("database is locked"))
+        
+        monkeypatch.setattr(crud_user, "user_tasks_release_statement", _always_failing)
+        monkeypatch.setattr(purge_worker, "retry_seconds", 0)
+        monkeypatch.setattr(purge_worker, "max_attempts", 3)
+        job = crud_user.soft_delete_user(db, heavy_user.id)
+        # Retries that are due at once run inline with 0 workers
+        purge_worker.run(job.id)
+        
+        db.expire_all()
+        failed = db.get(PurgeJob, job.id)
+        assert (failed.status, failed.attempts, failed.retry_at) == (PurgeJobStatus.FAILED, 3, None)
+        assert purge_worker.resume() == 0
+    
+    def test_failed_job_removed_is_not_retried(self, db: Session, heavy_user: User):
+        """Test that a failure is not recorded or retried for a job row that is gone."""
+        job = crud_user.soft_delete_user(db, heavy_user.id)
+        db.execute(delete(PurgeJob).where(PurgeJob.id == job.id))
+        db.commit()
+        
+        assert crud_user.fail_purge_job(db, job.id, "database is locked", 1, 3) is None
+
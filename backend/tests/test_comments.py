@@ -3,11 +3,13 @@ Tests for comment-related endpoints.
 """
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import event
 from sqlalchemy.orm import Session
 
 from app.models.user import User
 from app.models.task import Task
 from app.models.comment import Comment
+from tests.conftest import engine as test_engine
 
 
 @pytest.fixture
@@ -54,6 +56,20 @@ def sample_comments(db: Session, sample_task_for_comments: Task, test_user: User
     return comments
 
 
+@pytest.fixture
+def comment_statements():
+    """Record the statements that read or write comments or tasks."""
+    statements = []
+    
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if "comments" in statement or "tasks" in statement:
+            statements.append(statement)
+    
+    event.listen(test_engine, "before_cursor_execute", record)
+    yield statements
+    event.remove(test_engine, "before_cursor_execute", record)
+
+
 class TestCreateComment:
     """Tests for creating comments on tasks."""
     
@@ -127,6 +143,30 @@ class TestCreateComment:
         
         assert response.status_code == 404
     
+    def test_create_comment_on_unassigned_task(self, client: TestClient, admin_auth_headers: dict, sample_task_for_comments: Task, db: Session):
+        """Test that commenting on someone else's task returns 404 and inserts nothing."""
+        response = client.post(
+            f"/api/v1/tasks/{sample_task_for_comments.id}/comments",
+            json={"content": "Not my task"},
+            headers=admin_auth_headers
+        )
+        
+        assert response.status_code == 404
+        assert db.query(Comment).count() == 0
+    
+    def test_create_comment_single_statement(self, client: TestClient, auth_headers: dict, sample_task_for_comments: Task, test_user: User, comment_statements):
+        """Test that the task check and the insert are one INSERT ... SELECT ... RETURNING."""
+        response = client.post(
+            f"/api/v1/tasks/{sample_task_for_comments.id}/comments",
+            json={"content": "One round trip"},
+            headers=auth_headers
+        )
+        
+        assert response.status_code == 201
+        assert response.json()["user"]["email"] == test_user.email
+        assert len(comment_statements) == 1
+        assert comment_statements[0].startswith("INSERT INTO comments")
+    
     def test_create_comment_without_auth(self, client: TestClient, sample_task_for_comments: Task):
         """Test creating comment fails without authentication."""
         comment_data = {
@@ -281,6 +321,71 @@ class TestRetrieveComments:
             assert "full_name" in comment["user"]
 
 
+    def test_get_comments_sparse_fields(self, client: TestClient, auth_headers: dict, sample_task_for_comments: Task, sample_comments):
+        """Test that comment items carry only the requested fields."""
+        response = client.get(
+            f"/api/v1/tasks/{sample_task_for_comments.id}/comments?fields=id,content",
+            headers=auth_headers
+        )
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 3
+        assert [item["content"] for item in data["items"]] == ["First comment", "Second comment", "Third comment"]
+        assert all(set(item) == {"id", "content"} for item in data["items"])
+    
+    def test_get_comments_sparse_fields_with_user(self, client: TestClient, auth_headers: dict, sample_task_for_comments: Task, sample_comments, test_user: User):
+        """Test that requesting the user field includes the nested author."""
+        response = client.get(
+            f"/api/v1/tasks/{sample_task_for_comments.id}/comments?fields=content,user",
+            headers=auth_headers
+        )
+        
+        item = response.json()["items"][0]
+        assert set(item) == {"content", "user"}
+        assert item["user"]["email"] == test_user.email
+    
+    def test_get_comments_not_modified(self, client: TestClient, auth_headers: dict, sample_task_for_comments: Task, sample_comments):
+        """Test that an unchanged comment list revalidates with 304."""
+        url = f"/api/v1/tasks/{sample_task_for_comments.id}/comments"
+        etag = client.get(url, headers=auth_headers).headers["etag"]
+        
+        response = client.get(url, headers={**auth_headers, "If-None-Match": etag})
+        
+        assert response.status_code == 304
+    
+    def test_get_comments_etag_changes_on_edit(self, client: TestClient, auth_headers: dict, sample_task_for_comments: Task, sample_comments):
+        """Test that editing a comment invalidates the list ETag."""
+        url = f"/api/v1/tasks/{sample_task_for_comments.id}/comments"
+        etag = client.get(url, headers=auth_headers).headers["etag"]
+        client.put(f"{url}/{sample_comments[0].id}", json={"content": "Edited"}, headers=auth_headers)
+        
+        response = client.get(url, headers={**auth_headers, "If-None-Match": etag})
+        
+        assert response.status_code == 200
+        assert response.json()["items"][0]["content"] == "Edited"
+    
+    def test_get_comments_etag_changes_on_author_rename(self, client: TestClient, auth_headers: dict, sample_task_for_comments: Task, sample_comments, test_user: User):
+        """Test that renaming a comment author invalidates the list ETag."""
+        url = f"/api/v1/tasks/{sample_task_for_comments.id}/comments"
+        etag = client.get(url, headers=auth_headers).headers["etag"]
+        client.put(f"/api/v1/users/{test_user.id}", json={"full_name": "Renamed User"}, headers=auth_headers)
+        
+        response = client.get(url, headers={**auth_headers, "If-None-Match": etag})
+        
+        assert response.status_code == 200
+        assert response.json()["items"][0]["user"]["full_name"] == "Renamed User"
+    
+    def test_get_comments_unknown_field(self, client: TestClient, auth_headers: dict, sample_task_for_comments: Task):
+        """Test that unknown comment fields are rejected."""
+        response = client.get(
+            f"/api/v1/tasks/{sample_task_for_comments.id}/comments?fields=task",
+            headers=auth_headers
+        )
+        
+        assert response.status_code == 400
+
+
 class TestUpdateComment:
     """Tests for updating comments."""
     
@@ -363,6 +468,37 @@ class TestUpdateComment:
         assert response.status_code == 404
 
 
+    def test_update_comment_single_statement(self, client: TestClient, auth_headers: dict, sample_task_for_comments: Task, sample_comments, comment_statements):
+        """Test that the permission checks and the update are one UPDATE ... RETURNING."""
+        url = f"/api/v1/tasks/{sample_task_for_comments.id}/comments/{sample_comments[0].id}"
+        comment_statements.clear()
+        
+        response = client.put(
+            url,
+            json={"content": "Edited"},
+            headers=auth_headers
+        )
+        
+        assert response.status_code == 200
+        assert response.json()["content"] == "Edited"
+        assert [statement.split()[0] for statement in comment_statements] == ["UPDATE"]
+    
+    def test_update_comment_on_other_task(self, client: TestClient, auth_headers: dict, sample_comments, test_user: User, db: Session):
+        """Test that a comment addressed through another task is not found."""
+        other_task = Task(title="Other", created_by=test_user.id, assigned_to=test_user.id)
+        db.add(other_task)
+        db.commit()
+        
+        response = client.put(
+            f"/api/v1/tasks/{other_task.id}/comments/{sample_comments[0].id}",
+            json={"content": "Edited"},
+            headers=auth_headers
+        )
+        
+        assert response.status_code == 404
+        assert response.json()["detail"] == "Comment not found"
+
+
 class TestDeleteComment:
     """Tests for deleting comments."""
     
@@ -429,6 +565,19 @@ class TestDeleteComment:
         
         assert response.status_code == 404
     
+    def test_delete_comment_single_statement(self, client: TestClient, auth_headers: dict, sample_task_for_comments: Task, sample_comments, comment_statements):
+        """Test that the permission checks and the delete are one DELETE."""
+        url = f"/api/v1/tasks/{sample_task_for_comments.id}/comments/{sample_comments[0].id}"
+        comment_statements.clear()
+        
+        response = client.delete(
+            url,
+            headers=auth_headers
+        )
+        
+        assert response.status_code == 200
+        assert [statement.split()[0] for statement in comment_statements] == ["DELETE"]
+    
     def test_delete_nonexistent_comment(self, client: TestClient, auth_headers: dict, sample_task_for_comments: Task):
         """Test deleting non-existent comment returns 404."""
         response = client.delete(
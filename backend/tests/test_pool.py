@@ -0,0 +1,136 @@
+"""
+Unit tests for connection pool sizing and instrumentation.
+"""
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from app.config import settings
+from app.db.pool import InstrumentedQueuePool, instrument_engine, pool_limits
+
+
+@pytest.fixture
+def small_engine(tmp_path):
+    """Engine with a single pooled connection and no overflow."""
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.1,
+        pool_pre_ping=True
+    )
+    metrics = instrument_engine(engine, "test")
+    yield engine, metrics
+    engine.dispose()
+
+
+class TestPoolLimits:
+    """Tests for pool size configuration."""
+    
+    def test_manual_limits(self):
+        """Test that configured sizes are used when auto sizing is off."""
+        config = settings.model_copy(update={
+            "db_pool_auto_size": False,
+            "db_pool_size": 7,
+            "db_max_overflow": 3
+        })
+        
+        assert pool_limits(config) == (7, 3)
+    
+    def test_auto_limits_split_budget_across_workers(self):
+        """Test that auto sizing shares the connection budget between workers."""
+        config = settings.model_copy(update={
+            "db_pool_auto_size": True,
+            "db_max_connections": 100,
+            "web_concurrency": 4,
+            "db_pool_concurrency": 40
+        })
+        
+        assert pool_limits(config) == (25, 0)
+    
+    def test_auto_limits_cover_thread_pool(self):
+        """Test that a single worker keeps a connection per thread plus overflow."""
+        config = settings.model_copy(update={
+            "db_pool_auto_size": True,
+            "db_max_connections": 100,
+            "web_concurrency": 1,
+            "db_pool_concurrency": 40
+        })
+        
+        assert pool_limits(config) == (40, 60)
+
+
+class TestPoolMetrics:
+    """Tests for pool event counters."""
+    
+    def test_checkout_and_checkin_are_counted(self, small_engine):
+        """Test checkout counts, checked-out gauge and wait time."""
+        engine, metrics = small_engine
+        
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+            assert metrics.stats()["checked_out"] == 1
+        
+        stats = metrics.stats(engine.pool)
+        assert stats["checkouts"] == 1
+        assert stats["checked_out"] == 0
+        assert stats["peak_checked_out"] == 1
+        assert stats["checkout_wait_max"] >= 0
+        assert stats["pool_size"] == 1
+    
+    def test_exhaustion_is_counted(self, small_engine):
+        """Test that checkout timeouts are recorded."""
+        engine, metrics = small_engine
+        
+        with engine.connect():
+            with pytest.raises(PoolTimeoutError):
+                engine.connect()
+        
+        assert metrics.stats()["timeouts"] == 1
+    
+    def test_invalidations_are_counted(self, small_engine):
+        """Test that invalidated connections are recorded."""
+        engine, metrics = small_engine
+        
+        with engine.connect() as connection:
+            connection.invalidate()
+        
+        stats = metrics.stats()
+        assert stats["invalidations"] == 1
+        assert stats["preping_failures"] == 0
+    
+    def test_preping_failures_are_counted(self, small_engine, monkeypatch):
+        """Test that a connection failing its pre-ping is recorded."""
+        engine, metrics = small_engine
+        with engine.connect():
+            pass
+        
+        ping = engine.dialect._do_ping_w_event
+        failed = []
+        
+        def fail_once(connection):
+            if not failed:
+                failed.append(connection)
+                return False
+            return ping(connection)
+        
+        monkeypatch.setattr(engine.dialect, "_do_ping_w_event", fail_once)
+        
+        with engine.connect():
+            pass
+        
+        stats = metrics.stats()
+        assert stats["preping_failures"] == 1
+        assert stats["connects"] == 2
+    
+    def test_metrics_survive_pool_recreate(self, small_engine):
+        """Test that disposing the engine keeps feeding the same metrics."""
+        engine, metrics = small_engine
+        engine.dispose()
+        
+        with engine.connect():
+            pass
+        
+        assert engine.pool.metrics is metrics
+        assert metrics.stats()["checkouts"] == 1
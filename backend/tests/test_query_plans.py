@@ -0,0 +1,162 @@
+"""
+Query plan checks for the hot task and comment queries.
+
+Each test runs a crud function, captures the SELECT statements it sends
+and asserts with EXPLAIN QUERY PLAN that SQLite reads tasks and comments
+through an index rather than a full table scan. On PostgreSQL the same
+check is ``python -m benchmarks.explain_tasks``.
+"""
+import re
+import pytest
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.crud import task as crud_task
+from app.crud import comment as crud_comment
+from app.models.comment import Comment
+from app.models.task import Task, TaskPriority
+from app.models.user import User
+from app.schemas.task import TaskFilter
+from tests.conftest import engine as test_engine
+
+FULL_SCAN = re.compile(r"^SCAN (tasks|comments)\b(?! USING)")
+
+
+@pytest.fixture
+def seeded(db: Session, test_user: User, test_admin: User) -> Task:
+    """Create a handful of tasks and comments."""
+    now = datetime.now(timezone.utc)
+    tasks = [
+        Task(
+            title=f"Task {i}",
+            priority=list(TaskPriority)[i % 3],
+            completed=i % 2 == 0,
+            created_by=test_admin.id if i % 3 == 0 else test_user.id,
+            assigned_to=test_user.id if i % 4 else test_admin.id,
+            due_date=now + timedelta(days=i - 5)
+        )
+        for i in range(12)
+    ]
+    db.add_all(tasks)
+    db.commit()
+    db.add_all([Comment(content=f"Comment {i}", task_id=tasks[1].id, user_id=test_user.id) for i in range(3)])
+    db.commit()
+    return tasks[1]
+
+
+@pytest.fixture
+def selects():
+    """Record the SELECT statements and parameters sent to the database."""
+    statements = []
+    
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+    
+    event.listen(test_engine, "before_cursor_execute", record)
+    yield statements
+    event.remove(test_engine, "before_cursor_execute", record)
+
+
+def query_plan(db: Session, statement: str, parameters) -> list:
+    """Return the EXPLAIN QUERY PLAN detail lines of a statement."""
+    rows = db.connection().exec_driver_sql("EXPLAIN QUERY PLAN " + statement, parameters).fetchall()
+    return [row[-1] for row in rows]
+
+
+def assert_uses_indexes(db: Session, statements: list, sorted_by_index: bool = False):
+    """Assert that no captured statement scans tasks or comments in full."""
+    assert statements
+    for statement, parameters in statements:
+        plan = query_plan(db, statement, parameters)
+        scans = [line for line in plan if FULL_SCAN.match(line)]
+        assert not scans, f"full scan in plan {plan} for {statement}"
+        if sorted_by_index:
+            assert not any("TEMP B-TREE FOR ORDER BY" in line for line in plan), plan
+
+
+class TestTaskQueryPlans:
+    """Tests that hot task queries are index scans."""
+    
+    def test_user_task_list(self, db: Session, test_user: User, seeded, selects):
+        """Test the default list of a regular user (assigned_to, newest first)."""
+        crud_task.get_tasks_page(db, limit=21, filters=TaskFilter(assigned_to=test_user.id))
+        
+        assert_uses_indexes(db, selects, sorted_by_index=True)
+    
+    def test_user_pending_task_list(self, db: Session, test_user: User, seeded, selects):
+        """Test the pending list, which can use the partial pending indexes."""
+        crud_task.get_tasks_page(db, limit=21, filters=TaskFilter(assigned_to=test_user.id, completed=False))
+        
+        assert_uses_indexes(db, selects, sorted_by_index=True)
+        statement = next(select for select in selects if "FROM tasks" in select[0])
+        plan = query_plan(db, *statement)
+        assert any("ix_tasks_pending_" in line for line in plan), plan
+    
+    def test_user_task_list_keyset_page(self, db: Session, test_user: User, seeded, selects):
+        """Test a cursor page of a regular user's list."""
+        first = crud_task.get_tasks(db, limit=3, filters=TaskFilter(assigned_to=test_user.id))
+        after = (first[-1].created_at, first[-1].id)
+        selects.clear()
+        
+        crud_task.get_tasks_page(db, limit=3, filters=TaskFilter(assigned_to=test_user.id), after=after)
+        
+        assert_uses_indexes(db, selects, sorted_by_index=True)
+    
+    @pytest.mark.parametrize("sort_by", sorted(crud_task.TASK_SORT_COLUMNS))
+    @pytest.mark.parametrize("sort_order", ["asc", "desc"])
+    def test_user_task_list_sorted(self, db: Session, test_user: User, seeded, selects, sort_by: str, sort_order: str):
+        """Test that every sortable field has an index serving the user list."""
+        crud_task.get_tasks_page(
+            db, limit=21, filters=TaskFilter(assigned_to=test_user.id), sort_by=sort_by, sort_order=sort_order
+        )
+        
+        # SQLite orders NULLs first, so NULLS LAST on due_date needs a sort step
+        assert_uses_indexes(db, selects, sorted_by_index=sort_by != "due_date")
+        statement = next(select for select in selects if "FROM tasks" in select[0])
+        assert any(f"ix_tasks_assigned_to_{crud_task.TASK_SORT_COLUMNS[sort_by].key}" in line
+                   for line in query_plan(db, *statement))
+    
+    def test_admin_task_list(self, db: Session, seeded, selects):
+        """Test the unfiltered admin list, read in created_at order."""
+        crud_task.get_tasks_page(db, limit=21)
+        
+        assert_uses_indexes(db, selects, sorted_by_index=True)
+    
+    def test_user_task_changes(self, db: Session, test_user: User, seeded, selects):
+        """Test a delta sync of a regular user (assigned_to, updated_at order)."""
+        after = (datetime.now(timezone.utc) - timedelta(minutes=5), 0)
+        filters = TaskFilter(assigned_to=test_user.id)
+        crud_task.get_tasks(db, limit=501, filters=filters, sort_by="updated_at", sort_order="asc", after=after)
+        crud_task.get_deleted_task_ids(db, after[0], filters=filters)
+        
+        assert_uses_indexes(db, selects, sorted_by_index=True)
+        plans = [line for statement in selects for line in query_plan(db, *statement)]
+        assert any("ix_task_deletions_assigned_to_deleted_at" in line for line in plans), plans
+    
+    def test_admin_task_changes(self, db: Session, seeded, selects):
+        """Test an unfiltered delta sync, read through the updated_at index."""
+        after = (datetime.now(timezone.utc) - timedelta(minutes=5), 0)
+        crud_task.get_tasks(db, limit=501, sort_by="updated_at", sort_order="asc", after=after)
+        
+        assert_uses_indexes(db, selects, sorted_by_index=True)
+        assert any("ix_tasks_updated_at" in line for line in query_plan(db, *selects[0]))
+    
+    def test_task_count(self, db: Session, test_user: User, seeded, selects):
+        """Test the filtered count."""
+        crud_task.get_tasks_count(db, filters=TaskFilter(assigned_to=test_user.id, completed=False))
+        
+        assert_uses_indexes(db, selects)
+    
+    def test_task_statistics(self, db: Session, test_user: User, seeded, selects):
+        """Test the statistics counters (created_by OR assigned_to)."""
+        crud_task.get_task_statistics(db, user_id=test_user.id)
+        
+        assert_uses_indexes(db, selects)
+    
+    def test_comment_list(self, db: Session, seeded: Task, selects):
+        """Test the per-task comment list in creation order."""
+        crud_comment.get_task_comments(db, task_id=seeded.id)
+        
+        assert_uses_indexes(db, selects, sorted_by_index=True)
@@ -0,0 +1,166 @@
+"""
+Unit tests for read-replica routing.
+"""
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from starlette.requests import Request
+
+from app.db import session as db_session
+from app.db.base import Base
+from app.db.routing import ReplicaSet, RoutingSession
+from app.core.cache import TTLCache
+from app.models.user import User, UserRole
+
+
+def _sqlite_engine(url):
+    return create_engine(url, connect_args={"check_same_thread": False})
+
+
+def _add_user(engine, email):
+    session = sessionmaker(bind=engine)()
+    session.add(User(email=email, hashed_password="x", role=UserRole.REGULAR, is_active=True))
+    session.commit()
+    session.close()
+
+
+def _request(method: str, token: str = "token") -> Request:
+    return Request({
+        "type": "http",
+        "method": method,
+        "headers": [(b"authorization", f"Bearer {token}".encode())],
+        "client": ("127.0.0.1", 1234),
+    })
+
+
+@pytest.fixture
+def primary_and_replica(tmp_path):
+    """Two SQLite files standing in for a primary and its replica."""
+    primary = _sqlite_engine(f"sqlite:///{tmp_path / 'primary.db'}")
+    replica_path = tmp_path / "replica.db"
+    replica = _sqlite_engine(f"sqlite:///{replica_path}")
+    for engine in (primary, replica):
+        Base.metadata.create_all(bind=engine)
+    
+    # Distinct rows make it visible which database answered
+    _add_user(primary, "primary@example.com")
+    _add_user(replica, "replica@example.com")
+    
+    replicas = ReplicaSet([f"sqlite:///{replica_path}"], engine_factory=_sqlite_engine)
+    replicas.check()
+    factory = sessionmaker(class_=RoutingSession, bind=primary, replicas=replicas)
+    yield factory, replicas
+    primary.dispose()
+    replica.dispose()
+
+
+def _emails(session):
+    return {user.email for user in session.query(User).all()}
+
+
+class TestRoutingSession:
+    """Tests for routing reads between primary and replicas."""
+    
+    def test_reads_use_replica_when_enabled(self, primary_and_replica):
+        """Test that read-only sessions are served by the replica."""
+        factory, replicas = primary_and_replica
+        session = factory()
+        session.use_replicas = True
+        
+        assert _emails(session) == {"replica@example.com"}
+        assert replicas.stats()[0]["reads"] == 1
+        session.close()
+    
+    def test_reads_use_primary_by_default(self, primary_and_replica):
+        """Test that sessions without the flag stay on the primary."""
+        factory, _ = primary_and_replica
+        session = factory()
+        
+        assert _emails(session) == {"primary@example.com"}
+        session.close()
+    
+    def test_session_reads_its_own_writes(self, primary_and_replica):
+        """Test that reads after a write go to the primary."""
+        factory, _ = primary_and_replica
+        session = factory()
+        session.use_replicas = True
+        
+        session.add(User(email="new@example.com", hashed_password="x", role=UserRole.REGULAR))
+        session.commit()
+        
+        assert _emails(session) == {"primary@example.com", "new@example.com"}
+        session.close()
+    
+    def test_unhealthy_replica_falls_back_to_primary(self, tmp_path):
+        """Test that a replica failing its health check is skipped."""
+        primary = _sqlite_engine(f"sqlite:///{tmp_path / 'primary.db'}")
+        Base.metadata.create_all(bind=primary)
+        _add_user(primary, "primary@example.com")
+        missing = tmp_path / "missing" / "replica.db"
+        replicas = ReplicaSet([f"sqlite:///{missing}"], engine_factory=_sqlite_engine)
+        replicas.check()
+        session = sessionmaker(class_=RoutingSession, bind=primary, replicas=replicas)()
+        session.use_replicas = True
+        
+        assert _emails(session) == {"primary@example.com"}
+        assert replicas.stats()[0]["healthy"] is False
+        session.close()
+    
+    def test_unchecked_replica_is_not_used(self, tmp_path):
+        """Test that choosing a replica never runs a health check on the request."""
+        replica_path = tmp_path / "replica.db"
+        replicas = ReplicaSet([f"sqlite:///{replica_path}"], engine_factory=_sqlite_engine)
+        
+        assert replicas.choose() is None
+        assert not replica_path.exists()
+        
+        replicas.check()
+        assert replicas.choose() is replicas.engines[0]
+    
+    def test_failing_replica_falls_back_to_primary(self, primary_and_replica):
+        """Test that a replica failing mid-request is marked down and the read retried on the primary."""
+        factory, replicas = primary_and_replica
+        session = factory()
+        session.use_replicas = True
+        assert _emails(session) == {"replica@example.com"}
+        
+        # The replica loses its schema: the next read fails with OperationalError
+        replica = replicas.engines[0]
+        with replica.begin() as connection:
+            connection.exec_driver_sql("DROP TABLE users")
+        session.expunge_all()
+        
+        assert _emails(session) == {"primary@example.com"}
+        assert replicas.stats()[0]["healthy"] is False
+        assert replicas.choose() is None
+        session.close()
+
+
+class TestStickyPrimary:
+    """Tests for the sticky-primary window in get_db."""
+    
+    def test_client_reads_primary_after_write(self, primary_and_replica, monkeypatch):
+        """Test that a client's GETs go to the primary right after it wrote."""
+        factory, replicas = primary_and_replica
+        monkeypatch.setattr(db_session, "SessionLocal", factory)
+        monkeypatch.setattr(db_session, "replicas", replicas)
+        monkeypatch.setattr(db_session, "recent_writers", TTLCache(max_size=10, ttl_seconds=60))
+        
+        reads = db_session.get_db(_request("GET"))
+        assert _emails(next(reads)) == {"replica@example.com"}
+        reads.close()
+        
+        writes = db_session.get_db(_request("POST"))
+        db = next(writes)
+        db.add(User(email="new@example.com", hashed_password="x", role=UserRole.REGULAR))
+        db.commit()
+        writes.close()
+        
+        reads = db_session.get_db(_request("GET"))
+        assert "new@example.com" in _emails(next(reads))
+        reads.close()
+        
+        # Other clients keep reading from the replica
+        reads = db_session.get_db(_request("GET", token="other"))
+        assert _emails(next(reads)) == {"replica@example.com"}
+        reads.close()
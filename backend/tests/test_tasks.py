@@ -1,13 +1,30 @@
 """
 Unit tests for task management endpoints.
 """
+import csv
+import io
+import json
+import os
 import pytest
+import threading
+import time
 from datetime import datetime, timedelta, timezone
+import redis
 from fastapi.testclient import TestClient
+from sqlalchemy import String, cast, event, insert, literal, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import InvalidRequestError
 from sqlalchemy.orm import Session
 
-from app.models.task import Task, TaskPriority
+from app.config import settings
+from app.core.response_cache import CachedResponse, FakeRedis, ResponseCache, response_cache
+from app.crud import task as crud_task
+from app.models.comment import Comment
+from app.models.task import Task, TaskDeletion, TaskPriority
 from app.models.user import User
+from app.schemas.task import TASK_BULK_MAX_ITEMS, TaskCreate, TaskFilter, TaskOut, TaskUpdate
+from app.utils.export import ndjson_chunks
+from tests.conftest import engine as test_engine
 
 
 @pytest.fixture
@@ -89,6 +106,26 @@ def multiple_tasks(db: Session, test_user: User, test_admin: User):
     return tasks
 
 
+@pytest.fixture
+def no_response_cache(monkeypatch):
+    """Disable the response cache for a test."""
+    monkeypatch.setattr(response_cache, "ttl_seconds", 0)
+
+
+@pytest.fixture
+def task_statements():
+    """Record the statements that read or write tasks."""
+    statements = []
+    
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if "tasks" in statement:
+            statements.append(statement)
+    
+    event.listen(test_engine, "before_cursor_execute", record)
+    yield statements
+    event.remove(test_engine, "before_cursor_execute", record)
+
+
 class TestCreateTask:
     """Tests for creating new tasks."""
     
@@ -206,6 +243,190 @@ class TestCreateTask:
         assert response.status_code == 422
 
 
+class TestBulkCreateTasks:
+    """Tests for POST /tasks/bulk."""
+    
+    def test_bulk_create(self, client: TestClient, auth_headers: dict, test_user: User, task_statements):
+        """Test that all tasks are created with one INSERT, in request order."""
+        payload = {"tasks": [
+            {"title": f"Imported {i}", "priority": "high" if i % 2 else "low", "assigned_to": 999}
+            for i in range(25)
+        ]}
+        
+        response = client.post("/api/v1/tasks/bulk", json=payload, headers=auth_headers)
+        
+        assert response.status_code == 201
+        data = response.json()
+        assert data["created"] == 25
+        assert [task["title"] for task in data["tasks"]] == [f"Imported {i}" for i in range(25)]
+        assert data["tasks"][1]["priority"] == "high"
+        assert {task["assigned_to"] for task in data["tasks"]} == {test_user.id}
+        assert {task["created_by"] for task in data["tasks"]} == {test_user.id}
+        assert len({task["id"] for task in data["tasks"]}) == 25
+        assert len([statement for statement in task_statements if statement.startswith("INSERT")]) == 1
+        assert not any(statement.startswith("SELECT") for statement in task_statements)
+    
+    def test_bulk_create_reports_item_errors(self, client: TestClient, auth_headers: dict, db: Session):
+        """Test that invalid items are reported by index and nothing is created."""
+        payload = {"tasks": [
+            {"title": "Fine"},
+            {"title": ""},
+            {"description": "No title"},
+            {"title": "Bad priority", "priority": "urgent"},
+        ]}
+        
+        response = client.post("/api/v1/tasks/bulk", json=payload, headers=auth_headers)
+        
+        assert response.status_code == 422
+        locations = {tuple(error["loc"][:3]) for error in response.json()["detail"]}
+        assert locations == {("body", "tasks", 1), ("body", "tasks", 2), ("body", "tasks", 3)}
+        assert db.query(Task).count() == 0
+    
+    def test_bulk_create_limits(self, client: TestClient, auth_headers: dict):
+        """Test that empty and oversized batches are rejected."""
+        empty = client.post("/api/v1/tasks/bulk", json={"tasks": []}, headers=auth_headers)
+        oversized = client.post(
+            "/api/v1/tasks/bulk",
+            json={"tasks": [{"title": "Task"}] * (TASK_BULK_MAX_ITEMS + 1)},
+            headers=auth_headers
+        )
+        
+        assert empty.status_code == 422
+        assert oversized.status_code == 422
+    
+    def test_bulk_create_refreshes_list(self, client: TestClient, auth_headers: dict, multiple_tasks):
+        """Test that bulk-created tasks show up in a cached task list."""
+        client.get("/api/v1/tasks/", headers=auth_headers)
+        client.post("/api/v1/tasks/bulk", json={"tasks": [{"title": "A"}, {"title": "B"}]}, headers=auth_headers)
+        
+        response = client.get("/api/v1/tasks/", headers=auth_headers)
+        
+        assert response.json()["total"] == 5
+
+
+class TestBulkUpdateDeleteTasks:
+    """Tests for PATCH and DELETE /tasks/bulk."""
+    
+    def test_bulk_update_by_ids(
+        self, client: TestClient, db: Session, auth_headers: dict, multiple_tasks, task_statements
+    ):
+        """Test that owned tasks are updated with one UPDATE and others are skipped."""
+        ids = [multiple_tasks[0].id, multiple_tasks[2].id, multiple_tasks[3].id, 999]
+        
+        response = client.patch(
+            "/api/v1/tasks/bulk", json={"ids": ids, "update": {"completed": True}}, headers=auth_headers
+        )
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["affected"] == 2
+        assert [statement.split()[0] for statement in task_statements] == ["UPDATE"]
+        assert sorted(data["ids"]) == ids[:2]
+        assert data["skipped"] == ids[2:]
+        db.expire_all()
+        assert db.get(Task, ids[2]).completed is False
+        assert db.query(Task).filter(Task.completed.is_(True)).count() == 3
+    
+    def test_bulk_update_by_filter(self, client: TestClient, db: Session, auth_headers: dict, multiple_tasks):
+        """Test that a filter selects only the caller's matching tasks."""
+        admin_priority = multiple_tasks[3].priority
+        response = client.patch(
+            "/api/v1/tasks/bulk",
+            json={"filter": {"completed": False}, "update": {"priority": "low"}},
+            headers=auth_headers
+        )
+        
+        assert response.json()["affected"] == 2
+        assert response.json()["skipped"] == []
+        db.expire_all()
+        assert db.get(Task, multiple_tasks[3].id).priority == admin_priority
+        assert {task.priority for task in db.query(Task).filter(Task.id.in_(response.json()["ids"]))} == {
+            TaskPriority.LOW
+        }
+    
+    def test_bulk_update_filter_cannot_widen_ownership(
+        self, client: TestClient, auth_headers: dict, test_admin: User, multiple_tasks
+    ):
+        """Test that filtering by another assignee matches nothing."""
+        response = client.patch(
+            "/api/v1/tasks/bulk",
+            json={"filter": {"assigned_to": test_admin.id}, "update": {"completed": True}},
+            headers=auth_headers
+        )
+        
+        assert response.json()["affected"] == 0
+    
+    def test_bulk_update_validation(self, client: TestClient, auth_headers: dict):
+        """Test that the selection and the update are validated."""
+        both = {"ids": [1], "filter": {}, "update": {"completed": True}}
+        neither = {"update": {"completed": True}}
+        empty_update = {"ids": [1], "update": {}}
+        
+        for payload in (both, neither, empty_update):
+            assert client.patch("/api/v1/tasks/bulk", json=payload, headers=auth_headers).status_code == 422
+    
+    def test_bulk_reassign_leaves_tombstones(
+        self, client: TestClient, auth_headers: dict, test_admin: User, multiple_tasks, no_sync_overlap
+    ):
+        """Test that tasks reassigned in bulk leave the caller's delta sync."""
+        token = client.get("/api/v1/tasks/changes", headers=auth_headers).json()["sync_token"]
+        client.patch(
+            "/api/v1/tasks/bulk",
+            json={"ids": [multiple_tasks[0].id], "update": {"assigned_to": test_admin.id}},
+            headers=auth_headers
+        )
+        
+        data = client.get(f"/api/v1/tasks/changes?since={token}", headers=auth_headers).json()
+        
+        assert data["deleted"] == [multiple_tasks[0].id]
+    
+    def test_bulk_delete_by_filter(
+        self, client: TestClient, db: Session, auth_headers: dict, test_user: User, multiple_tasks, task_statements
+    ):
+        """Test that a finished set is deleted in one statement, its comments by the database."""
+        completed_id = multiple_tasks[1].id
+        db.add(Comment(content="Done", task_id=completed_id, user_id=test_user.id))
+        db.commit()
+        task_statements.clear()
+        
+        response = client.request(
+            "DELETE", "/api/v1/tasks/bulk", json={"filter": {"completed": True}}, headers=auth_headers
+        )
+        
+        assert response.status_code == 200
+        assert response.json()["ids"] == [completed_id]
+        assert [statement.split()[0] for statement in task_statements] == ["DELETE"]
+        assert db.query(Comment).count() == 0
+        assert db.query(Task).count() == 3
+    
+    def test_bulk_delete_by_ids(
+        self, client: TestClient, db: Session, auth_headers: dict, multiple_tasks, no_sync_overlap
+    ):
+        """Test that only owned tasks are deleted, and deletions reach delta syncs."""
+        token = client.get("/api/v1/tasks/changes", headers=auth_headers).json()["sync_token"]
+        own_id, other_id = multiple_tasks[0].id, multiple_tasks[3].id
+        
+        response = client.request(
+            "DELETE", "/api/v1/tasks/bulk", json={"ids": [own_id, other_id]}, headers=auth_headers
+        )
+        
+        assert response.json() == {"affected": 1, "ids": [own_id], "skipped": [other_id]}
+        assert db.query(Task).count() == 3
+        changes = client.get(f"/api/v1/tasks/changes?since={token}", headers=auth_headers).json()
+        assert changes["deleted"] == [own_id]
+    
+    def test_bulk_writes_refresh_cached_list(self, client: TestClient, auth_headers: dict, multiple_tasks):
+        """Test that bulk writes invalidate cached lists."""
+        client.get("/api/v1/tasks/?completed=true", headers=auth_headers)
+        client.patch("/api/v1/tasks/bulk", json={"filter": {}, "update": {"completed": True}}, headers=auth_headers)
+        
+        assert client.get("/api/v1/tasks/?completed=true", headers=auth_headers).json()["total"] == 3
+        
+        client.request("DELETE", "/api/v1/tasks/bulk", json={"filter": {}}, headers=auth_headers)
+        
+        assert client.get("/api/v1/tasks/?completed=true", headers=auth_headers).json()["total"] == 0
+
+
 class TestRetrieveTasks:
     """Tests for retrieving tasks with filters and pagination."""
     
@@ -350,7 +571,23 @@ class TestRetrieveTasks:
         
         assert response.status_code == 200
         data = response.json()
-        assert len(data["items"]) > 0
+        assert [item["priority"] for item in data["items"]] == ["low", "medium", "high"]
+    
+    def test_get_tasks_sort_by_priority_desc_is_severity_order(self, client: TestClient, auth_headers: dict, multiple_tasks):
+        """Test that priority sorts by severity (high > medium > low), not by name."""
+        response = client.get(
+            "/api/v1/tasks/?sort_by=priority&sort_order=desc",
+            headers=auth_headers
+        )
+        
+        assert [item["priority"] for item in response.json()["items"]] == ["high", "medium", "low"]
+    
+    @pytest.mark.parametrize("sort_by", ["description", "creator", "assignee", "__class__", "priority_rank"])
+    def test_get_tasks_unsupported_sort_field(self, client: TestClient, auth_headers: dict, sort_by: str):
+        """Test that fields outside the sortable whitelist are rejected."""
+        response = client.get(f"/api/v1/tasks/?sort_by={sort_by}", headers=auth_headers)
+        
+        assert response.status_code == 422
     
     def test_get_tasks_combined_filters(self, client: TestClient, auth_headers: dict, multiple_tasks):
         """Test combining multiple filters."""
@@ -524,6 +761,876 @@ class TestUpdateTask:
         )
         
         assert response.status_code == 401
+    
+    def test_update_task_single_statement(self, client: TestClient, auth_headers: dict, sample_task: Task, task_statements):
+        """Test that an update is one UPDATE ... RETURNING, with no reads."""
+        response = client.put(f"/api/v1/tasks/{sample_task.id}", json={"completed": True}, headers=auth_headers)
+        
+        assert response.status_code == 200
+        assert response.json()["completed"] is True
+        assert [statement.split()[0] for statement in task_statements] == ["UPDATE"]
+        assert "RETURNING" in task_statements[0]
+    
+    def test_update_task_reassign_logs_previous_assignee(
+        self, client: TestClient, db: Session, auth_headers: dict, sample_task: Task, test_user: User, test_admin: User
+    ):
+        """Test that a reassignment tombstones the task for the previous assignee."""
+        task_id = sample_task.id
+        response = client.put(f"/api/v1/tasks/{task_id}", json={"assigned_to": test_admin.id}, headers=auth_headers)
+        
+        assert response.json()["assigned_to"] == test_admin.id
+        tombstones = db.query(TaskDeletion).filter(TaskDeletion.task_id == task_id).all()
+        assert [tombstone.assigned_to for tombstone in tombstones] == [test_user.id]
+
+
+class TestTaskSuggest:
+    """Tests for the title typeahead endpoint."""
+    
+    @pytest.fixture
+    def titled_tasks(self, db: Session, test_user: User, test_admin: User):
+        """Create tasks with overlapping titles."""
+        titles = ["Quarterly report", "Report bug", "Reporting dashboard", "100% coverage"]
+        tasks = [
+            Task(title=title, created_by=test_user.id, assigned_to=test_user.id)
+            for title in titles
+        ]
+        tasks.append(Task(title="Report for admins", created_by=test_admin.id, assigned_to=test_admin.id))
+        db.add_all(tasks)
+        db.commit()
+        return {task.title: task for task in tasks}
+    
+    def test_suggest_ranks_prefix_matches_first(self, client: TestClient, auth_headers: dict, titled_tasks):
+        """Test that titles starting with the input come before other matches."""
+        response = client.get("/api/v1/tasks/suggest?q=rep", headers=auth_headers)
+        
+        assert response.status_code == 200
+        titles = [item["title"] for item in response.json()]
+        assert titles == ["Report bug", "Reporting dashboard", "Quarterly report"]
+        assert set(response.json()[0]) == {"id", "title"}
+    
+    def test_suggest_limit(self, client: TestClient, auth_headers: dict, titled_tasks):
+        """Test that the number of suggestions is capped."""
+        response = client.get("/api/v1/tasks/suggest?q=rep&limit=1", headers=auth_headers)
+        assert [item["title"] for item in response.json()] == ["Report bug"]
+        
+        response = client.get("/api/v1/tasks/suggest?q=rep&limit=50", headers=auth_headers)
+        assert response.status_code == 422
+    
+    def test_suggest_scoped_to_visible_tasks(self, client: TestClient, admin_auth_headers: dict, titled_tasks):
+        """Test that suggestions follow the task list visibility rules."""
+        response = client.get("/api/v1/tasks/suggest?q=report", headers=admin_auth_headers)
+        
+        titles = {item["title"] for item in response.json()}
+        assert "Report for admins" in titles
+        assert "Report bug" in titles
+    
+    def test_suggest_escapes_wildcards(self, client: TestClient, auth_headers: dict, titled_tasks):
+        """Test that LIKE wildcards in the input match literally."""
+        response = client.get("/api/v1/tasks/suggest", headers=auth_headers, params={"q": "0%"})
+        
+        assert [item["title"] for item in response.json()] == ["100% coverage"]
+    
+    def test_suggest_requires_input(self, client: TestClient, auth_headers: dict):
+        """Test that an empty input is rejected."""
+        response = client.get("/api/v1/tasks/suggest?q=", headers=auth_headers)
+        
+        assert response.status_code == 422
+    
+    def test_trigram_query_on_postgresql(self):
+        """Test that PostgreSQL suggestions use trigram similarity."""
+        clause = str(crud_task.task_suggest_clause("rep", "postgresql").compile(dialect=postgresql.dialect()))
+        order = crud_task.task_suggest_order_by("rep", "postgresql")[0]
+        
+        assert "tasks.title ILIKE" in clause
+        assert "tasks.title %%" in clause
+        assert "similarity(tasks.title" in str(order.compile(dialect=postgresql.dialect()))
+
+
+class TestTaskSearch:
+    """Tests for task search and relevance ranking."""
+    
+    @pytest.fixture
+    def searchable_tasks(self, db: Session, test_user: User):
+        """Create tasks matching "invoice" in different fields."""
+        in_title = Task(title="Send invoice", description="Monthly billing",
+                        created_by=test_user.id, assigned_to=test_user.id)
+        in_description = Task(title="Accounting", description="Attach the invoice PDF",
+                              created_by=test_user.id, assigned_to=test_user.id)
+        in_comment = Task(title="Call client", description="Follow up",
+                          created_by=test_user.id, assigned_to=test_user.id)
+        unrelated = Task(title="Water plants", created_by=test_user.id, assigned_to=test_user.id)
+        db.add_all([in_title, in_description, in_comment, unrelated])
+        db.commit()
+        db.add(Comment(content="They never received the invoice", task_id=in_comment.id, user_id=test_user.id))
+        db.commit()
+        return in_title, in_description, in_comment
+    
+    def test_search_includes_comments(self, client: TestClient, auth_headers: dict, searchable_tasks):
+        """Test that search matches title, description and comment content."""
+        response = client.get("/api/v1/tasks/?search=invoice", headers=auth_headers)
+        
+        assert response.status_code == 200
+        ids = {item["id"] for item in response.json()["items"]}
+        assert ids == {task.id for task in searchable_tasks}
+    
+    def test_sort_by_relevance(self, client: TestClient, auth_headers: dict, searchable_tasks):
+        """Test that relevance puts title matches before description and comment matches."""
+        response = client.get("/api/v1/tasks/?search=invoice&sort_by=relevance", headers=auth_headers)
+        
+        ids = [item["id"] for item in response.json()["items"]]
+        assert ids == [task.id for task in searchable_tasks]
+    
+    def test_relevance_pages_by_offset_only(self, client: TestClient, auth_headers: dict, searchable_tasks):
+        """Test that relevance-sorted pages carry no cursor and reject one."""
+        response = client.get("/api/v1/tasks/?search=invoice&sort_by=relevance&limit=1", headers=auth_headers)
+        data = response.json()
+        assert data["has_more"] is True
+        assert data["next_cursor"] is None
+        
+        cursor = client.get("/api/v1/tasks/?limit=1", headers=auth_headers).json()["next_cursor"]
+        response = client.get(
+            "/api/v1/tasks/",
+            headers=auth_headers,
+            params={"search": "invoice", "sort_by": "relevance", "cursor": cursor}
+        )
+        assert response.status_code == 400
+    
+    def test_search_query_prefixes_words(self):
+        """Test that search input becomes a prefix tsquery without operators."""
+        assert crud_task.task_search_query("urg ta") == "urg:* & ta:*"
+        assert crud_task.task_search_query("a&b | !c:*") == "a:* & b:* & c:*"
+        assert crud_task.task_search_query(" !! ") is None
+    
+    def test_full_text_clause_on_postgresql(self):
+        """Test that PostgreSQL search uses the tsvector column and its rank."""
+        clause = crud_task.task_search_clause("invoice", "postgresql")
+        rank = crud_task.task_search_rank("invoice", "postgresql")
+        
+        sql = str(clause.compile(dialect=postgresql.dialect()))
+        assert "tasks.search_vector @@ to_tsquery" in sql
+        assert "ts_rank(tasks.search_vector" in str(rank.compile(dialect=postgresql.dialect()))
+
+
+class TestSparseFieldsets:
+    """Tests for the fields= sparse fieldset parameter."""
+    
+    @pytest.fixture
+    def statements(self):
+        """Record SQL statements sent to the database."""
+        recorded = []
+        
+        def record(conn, cursor, statement, parameters, context, executemany):
+            recorded.append(statement)
+        
+        event.listen(test_engine, "before_cursor_execute", record)
+        yield recorded
+        event.remove(test_engine, "before_cursor_execute", record)
+    
+    def test_list_returns_only_requested_fields(self, client: TestClient, auth_headers: dict, multiple_tasks, statements):
+        """Test that list items carry only the requested fields."""
+        response = client.get("/api/v1/tasks/?fields=id,title", headers=auth_headers)
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 3
+        assert all(set(item) == {"id", "title"} for item in data["items"])
+        
+        task_queries = [sql for sql in statements if "FROM tasks" in sql]
+        assert len(task_queries) == 1
+        assert "tasks.description" not in task_queries[0]
+        assert "JOIN users" not in task_queries[0]
+    
+    def test_list_fields_with_cursor(self, client: TestClient, auth_headers: dict, multiple_tasks):
+        """Test that sparse pages still produce a working cursor."""
+        first = client.get("/api/v1/tasks/?fields=title&limit=2&sort_by=priority", headers=auth_headers).json()
+        second = client.get(
+            "/api/v1/tasks/",
+            headers=auth_headers,
+            params={"fields": "title", "limit": 2, "sort_by": "priority", "cursor": first["next_cursor"]}
+        ).json()
+        
+        assert [set(item) for item in first["items"] + second["items"]] == [{"title"}] * 3
+        assert second["next_cursor"] is None
+    
+    def test_unknown_field(self, client: TestClient, auth_headers: dict):
+        """Test that fields outside the response schema are rejected."""
+        response = client.get("/api/v1/tasks/?fields=id,hashed_password", headers=auth_headers)
+        
+        assert response.status_code == 400
+        assert "hashed_password" in response.json()["detail"]
+    
+    def test_empty_fields(self, client: TestClient, auth_headers: dict):
+        """Test that an empty fieldset is rejected."""
+        response = client.get("/api/v1/tasks/?fields=,", headers=auth_headers)
+        
+        assert response.status_code == 400
+    
+    def test_detail_returns_only_requested_fields(self, client: TestClient, auth_headers: dict, sample_task: Task, statements):
+        """Test that the task detail honors the fieldset."""
+        response = client.get(f"/api/v1/tasks/{sample_task.id}?fields=title,completed", headers=auth_headers)
+        
+        assert response.status_code == 200
+        assert response.json() == {"title": "Sample Task", "completed": False}
+        task_queries = [sql for sql in statements if "FROM tasks" in sql]
+        assert "tasks.description" not in task_queries[0]
+        assert "JOIN users" not in task_queries[0]
+    
+    def test_detail_fields_still_checks_ownership(self, client: TestClient, auth_headers: dict, test_admin: User, db: Session):
+        """Test that a sparse detail request is still scoped to the assignee."""
+        task = Task(title="Admin task", created_by=test_admin.id, assigned_to=test_admin.id)
+        db.add(task)
+        db.commit()
+        
+        response = client.get(f"/api/v1/tasks/{task.id}?fields=title", headers=auth_headers)
+        
+        assert response.status_code == 404
+
+
+class TestTaskLoadProfiles:
+    """Tests for the task loading profiles and the lazy-load guard."""
+    
+    def test_bare_profile_raises_on_lazy_load(self, db: Session, sample_task: Task):
+        """Test that relationships outside the profile raise instead of querying."""
+        db.expunge_all()
+        task = crud_task.get_task(db, sample_task.id)
+        
+        assert task.title == "Sample Task"
+        with pytest.raises(InvalidRequestError):
+            task.creator
+        with pytest.raises(InvalidRequestError):
+            task.comments
+    
+    def test_users_profile(self, db: Session, sample_task: Task, test_user: User):
+        """Test that the users profile joins creator and assignee."""
+        email = test_user.email
+        db.expunge_all()
+        task = crud_task.get_task(db, sample_task.id, load=crud_task.TaskLoad.USERS)
+        
+        assert task.creator.email == email
+        assert task.assignee.email == email
+    
+    def test_comment_count_profile(self, db: Session, multiple_tasks, test_user: User):
+        """Test that the comment count profile counts in the list query."""
+        db.add_all([
+            Comment(content=f"Comment {i}", task_id=multiple_tasks[0].id, user_id=test_user.id)
+            for i in range(2)
+        ])
+        db.commit()
+        db.expunge_all()
+        
+        tasks = crud_task.get_tasks(db, load=crud_task.TaskLoad.COMMENT_COUNT)
+        
+        counts = {task.title: task.comment_count for task in tasks}
+        assert counts["High Priority Task"] == 2
+        assert sum(counts.values()) == 2
+    
+    def test_task_detail_does_not_join_users(self, client: TestClient, auth_headers: dict, sample_task: Task):
+        """Test that the task detail and ownership checks read only the task row."""
+        statements = []
+        
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+        
+        event.listen(test_engine, "before_cursor_execute", record)
+        try:
+            response = client.get(f"/api/v1/tasks/{sample_task.id}", headers=auth_headers)
+        finally:
+            event.remove(test_engine, "before_cursor_execute", record)
+        
+        assert response.status_code == 200
+        task_queries = [sql for sql in statements if "FROM tasks" in sql]
+        assert len(task_queries) == 1
+        assert "JOIN users" not in task_queries[0]
+
+
+class TestConditionalGet:
+    """Tests for ETags and If-None-Match on task reads."""
+    
+    def test_list_not_modified(self, client: TestClient, auth_headers: dict, multiple_tasks):
+        """Test that revalidating an unchanged list returns 304 with no body."""
+        first = client.get("/api/v1/tasks/?limit=2", headers=auth_headers)
+        etag = first.headers["etag"]
+        
+        assert first.headers["cache-control"] == "private, no-cache"
+        response = client.get("/api/v1/tasks/?limit=2", headers={**auth_headers, "If-None-Match": etag})
+        
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+    
+    def test_list_not_modified_skips_page_query(
+        self, client: TestClient, auth_headers: dict, multiple_tasks, no_response_cache
+    ):
+        """Test that an uncached 304 is answered from the version query alone."""
+        etag = client.get("/api/v1/tasks/", headers=auth_headers).headers["etag"]
+        statements = []
+        
+        def record(conn, cursor, statement, parameters, context, executemany):
+            if "FROM tasks" in statement:
+                statements.append(statement)
+        
+        event.listen(test_engine, "before_cursor_execute", record)
+        try:
+            response = client.get("/api/v1/tasks/", headers={**auth_headers, "If-None-Match": etag})
+        finally:
+            event.remove(test_engine, "before_cursor_execute", record)
+        
+        assert response.status_code == 304
+        assert len(statements) == 1
+        assert "LIMIT" not in statements[0]
+    
+    def test_list_etag_changes_on_update(self, client: TestClient, auth_headers: dict, multiple_tasks):
+        """Test that updating a task in the set invalidates the ETag."""
+        etag = client.get("/api/v1/tasks/", headers=auth_headers).headers["etag"]
+        client.put(f"/api/v1/tasks/{multiple_tasks[0].id}", json={"completed": True}, headers=auth_headers)
+        
+        response = client.get("/api/v1/tasks/", headers={**auth_headers, "If-None-Match": etag})
+        
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+    
+    def test_list_etag_changes_on_delete(self, client: TestClient, auth_headers: dict, multiple_tasks):
+        """Test that deleting a task in the set invalidates the ETag."""
+        etag = client.get("/api/v1/tasks/", headers=auth_headers).headers["etag"]
+        client.delete(f"/api/v1/tasks/{multiple_tasks[0].id}", headers=auth_headers)
+        
+        response = client.get("/api/v1/tasks/", headers={**auth_headers, "If-None-Match": etag})
+        
+        assert response.status_code == 200
+        assert response.json()["total"] == 2
+    
+    def test_list_etag_depends_on_query(self, client: TestClient, auth_headers: dict, multiple_tasks):
+        """Test that different pages of the same set have different ETags."""
+        first = client.get("/api/v1/tasks/?limit=1", headers=auth_headers).headers["etag"]
+        second = client.get("/api/v1/tasks/?limit=1&skip=1", headers=auth_headers).headers["etag"]
+        sparse = client.get("/api/v1/tasks/?limit=1&fields=id", headers=auth_headers)
+        
+        assert len({first, second, sparse.headers["etag"]}) == 3
+    
+    def test_search_has_no_etag(self, client: TestClient, auth_headers: dict, multiple_tasks):
+        """Test that searches, which also match comments, are not cached."""
+        response = client.get("/api/v1/tasks/?search=task", headers=auth_headers)
+        
+        assert response.status_code == 200
+        assert "etag" not in response.headers
+    
+    def test_detail_not_modified(self, client: TestClient, auth_headers: dict, sample_task: Task):
+        """Test conditional GETs of a single task, full and sparse."""
+        for url in (f"/api/v1/tasks/{sample_task.id}", f"/api/v1/tasks/{sample_task.id}?fields=title"):
+            etag = client.get(url, headers=auth_headers).headers["etag"]
+            
+            response = client.get(url, headers={**auth_headers, "If-None-Match": f'W/{etag}, "other"'})
+            
+            assert response.status_code == 304
+        
+        client.put(f"/api/v1/tasks/{sample_task.id}", json={"title": "Renamed"}, headers=auth_headers)
+        response = client.get(url, headers={**auth_headers, "If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.json() == {"title": "Renamed"}
+    
+    def test_statistics_not_modified(self, client: TestClient, auth_headers: dict, multiple_tasks):
+        """Test that statistics revalidate until a task is added."""
+        etag = client.get("/api/v1/tasks/statistics", headers=auth_headers).headers["etag"]
+        
+        response = client.get("/api/v1/tasks/statistics", headers={**auth_headers, "If-None-Match": etag})
+        assert response.status_code == 304
+        
+        client.post("/api/v1/tasks/", json={"title": "New task"}, headers=auth_headers)
+        response = client.get("/api/v1/tasks/statistics", headers={**auth_headers, "If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.json()["total_tasks"] == 4
+
+
+class TestResponseCache:
+    """Tests for the shared task list and statistics response cache."""
+    
+    def test_list_served_from_cache(self, client: TestClient, auth_headers: dict, multiple_tasks, task_statements):
+        """Test that repeating a list request runs no task queries."""
+        first = client.get("/api/v1/tasks/?completed=false", headers=auth_headers)
+        task_statements.clear()
+        
+        second = client.get("/api/v1/tasks/?completed=false", headers=auth_headers)
+        
+        assert second.status_code == 200
+        assert second.json() == first.json()
+        assert second.headers["etag"] == first.headers["etag"]
+        assert task_statements == []
+        assert response_cache.stats()["hits"] == 1
+    
+    def test_not_modified_from_cache(self, client: TestClient, auth_headers: dict, multiple_tasks, task_statements):
+        """Test that a cached entry answers revalidations with 304."""
+        etag = client.get("/api/v1/tasks/", headers=auth_headers).headers["etag"]
+        task_statements.clear()
+        
+        response = client.get("/api/v1/tasks/", headers={**auth_headers, "If-None-Match": etag})
+        
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+        assert task_statements == []
+    
+    def test_sparse_list_cached(self, client: TestClient, auth_headers: dict, multiple_tasks):
+        """Test that sparse pages are cached apart from full ones."""
+        full = client.get("/api/v1/tasks/", headers=auth_headers).json()
+        sparse = client.get("/api/v1/tasks/?fields=id,title", headers=auth_headers).json()
+        cached = client.get("/api/v1/tasks/?fields=title,id", headers=auth_headers).json()
+        
+        assert set(full["items"][0]) > {"id", "title"}
+        assert set(sparse["items"][0]) == {"id", "title"}
+        assert cached == sparse
+    
+    def test_query_parameters_normalized(self, client: TestClient, auth_headers: dict, multiple_tasks):
+        """Test that parameter order does not split cache entries."""
+        client.get("/api/v1/tasks/?completed=false&limit=5", headers=auth_headers)
+        client.get("/api/v1/tasks/?limit=5&completed=false", headers=auth_headers)
+        
+        assert response_cache.stats()["hits"] == 1
+    
+    def test_keyed_by_user(
+        self, client: TestClient, auth_headers: dict, admin_auth_headers: dict, multiple_tasks
+    ):
+        """Test that users with the same query get their own responses."""
+        user_total = client.get("/api/v1/tasks/", headers=auth_headers).json()["total"]
+        admin_total = client.get("/api/v1/tasks/", headers=admin_auth_headers).json()["total"]
+        
+        assert user_total == 3
+        assert admin_total == 4
+        assert response_cache.stats()["hits"] == 0
+    
+    def test_create_invalidates_list(self, client: TestClient, auth_headers: dict, multiple_tasks):
+        """Test that creating a task refreshes the creator's cached list."""
+        client.get("/api/v1/tasks/", headers=auth_headers)
+        client.post("/api/v1/tasks/", json={"title": "Fresh"}, headers=auth_headers)
+        
+        response = client.get("/api/v1/tasks/", headers=auth_headers)
+        
+        assert response.json()["total"] == 4
+        assert response.json()["items"][0]["title"] == "Fresh"
+    
+    def test_update_invalidates_list_and_statistics(self, client: TestClient, auth_headers: dict, multiple_tasks):
+        """Test that updating a task refreshes cached lists and statistics."""
+        client.get("/api/v1/tasks/?completed=true", headers=auth_headers)
+        client.get("/api/v1/tasks/statistics", headers=auth_headers)
+        client.put(f"/api/v1/tasks/{multiple_tasks[0].id}", json={"completed": True}, headers=auth_headers)
+        
+        completed = client.get("/api/v1/tasks/?completed=true", headers=auth_headers).json()
+        stats = client.get("/api/v1/tasks/statistics", headers=auth_headers).json()
+        
+        assert completed["total"] == 2
+        assert stats["completed_tasks"] == 2
+    
+    def test_reassign_invalidates_previous_assignee(
+        self, client: TestClient, db: Session, auth_headers: dict, test_admin: User, multiple_tasks
+    ):
+        """Test that moving a task away refreshes the old assignee's list."""
+        client.get("/api/v1/tasks/", headers=auth_headers)
+        crud_task.update_task(db, multiple_tasks[0].id, TaskUpdate(assigned_to=test_admin.id))
+        
+        response = client.get("/api/v1/tasks/", headers=auth_headers)
+        
+        assert response.json()["total"] == 2
+    
+    def test_delete_invalidates_admin_list(
+        self, client: TestClient, db: Session, admin_auth_headers: dict, test_user: User, multiple_tasks
+    ):
+        """Test that any write refreshes the unfiltered admin list."""
+        client.get("/api/v1/tasks/", headers=admin_auth_headers)
+        crud_task.delete_task(db, multiple_tasks[0].id)
+        
+        response = client.get("/api/v1/tasks/", headers=admin_auth_headers)
+        
+        assert response.json()["total"] == 3
+    
+    def test_other_users_writes_keep_entry(
+        self, client: TestClient, db: Session, auth_headers: dict, test_admin: User, multiple_tasks
+    ):
+        """Test that tasks of other users do not invalidate a user's list."""
+        client.get("/api/v1/tasks/", headers=auth_headers)
+        crud_task.create_task(db, TaskCreate(title="Elsewhere", assigned_to=test_admin.id), creator_id=test_admin.id)
+        
+        client.get("/api/v1/tasks/", headers=auth_headers)
+        
+        assert response_cache.stats()["hits"] == 1
+    
+    def test_search_not_cached(self, client: TestClient, auth_headers: dict, multiple_tasks):
+        """Test that searches bypass the cache."""
+        client.get("/api/v1/tasks/?search=priority", headers=auth_headers)
+        client.get("/api/v1/tasks/?search=priority", headers=auth_headers)
+        
+        assert response_cache.stats()["hits"] == 0
+        assert response_cache.stats()["misses"] == 0
+    
+    def test_stampede_renders_once(self):
+        """Test that concurrent misses on one key run a single render."""
+        cache = ResponseCache(FakeRedis(), ttl_seconds=30, lock_seconds=2)
+        renders = []
+        
+        def render() -> CachedResponse:
+            renders.append(1)
+            time.sleep(0.2)
+            return CachedResponse(etag='"v1"', body=b"{}")
+        
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(cache.fetch("response:tasks:k", render)))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert len(renders) == 1
+        assert [result.etag for result in results] == ['"v1"'] * 8
+        assert cache.stats()["waits"] == 7
+    
+    def test_redis_errors_fail_open(self):
+        """Test that an unreachable Redis only bypasses the cache."""
+        class BrokenRedis:
+            def __getattr__(self, name):
+                def fail(*args, **kwargs):
+                    raise redis.ConnectionError("unreachable")
+                return fail
+        
+        cache = ResponseCache(BrokenRedis(), ttl_seconds=30, lock_seconds=2)
+        entry = cache.fetch("response:tasks:k", lambda: CachedResponse(etag=None, body=b"[]"))
+        cache.invalidate([1])
+        
+        assert entry.body == b"[]"
+        assert cache.stats()["errors"] == 5
+    
+    def test_fake_redis_expiry(self):
+        """Test that the fake client honors NX and expiry."""
+        now = [0.0]
+        client = FakeRedis(clock=lambda: now[0])
+        
+        assert client.set("lock", b"1", px=1000, nx=True)
+        assert client.set("lock", b"1", px=1000, nx=True) is None
+        now[0] = 1.5
+        assert client.get("lock") is None
+        assert client.incr("gen") == 1
+        assert client.mget(["gen", "missing"]) == [b"1", None]
+
+
+@pytest.fixture
+def no_sync_overlap(monkeypatch):
+    """Issue sync tokens right at the clock instead of trailing it."""
+    monkeypatch.setattr(settings, "task_sync_overlap_seconds", 0)
+
+
+class TestTaskChanges:
+    """Tests for delta syncs (GET /tasks/changes)."""
+    
+    def test_initial_sync(self, client: TestClient, auth_headers: dict, multiple_tasks):
+        """Test that a sync without a token returns all visible tasks."""
+        response = client.get("/api/v1/tasks/changes", headers=auth_headers)
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data["changed"]) == 3
+        assert data["deleted"] == []
+        assert data["has_more"] is False
+        assert data["sync_token"]
+    
+    def test_no_changes(self, client: TestClient, auth_headers: dict, multiple_tasks, no_sync_overlap):
+        """Test that a sync right after another returns nothing."""
+        token = client.get("/api/v1/tasks/changes", headers=auth_headers).json()["sync_token"]
+        
+        data = client.get(f"/api/v1/tasks/changes?since={token}", headers=auth_headers).json()
+        
+        assert data["changed"] == []
+        assert data["deleted"] == []
+    
+    def test_only_changed_tasks(self, client: TestClient, auth_headers: dict, multiple_tasks, no_sync_overlap):
+        """Test that only created and updated tasks are returned."""
+        token = client.get("/api/v1/tasks/changes", headers=auth_headers).json()["sync_token"]
+        client.put(f"/api/v1/tasks/{multiple_tasks[1].id}", json={"completed": False}, headers=auth_headers)
+        created = client.post("/api/v1/tasks/", json={"title": "New"}, headers=auth_headers).json()
+        
+        data = client.get(f"/api/v1/tasks/changes?since={token}", headers=auth_headers).json()
+        
+        assert [task["id"] for task in data["changed"]] == [multiple_tasks[1].id, created["id"]]
+        assert data["changed"][0]["completed"] is False
+    
+    def test_deleted_tasks_are_tombstones(
+        self, client: TestClient, auth_headers: dict, multiple_tasks, no_sync_overlap
+    ):
+        """Test that deleted tasks come back as ids."""
+        token = client.get("/api/v1/tasks/changes", headers=auth_headers).json()["sync_token"]
+        client.delete(f"/api/v1/tasks/{multiple_tasks[0].id}", headers=auth_headers)
+        
+        data = client.get(f"/api/v1/tasks/changes?since={token}", headers=auth_headers).json()
+        
+        assert data["changed"] == []
+        assert data["deleted"] == [multiple_tasks[0].id]
+    
+    def test_reassigned_task_is_tombstone(
+        self, client: TestClient, db: Session, auth_headers: dict, admin_auth_headers: dict,
+        test_admin: User, multiple_tasks, no_sync_overlap
+    ):
+        """Test that a task moved to another user leaves the old assignee's sync."""
+        token = client.get("/api/v1/tasks/changes", headers=auth_headers).json()["sync_token"]
+        admin_token = client.get("/api/v1/tasks/changes", headers=admin_auth_headers).json()["sync_token"]
+        crud_task.update_task(db, multiple_tasks[0].id, TaskUpdate(assigned_to=test_admin.id))
+        
+        data = client.get(f"/api/v1/tasks/changes?since={token}", headers=auth_headers).json()
+        admin_data = client.get(f"/api/v1/tasks/changes?since={admin_token}", headers=admin_auth_headers).json()
+        
+        assert data["deleted"] == [multiple_tasks[0].id]
+        # Still visible to the admin: a change, not a deletion
+        assert [task["id"] for task in admin_data["changed"]] == [multiple_tasks[0].id]
+        assert admin_data["deleted"] == []
+    
+    def test_paged_sync(self, client: TestClient, auth_headers: dict, multiple_tasks, no_sync_overlap):
+        """Test that a large delta is returned in pages, deletions last."""
+        token = client.get("/api/v1/tasks/changes", headers=auth_headers).json()["sync_token"]
+        client.delete(f"/api/v1/tasks/{multiple_tasks[0].id}", headers=auth_headers)
+        for i in range(3):
+            client.post("/api/v1/tasks/", json={"title": f"Batch {i}"}, headers=auth_headers)
+        
+        first = client.get(f"/api/v1/tasks/changes?since={token}&limit=2", headers=auth_headers).json()
+        second = client.get(
+            f"/api/v1/tasks/changes?since={first['sync_token']}&limit=2", headers=auth_headers
+        ).json()
+        
+        assert first["has_more"] is True
+        assert first["deleted"] == []
+        assert [task["title"] for task in first["changed"] + second["changed"]] == ["Batch 0", "Batch 1", "Batch 2"]
+        assert second["has_more"] is False
+        assert second["deleted"] == [multiple_tasks[0].id]
+    
+    def test_overlap_redelivers_recent_changes(self, client: TestClient, auth_headers: dict, multiple_tasks):
+        """Test that tokens trail the clock, so recent changes are sent again."""
+        token = client.get("/api/v1/tasks/changes", headers=auth_headers).json()["sync_token"]
+        
+        data = client.get(f"/api/v1/tasks/changes?since={token}", headers=auth_headers).json()
+        
+        assert len(data["changed"]) == 3
+    
+    def test_invalid_token(self, client: TestClient, auth_headers: dict):
+        """Test that a malformed or foreign token is rejected."""
+        cursor = crud_task.encode_task_cursor(Task(id=1, created_at=datetime.now()), "created_at", "desc")
+        
+        assert client.get("/api/v1/tasks/changes?since=garbage", headers=auth_headers).status_code == 400
+        assert client.get(f"/api/v1/tasks/changes?since={cursor}", headers=auth_headers).status_code == 400
+
+
+class TestTaskListTotal:
+    """Tests for returning the page and the total from one query."""
+    
+    def test_list_uses_single_query(self, client: TestClient, auth_headers: dict, multiple_tasks, task_statements):
+        """Test that a list page and its total come from one statement."""
+        response = client.get("/api/v1/tasks/?limit=2", headers=auth_headers)
+        
+        assert response.status_code == 200
+        assert response.json()["total"] == 3
+        assert len(task_statements) == 1
+    
+    def test_total_with_filters(self, client: TestClient, auth_headers: dict, multiple_tasks):
+        """Test that the total reflects filters, not the page size."""
+        response = client.get("/api/v1/tasks/?completed=false&limit=1", headers=auth_headers)
+        
+        data = response.json()
+        assert len(data["items"]) == 1
+        assert data["total"] == 2
+    
+    def test_total_past_last_page(self, client: TestClient, auth_headers: dict, multiple_tasks):
+        """Test that an empty page past the end still reports the total."""
+        response = client.get("/api/v1/tasks/?skip=50", headers=auth_headers)
+        
+        data = response.json()
+        assert data["items"] == []
+        assert data["total"] == 3
+    
+    def test_total_on_cursor_page(self, client: TestClient, auth_headers: dict, multiple_tasks, task_statements):
+        """Test that keyset pages report the full total, not the remaining rows."""
+        cursor = client.get("/api/v1/tasks/?limit=1", headers=auth_headers).json()["next_cursor"]
+        task_statements.clear()
+        
+        response = client.get("/api/v1/tasks/", headers=auth_headers, params={"limit": 1, "cursor": cursor})
+        
+        assert response.json()["total"] == 3
+        assert len(task_statements) == 1
+
+
+class TestCursorPagination:
+    """Tests for keyset (cursor) pagination of the task list."""
+    
+    @pytest.fixture
+    def many_tasks(self, db: Session, test_user: User):
+        """Create tasks with duplicate priorities and some missing due dates."""
+        now = datetime.now(timezone.utc)
+        priorities = [TaskPriority.LOW, TaskPriority.MEDIUM, TaskPriority.HIGH]
+        tasks = []
+        for i in range(11):
+            tasks.append(Task(
+                title=f"Paged Task {i}",
+                priority=priorities[i % 3],
+                completed=False,
+                created_by=test_user.id,
+                assigned_to=test_user.id,
+                due_date=None if i % 4 == 0 else now + timedelta(days=i % 5)
+            ))
+        db.add_all(tasks)
+        db.commit()
+        return tasks
+    
+    def _walk(self, client: TestClient, headers: dict, **params) -> list:
+        """Collect task ids by following next_cursor until the last page."""
+        ids = []
+        cursor = None
+        for _ in range(20):
+            query = dict(params, limit=3)
+            if cursor:
+                query["cursor"] = cursor
+            response = client.get("/api/v1/tasks/", headers=headers, params=query)
+            assert response.status_code == 200
+            data = response.json()
+            ids.extend(item["id"] for item in data["items"])
+            cursor = data["next_cursor"]
+            assert data["has_more"] == (cursor is not None)
+            if cursor is None:
+                return ids
+        pytest.fail("cursor pagination did not terminate")
+    
+    @pytest.mark.parametrize("sort_by", ["created_at", "priority", "due_date", "title"])
+    @pytest.mark.parametrize("sort_order", ["asc", "desc"])
+    def test_cursor_walk_matches_offset_order(
+        self, client: TestClient, auth_headers: dict, many_tasks, sort_by: str, sort_order: str
+    ):
+        """Test that walking by cursor returns every task once, in the offset order."""
+        params = {"sort_by": sort_by, "sort_order": sort_order}
+        expected = client.get(
+            "/api/v1/tasks/", headers=auth_headers, params=dict(params, limit=100)
+        ).json()["items"]
+        
+        ids = self._walk(client, auth_headers, **params)
+        
+        assert ids == [item["id"] for item in expected]
+        assert len(ids) == len(many_tasks)
+    
+    def test_offset_pages_include_next_cursor(self, client: TestClient, auth_headers: dict, many_tasks):
+        """Test that offset clients still work and can switch to the cursor."""
+        response = client.get("/api/v1/tasks/?skip=3&limit=3", headers=auth_headers)
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["skip"] == 3
+        assert len(data["items"]) == 3
+        assert data["has_more"] is True
+        
+        following = client.get(
+            "/api/v1/tasks/", headers=auth_headers, params={"limit": 3, "cursor": data["next_cursor"]}
+        ).json()
+        offset_following = client.get("/api/v1/tasks/?skip=6&limit=3", headers=auth_headers).json()
+        assert [t["id"] for t in following["items"]] == [t["id"] for t in offset_following["items"]]
+    
+    def test_last_page_has_no_cursor(self, client: TestClient, auth_headers: dict, many_tasks):
+        """Test that the last page reports no further pages."""
+        response = client.get("/api/v1/tasks/?skip=9&limit=3", headers=auth_headers)
+        
+        data = response.json()
+        assert len(data["items"]) == 2
+        assert data["has_more"] is False
+        assert data["next_cursor"] is None
+    
+    def test_invalid_cursor(self, client: TestClient, auth_headers: dict, many_tasks):
+        """Test that a malformed cursor is rejected."""
+        response = client.get("/api/v1/tasks/?cursor=not-a-cursor", headers=auth_headers)
+        
+        assert response.status_code == 400
+    
+    def test_cursor_for_other_sort_is_rejected(self, client: TestClient, auth_headers: dict, many_tasks):
+        """Test that a cursor cannot be replayed with different sort parameters."""
+        cursor = client.get("/api/v1/tasks/?limit=3", headers=auth_headers).json()["next_cursor"]
+        
+        response = client.get(
+            "/api/v1/tasks/",
+            headers=auth_headers,
+            params={"cursor": cursor, "sort_by": "priority"}
+        )
+        
+        assert response.status_code == 400
+
+
+def resident_memory() -> int:
+    """Return the current resident set size of this process in bytes (Linux)."""
+    with open("/proc/self/statm") as statm:
+        return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+class TestTaskExport:
+    """Tests for streaming task exports."""
+    
+    def test_export_ndjson(self, client: TestClient, auth_headers: dict, multiple_tasks):
+        """Test that the NDJSON export streams the user's tasks with all fields."""
+        response = client.get("/api/v1/tasks/export", headers=auth_headers)
+        
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert len(rows) == 3
+        assert set(rows[0]) == set(TaskOut.model_fields)
+        assert {row["priority"] for row in rows} == {"high", "low", "medium"}
+    
+    def test_export_csv_with_filters_and_fields(self, client: TestClient, auth_headers: dict, multiple_tasks):
+        """Test the CSV export with list filters and a sparse fieldset."""
+        response = client.get(
+            "/api/v1/tasks/export?format=csv&completed=false&fields=title,priority&sort_by=title&sort_order=asc",
+            headers=auth_headers
+        )
+        
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+        assert list(csv.reader(io.StringIO(response.text))) == [
+            ["title", "priority"],
+            ["Admin Task for User", "medium"],
+            ["High Priority Task", "high"],
+        ]
+    
+    def test_export_admin_sees_all(self, client: TestClient, admin_auth_headers: dict, multiple_tasks):
+        """Test that admins export every task unless filtered by assignee."""
+        response = client.get("/api/v1/tasks/export?fields=id", headers=admin_auth_headers)
+        
+        assert len(response.text.splitlines()) == 4
+    
+    def test_export_invalid_format(self, client: TestClient, auth_headers: dict):
+        """Test that unknown export formats are rejected."""
+        response = client.get("/api/v1/tasks/export?format=xml", headers=auth_headers)
+        
+        assert response.status_code == 422
+    
+    @pytest.mark.slow
+    @pytest.mark.skipif(not os.path.exists("/proc/self/statm"), reason="Needs /proc to read resident memory")
+    def test_export_million_rows_in_constant_memory(self, db: Session, test_user: User):
+        """Test that exporting 1M tasks stays under a fixed memory ceiling."""
+        rows = 1_000_000
+        seq = select(literal(1).label("i")).cte("seq", recursive=True)
+        seq = seq.union_all(select(seq.c.i + 1).where(seq.c.i < rows))
+        now = datetime.now(timezone.utc)
+        db.execute(insert(Task).from_select(
+            ["title", "priority", "completed", "created_by", "assigned_to", "created_at", "updated_at"],
+            select(
+                "Task " + cast(seq.c.i, String),
+                literal(TaskPriority.MEDIUM, Task.priority.type),
+                literal(False),
+                literal(test_user.id),
+                literal(test_user.id),
+                literal(now, Task.created_at.type),
+                literal(now, Task.updated_at.type)
+            )
+        ))
+        db.commit()
+        
+        fields = list(TaskOut.model_fields)
+        baseline = peak = resident_memory()
+        exported = 0
+        for chunk in ndjson_chunks(crud_task.stream_tasks(db, fields, filters=TaskFilter(assigned_to=test_user.id)), fields):
+            exported += chunk.count("\n")
+            peak = max(peak, resident_memory())
+        
+        assert exported == rows
+        # The export itself is over 200 MB; buffering any real part of it would show
+        assert peak - baseline < 32 * 1024 * 1024
 
 
 class TestTaskStatistics:
@@ -545,6 +1652,53 @@ class TestTaskStatistics:
         assert "overdue_tasks" in data
         assert isinstance(data["total_tasks"], int)
         assert isinstance(data["completion_rate"], (int, float))
+    
+    def test_statistics_single_query(self, db: Session, test_user: User, test_admin: User, task_statements):
+        """Test that every counter comes from one aggregate query and matches a per-counter count."""
+        now = datetime.now(timezone.utc)
+        db.add_all([
+            Task(
+                title=f"Task {i}",
+                priority=list(TaskPriority)[i % 3],
+                completed=i % 4 == 0,
+                created_by=test_admin.id if i % 2 else test_user.id,
+                assigned_to=test_user.id if i % 3 else test_admin.id,
+                due_date=now + timedelta(days=i - 6, hours=12) if i % 5 else None
+            )
+            for i in range(12)
+        ])
+        # Not in the user's scope
+        db.add(Task(title="Other", created_by=test_admin.id, assigned_to=test_admin.id))
+        db.commit()
+        tasks = [
+            task for task in db.query(Task)
+            if test_user.id in (task.created_by, task.assigned_to)
+        ]
+        task_statements.clear()
+        
+        stats = crud_task.get_task_statistics(db, user_id=test_user.id)
+        
+        assert len(task_statements) == 1
+        pending = [task for task in tasks if not task.completed]
+        assert stats == crud_task.build_task_statistics(
+            total_tasks=len(tasks),
+            completed_tasks=len(tasks) - len(pending),
+            pending_tasks=len(pending),
+            high_priority=sum(task.priority == TaskPriority.HIGH for task in tasks),
+            medium_priority=sum(task.priority == TaskPriority.MEDIUM for task in tasks),
+            low_priority=sum(task.priority == TaskPriority.LOW for task in tasks),
+            overdue_tasks=sum(
+                task.due_date is not None and task.due_date.replace(tzinfo=timezone.utc) < now for task in pending
+            )
+        )
+    
+    def test_statistics_without_tasks(self, db: Session, test_user: User):
+        """Test that an empty scope gives zero counters, not NULLs."""
+        stats = crud_task.get_task_statistics(db, user_id=test_user.id)
+        
+        assert stats["total_tasks"] == 0
+        assert stats["overdue_tasks"] == 0
+        assert stats["completion_rate"] == 0.0
 
 
 class TestDeleteTask:
@@ -587,6 +1741,25 @@ class TestDeleteTask:
         # The current logic forbids this. The test should check for a 403.
         assert response.status_code == 403
     
+    def test_delete_task_with_comments(self, client: TestClient, auth_headers: dict, sample_task: Task, test_user: User, db: Session):
+        """Test deleting a task also deletes its comments."""
+        task_id = sample_task.id
+        db.add_all([Comment(content=f"Comment {i}", task_id=task_id, user_id=test_user.id) for i in range(3)])
+        db.commit()
+        
+        response = client.delete(f"/api/v1/tasks/{task_id}", headers=auth_headers)
+        
+        assert response.status_code == 200
+        assert db.query(Comment).filter(Comment.task_id == task_id).count() == 0
+    
+    def test_delete_task_statements(self, client: TestClient, auth_headers: dict, sample_task: Task, task_statements):
+        """Test that a delete never loads the task or its comments."""
+        response = client.delete(f"/api/v1/tasks/{sample_task.id}", headers=auth_headers)
+        
+        assert response.status_code == 200
+        # The database deletes the comments; the tombstone goes to task_deletions
+        assert [statement.split()[0] for statement in task_statements] == ["DELETE"]
+    
     def test_delete_task_unauthorized(self, client: TestClient, auth_headers: dict, test_admin: User, db: Session):
         """Test user cannot delete task they don't own."""
         # Create task by admin